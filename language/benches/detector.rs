@@ -0,0 +1,196 @@
+use std::alloc::GlobalAlloc;
+use std::alloc::Layout;
+use std::alloc::System;
+use std::ffi::CStr;
+use std::hint::black_box;
+use std::iter::once;
+use std::sync::atomic::AtomicUsize;
+use std::sync::atomic::Ordering;
+use std::time::Duration;
+
+use criterion::BenchmarkId;
+use criterion::Criterion;
+use criterion::Throughput;
+use language::Detector;
+use lingua::LanguageDetectorBuilder;
+use pyo3::Py;
+use pyo3::PyAny;
+use pyo3::Python;
+use pyo3::types::PyAnyMethods;
+use pyo3::types::PyModule;
+
+const CORPUS: &str = include_str!("detector_corpus.tsv");
+const TEXT_LENGTHS: [usize; 4] = [16, 64, 256, 1024];
+const FASTTEXT_CONFIDENCE_THRESHOLDS: [f64; 3] = [0.0, 0.85, 1.1];
+const LINGUA_CONFIDENCE_THRESHOLD: f64 = 0.35;
+const ALLOCATION_ROUNDS: usize = 16;
+
+// fastText itself is only reachable through Python, so a stand-in returns `k` predictions whose confidence grows
+// with the input length like the real model's, with a redundant label first so that filtering is exercised
+const FASTTEXT_MODEL: &CStr = c"
+class FastText:
+    def predict(self, text, k, threshold, on_unicode_error):
+        confidence = min(0.99, 0.5 + len(text) / 512)
+        return [(confidence, '__label__ton_Latn'), (confidence, '__label__eng_Latn')] + [(0.0, '__label__fra_Latn')] * (k - 2)
+";
+
+static ALLOCATIONS: AtomicUsize = AtomicUsize::new(0);
+
+struct CountingAllocator;
+
+unsafe impl GlobalAlloc for CountingAllocator {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        ALLOCATIONS.fetch_add(1, Ordering::Relaxed);
+        unsafe { System.alloc(layout) }
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        unsafe { System.dealloc(ptr, layout) }
+    }
+
+    unsafe fn realloc(&self, ptr: *mut u8, layout: Layout, new_size: usize) -> *mut u8 {
+        ALLOCATIONS.fetch_add(1, Ordering::Relaxed);
+        unsafe { System.realloc(ptr, layout, new_size) }
+    }
+}
+
+#[global_allocator]
+static GLOBAL: CountingAllocator = CountingAllocator;
+
+struct Case {
+    language: &'static str,
+    length: usize,
+    text: String,
+}
+
+fn fit_length(text: &str, length: usize) -> String {
+    text.chars()
+        .chain(once(' '))
+        .cycle()
+        .take(length)
+        .collect::<String>()
+        .trim_end()
+        .to_owned()
+}
+
+fn corpus() -> Vec<Case> {
+    CORPUS
+        .lines()
+        .filter_map(|line| line.split_once('\t'))
+        .flat_map(|(language, text)| {
+            TEXT_LENGTHS.map(|length| Case {
+                language,
+                length,
+                text: fit_length(text.trim(), length),
+            })
+        })
+        .collect()
+}
+
+fn fasttext_model(py: Python) -> Py<PyAny> {
+    PyModule::from_code(py, FASTTEXT_MODEL, c"fasttext.py", c"fasttext")
+        .and_then(|module| module.getattr("FastText")?.call0())
+        .expect("the stand-in fastText model should be valid Python")
+        .unbind()
+}
+
+fn report_allocations(detector: &Detector, cases: &[Case]) {
+    Python::attach(|py| {
+        for case in cases {
+            let _ = detector.detect(py, &case.text, f64::INFINITY, LINGUA_CONFIDENCE_THRESHOLD);
+        }
+
+        eprintln!(
+            "{:<10}{:>8}{:>11}{:>14}{:>10}",
+            "language", "length", "threshold", "allocations", "fallback"
+        );
+
+        for threshold in FASTTEXT_CONFIDENCE_THRESHOLDS {
+            for case in cases {
+                let before = ALLOCATIONS.load(Ordering::Relaxed);
+                let fallbacks = (0..ALLOCATION_ROUNDS)
+                    .map(|_| {
+                        detector
+                            .detect(py, &case.text, threshold, LINGUA_CONFIDENCE_THRESHOLD)
+                            .expect("the language should be detected")
+                    })
+                    .filter(|prediction| prediction.fallback)
+                    .count();
+                let allocations = ALLOCATIONS.load(Ordering::Relaxed) - before;
+
+                eprintln!(
+                    "{:<10}{:>8}{:>11.2}{:>14.1}{:>9.0}%",
+                    case.language,
+                    case.length,
+                    threshold,
+                    allocations as f64 / ALLOCATION_ROUNDS as f64,
+                    fallbacks as f64 / ALLOCATION_ROUNDS as f64 * 100.0
+                );
+            }
+        }
+    });
+}
+
+fn bench_lingua(criterion: &mut Criterion, cases: &[Case]) {
+    let lingua_model = LanguageDetectorBuilder::from_all_languages().build();
+    let mut group = criterion.benchmark_group("lingua");
+
+    for case in cases {
+        group.throughput(Throughput::Bytes(case.text.len() as u64));
+        group.bench_with_input(
+            BenchmarkId::new(case.language, case.length),
+            &case.text,
+            |bencher, text| {
+                bencher.iter(|| lingua_model.compute_language_confidence_values(black_box(text)))
+            },
+        );
+    }
+
+    group.finish();
+}
+
+fn bench_detect(criterion: &mut Criterion, detector: &Detector, cases: &[Case]) {
+    Python::attach(|py| {
+        for threshold in FASTTEXT_CONFIDENCE_THRESHOLDS {
+            let mut group = criterion.benchmark_group(format!("detect/{threshold}"));
+
+            for case in cases {
+                group.throughput(Throughput::Bytes(case.text.len() as u64));
+                group.bench_with_input(
+                    BenchmarkId::new(case.language, case.length),
+                    &case.text,
+                    |bencher, text| {
+                        bencher.iter(|| {
+                            detector.detect(
+                                py,
+                                black_box(text),
+                                threshold,
+                                LINGUA_CONFIDENCE_THRESHOLD,
+                            )
+                        })
+                    },
+                );
+            }
+
+            group.finish();
+        }
+    });
+}
+
+fn main() {
+    Python::initialize();
+
+    let cases = corpus();
+    let detector = Python::attach(|py| Detector::new(py, fasttext_model(py)))
+        .expect("the language detector should load");
+
+    let mut criterion = Criterion::default()
+        .warm_up_time(Duration::from_millis(500))
+        .measurement_time(Duration::from_secs(2))
+        .configure_from_args();
+
+    report_allocations(&detector, &cases);
+    bench_lingua(&mut criterion, &cases);
+    bench_detect(&mut criterion, &detector, &cases);
+    criterion.final_summary();
+}
@@ -212,6 +212,8 @@ class Prediction:
     def language(self) -> Language: ...
     @property
     def confidence(self) -> float: ...
+    @property
+    def fallback(self) -> bool: ...
 
 class FastTextProtocol(Protocol):
     def predict(self, text: str, k: int, threshold: float, on_unicode_error: str) -> list[tuple[float, str]]: ...
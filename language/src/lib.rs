@@ -66,13 +66,14 @@ fn is_redundant_label(label: &Bound<'_, PyString>) -> bool {
 }
 
 #[pyclass(frozen, get_all, immutable_type)]
-struct Prediction {
-    confidence: f64,
-    language: Py<PyString>,
+pub struct Prediction {
+    pub confidence: f64,
+    pub language: Py<PyString>,
+    pub fallback: bool,
 }
 
 #[pyclass(name = "LanguageDetector", frozen, immutable_type)]
-struct Detector {
+pub struct Detector {
     fasttext_model_call: Py<PyAny>,
     lingua_model: LanguageDetector,
 }
@@ -80,7 +81,7 @@ struct Detector {
 #[pyo3::pymethods]
 impl Detector {
     #[new]
-    fn new(py: Python, fasttext_model: Py<PyAny>) -> PyResult<Self> {
+    pub fn new(py: Python, fasttext_model: Py<PyAny>) -> PyResult<Self> {
         let detector = Self {
             lingua_model: LanguageDetectorBuilder::from_all_languages().build(),
             fasttext_model_call: fasttext_model.getattr(py, "predict")?,
@@ -89,7 +90,7 @@ impl Detector {
         Ok(detector)
     }
 
-    fn detect(
+    pub fn detect(
         &self,
         py: Python,
         text: &str,
@@ -111,12 +112,13 @@ impl Detector {
             .strip_prefix("__label__")
             .ok_or_else(|| unlikely_python_error("Unknown language label!"))?;
 
-        let fasttext_prediction = Prediction {
-            confidence: fasttext_confidence,
-            language: fasttext_language.into_pyobject(py)?.into(),
-        };
-
         if fasttext_confidence >= fasttext_confidence_threshold {
+            let fasttext_prediction = Prediction {
+                confidence: fasttext_confidence,
+                language: fasttext_language.into_pyobject(py)?.into(),
+                fallback: false,
+            };
+
             return Ok(fasttext_prediction);
         }
 
@@ -127,6 +129,12 @@ impl Detector {
             .ok_or_else(|| unlikely_python_error("Failed to predict a language!"))?;
 
         if lingua_confidence <= lingua_confidence_threshold {
+            let fasttext_prediction = Prediction {
+                confidence: fasttext_confidence,
+                language: fasttext_language.into_pyobject(py)?.into(),
+                fallback: true,
+            };
+
             return Ok(fasttext_prediction);
         }
 
@@ -137,6 +145,7 @@ impl Detector {
         let lingua_prediction = Prediction {
             confidence: lingua_confidence,
             language,
+            fallback: true,
         };
 
         Ok(lingua_prediction)
@@ -1,15 +1,22 @@
+from os import environ, getpid
+from pathlib import Path
+from tempfile import gettempdir
+from threading import Event, Thread
+
 from granian.constants import Interfaces
 from granian.server import Server
 
 from server.app import app
 from server.config import Config
+from server.engine import supervise
+from server.telemetry import ACCESS_LOG_FORMAT
 
 
 def main() -> None:
     """
     Summary
     -------
-    programmatically run the server with Granian
+    programmatically run the server with Granian, alongside a shared translator engine if enabled
     """
     config = Config()
     granian = Server(
@@ -18,14 +25,30 @@ def main() -> None:
         port=config.server_port,
         interface=Interfaces.ASGI,
         workers=config.worker_count,
-        log_access=True,
-        log_access_format='[%(time)s] %(status)d "%(method)s %(path)s %(protocol)s" %(addr)s in %(dt_ms).2f ms',
+        log_access=not config.access_log_server_timing,
+        log_access_format=ACCESS_LOG_FORMAT,
         url_path_prefix=config.server_root_path,
         factory=True,
         reload=False,
     )
 
-    granian.serve()
+    if not config.translator_engine:
+        granian.serve()
+        return
+
+    if config.translator_engine_socket is None:
+        environ["TRANSLATOR_ENGINE_SOCKET"] = str(Path(gettempdir()) / f"{config.app_name}-{getpid()}.sock")
+
+    stopped = Event()
+    supervisor = Thread(target=supervise, args=(stopped,), daemon=True)
+    supervisor.start()
+
+    try:
+        granian.serve()
+
+    finally:
+        stopped.set()
+        supervisor.join()
 
 
 if __name__ == "__main__":
@@ -1 +1,3 @@
 from server.api.health import health as health
+from server.api.metrics import metrics as metrics
+from server.api.ready import ready as ready
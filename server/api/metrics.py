@@ -0,0 +1,12 @@
+from litestar import Response, get
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+
+@get("/metrics", sync_to_thread=True, include_in_schema=False)
+def metrics() -> Response[bytes]:
+    """
+    Summary
+    -------
+    the `/metrics` route will return the metrics of this worker in the Prometheus text format
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
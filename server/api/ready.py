@@ -0,0 +1,21 @@
+from litestar import Response, get
+from litestar.status_codes import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+
+from server.schemas import Readiness
+from server.typedefs import AppState
+
+
+@get("/ready", sync_to_thread=False)
+def ready(state: AppState) -> Response[Readiness]:
+    """
+    Summary
+    -------
+    the `/ready` route will return 503 while the models are warming up or after a model is unloaded through the API
+    """
+    readiness = Readiness(
+        ready=not state.warming_up and not state.translators.unloaded,
+        warming_up=sorted(state.warming_up),
+        unloaded_models=sorted(state.translators.unloaded),
+    )
+
+    return Response(readiness, status_code=HTTP_200_OK if readiness.ready else HTTP_503_SERVICE_UNAVAILABLE)
@@ -4,7 +4,9 @@ from litestar import get
 from litestar.openapi.spec.example import Example
 from litestar.params import Parameter
 
+from server.features.detector import detect_duration, detections
 from server.schemas.v1 import LanguageResult
+from server.telemetry import stage
 from server.typedefs import AppState
 
 
@@ -56,10 +58,19 @@ def language(
     -------
     the `/language` route detects the language of the input text
     """
-    prediction = state.language_detector.detect(
-        text,
-        fasttext_confidence_threshold=fast_model_confidence_threshold,
-        lingua_confidence_threshold=accurate_model_confidence_threshold,
-    )
+    with stage(
+        "language_detector.detect",
+        detect_duration,
+        {"language_detector.text_length": len(text)},
+        timing="detect",
+    ) as span:
+        prediction = state.language_detector.detect(
+            text,
+            fasttext_confidence_threshold=fast_model_confidence_threshold,
+            lingua_confidence_threshold=accurate_model_confidence_threshold,
+        )
+        span.set_attribute("language_detector.fallback", prediction.fallback)
+
+    detections.add(1, {"fallback": prediction.fallback})
 
     return LanguageResult(language=prediction.language, confidence=prediction.confidence)
@@ -1,14 +1,195 @@
-from typing import Annotated, get_args
+from asyncio import FIRST_COMPLETED, CancelledError, create_task, wait
+from collections.abc import Coroutine
+from contextlib import suppress
+from time import monotonic
+from typing import Annotated, Any, get_args
 
-from litestar import Controller, Response, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
+from litestar.di import Provide
+from litestar.exceptions import HTTPException, ValidationException
 from litestar.openapi.spec.example import Example
-from litestar.params import Parameter
+from litestar.params import Body, Dependency, Parameter
 from litestar.response.sse import ServerSentEvent
 from litestar.status_codes import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED
 
+from server.features.translator import TranslatorProtocol
 from server.guards import requires_secret
-from server.schemas.v1 import Tokens, Translated, Translation
-from server.typedefs import AppState, Language
+from server.schemas.v1 import Queue, Tokens, Translated, Translation
+from server.typedefs import AppState, Language, Priority
+
+
+def get_client(
+    request: Request[Any, Any, Any],
+    client_id: Annotated[
+        str | None,
+        Parameter(header="X-Client-ID", description="the client that translations are fairly scheduled against"),
+    ] = None,
+) -> str:
+    """
+    Summary
+    -------
+    get the client that translations are fairly scheduled against, falling back to the address of the caller
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+
+    client_id (str?)
+        the client ID header
+
+    Returns
+    -------
+    client (str)
+        the client identifier
+    """
+    return client_id or (request.client.host if request.client else "")
+
+
+def get_deadline(
+    request: Request[Any, Any, Any],
+    request_timeout: Annotated[
+        float | None,
+        Parameter(
+            header="X-Request-Timeout",
+            gt=0,
+            description="the number of seconds after which the translation is abandoned",
+        ),
+    ] = None,
+) -> float | None:
+    """
+    Summary
+    -------
+    get the monotonic time after which the translation is abandoned, from the tighter of the request and server timeouts
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+
+    request_timeout (float?)
+        the request timeout header
+
+    Returns
+    -------
+    deadline (float?)
+        the deadline of the translation, if any
+    """
+    timeouts = [timeout for timeout in (request_timeout, request.route_handler.opt.get("request_timeout")) if timeout]
+    return monotonic() + min(timeouts) if timeouts else None
+
+
+async def wait_for_disconnect(request: Request[Any, Any, Any]) -> None:
+    """
+    Summary
+    -------
+    wait until the client disconnects
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+    """
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+async def cancel_on_disconnect[T](request: Request[Any, Any, Any], coroutine: Coroutine[object, object, T]) -> T:
+    """
+    Summary
+    -------
+    run a coroutine to completion, cancelling it as soon as the client disconnects
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+
+    coroutine (Coroutine[object, object, T])
+        the coroutine to run
+
+    Returns
+    -------
+    result (T)
+        the result of the coroutine
+
+    Raises
+    ------
+    HTTPException
+        if the client disconnects before the coroutine completes
+    """
+    task = create_task(coroutine)
+    disconnect = create_task(wait_for_disconnect(request))
+
+    try:
+        await wait((task, disconnect), return_when=FIRST_COMPLETED)
+
+    finally:
+        for pending in (disconnect, task):
+            if pending.cancel():
+                with suppress(CancelledError):
+                    await pending
+
+    if task.cancelled():
+        raise HTTPException(status_code=499, detail="Client Closed Request")
+
+    return task.result()
+
+
+def get_repository(
+    state: AppState,
+    model: Annotated[
+        str | None,
+        Parameter(description="the repository of the translator model, defaulting to the default model"),
+    ] = None,
+) -> str:
+    """
+    Summary
+    -------
+    get the repository of the translator model selected by the request
+
+    Parameters
+    ----------
+    state (AppState)
+        the application state
+
+    model (str?)
+        the model query parameter
+
+    Returns
+    -------
+    repository (str)
+        the repository of the selected translator model
+    """
+    if model is None:
+        return state.translators.default
+
+    if model not in state.translators:
+        raise ValidationException(extra={"model": model, "available_models": list(state.translators)})
+
+    return model
+
+
+async def select_translator(state: AppState, repository: str) -> TranslatorProtocol:
+    """
+    Summary
+    -------
+    get the translator of the selected model, loading the model if it is not already loaded
+
+    Parameters
+    ----------
+    state (AppState)
+        the application state
+
+    repository (str)
+        the repository of the selected translator model
+
+    Returns
+    -------
+    translator (TranslatorProtocol)
+        the translator of the selected model
+    """
+    return await state.translators.get_async(repository)
 
 
 class TranslatorController(Controller):
@@ -19,28 +200,39 @@ class TranslatorController(Controller):
     """
 
     path = "/translator"
+    dependencies = {  # noqa: RUF012
+        "client": Provide(get_client, sync_to_thread=False),
+        "deadline": Provide(get_deadline, sync_to_thread=False),
+        "repository": Provide(get_repository, sync_to_thread=False),
+        "translator": Provide(select_translator),
+    }
 
     @delete(guards=[requires_secret], sync_to_thread=True)
     def unload_model(
         self,
         state: AppState,
+        repository: str,
         *,
         to_cpu: Annotated[bool, Parameter(description="whether to unload the model to CPU")] = False,
     ) -> Response[None]:
         """
         Summary
         -------
-        unload the model from the current device
+        unload the model from the current device, rejecting its translations and reporting the server as not ready until
+        it is loaded back
         """
         return Response(
             content=None,
-            status_code=HTTP_204_NO_CONTENT if state.translator.unload_model(to_cpu=to_cpu) else HTTP_304_NOT_MODIFIED,
+            status_code=HTTP_204_NO_CONTENT
+            if state.translators.unload(repository, to_cpu=to_cpu)
+            else HTTP_304_NOT_MODIFIED,
         )
 
     @put(guards=[requires_secret], sync_to_thread=True)
     def load_model(
         self,
         state: AppState,
+        repository: str,
         *,
         keep_cache: Annotated[bool, Parameter(description="whether to keep the model cache in RAM")] = False,
     ) -> Response[None]:
@@ -49,17 +241,18 @@ class TranslatorController(Controller):
         -------
         load the model back to the initial device
         """
+        loaded = state.translators.load(repository, keep_cache=keep_cache)
+
         return Response(
             content=None,
-            status_code=HTTP_204_NO_CONTENT
-            if state.translator.load_model(keep_cache=keep_cache)
-            else HTTP_304_NOT_MODIFIED,
+            status_code=HTTP_204_NO_CONTENT if loaded else HTTP_304_NOT_MODIFIED,
         )
 
     @get("/tokens", cache=True, sync_to_thread=True)
     def tokens(
         self,
         state: AppState,
+        repository: str,
         text: Annotated[str, Parameter(min_length=1, description="source text of a single language")],
     ) -> Tokens:
         """
@@ -67,12 +260,29 @@ class TranslatorController(Controller):
         -------
         count the number of tokens in the input text
         """
-        return Tokens(length=state.translator.count_tokens(text))
+        return Tokens(length=state.translators.peek(repository).count_tokens(text))
 
-    @get(cache=True, sync_to_thread=True)
-    def translator_get(
+    @get("/queue", sync_to_thread=True)
+    def queue(self, state: AppState, repository: str) -> Queue:
+        """
+        Summary
+        -------
+        the `/translator/queue` route returns the pending work of the translator, the estimated wait and its throughput
+        """
+        pending_jobs, pending_tokens, estimated_wait, throughput = state.translators.peek(repository).queue_status()
+
+        return Queue(
+            pending_jobs=pending_jobs,
+            pending_tokens=pending_tokens,
+            estimated_wait=estimated_wait,
+            throughput=throughput,
+        )
+
+    @get()
+    async def translator_get(
         self,
-        state: AppState,
+        request: Request[Any, Any, Any],
+        translator: Annotated[TranslatorProtocol, Dependency(skip_validation=True)],
         text: Annotated[
             str,
             Parameter(
@@ -98,27 +308,111 @@ class TranslatorController(Controller):
                 examples=[Example(summary=code, value=code) for code in get_args(Language.__value__)],
             ),
         ] = "spa_Latn",
+        *,
+        segment: Annotated[
+            bool,
+            Parameter(description="whether to split the input into sentences and translate them as a batch"),
+        ] = False,
+        priority: Annotated[
+            Priority,
+            Parameter(description="the priority class, where interactive translations are decoded before bulk ones"),
+        ] = "interactive",
+        client: str,
+        deadline: float | None,
     ) -> Translated:
         """
         Summary
         -------
         the GET variant of the `/translator` route
         """
-        return Translated(result=state.translator.translate(text, source, target))
+        translation = await cancel_on_disconnect(
+            request,
+            translator.translate_async(
+                text,
+                source,
+                target,
+                segment=segment,
+                priority=priority,
+                client=client,
+                deadline=deadline,
+            ),
+        )
+        return Translated(result=translation)
 
-    @post(status_code=HTTP_200_OK, sync_to_thread=True, deprecated=True)
-    def translator_post(self, state: AppState, data: Translation) -> Translated:
+    @post(status_code=HTTP_200_OK, deprecated=True)
+    async def translator_post(
+        self,
+        request: Request[Any, Any, Any],
+        translator: Annotated[TranslatorProtocol, Dependency(skip_validation=True)],
+        data: Translation,
+        *,
+        segment: Annotated[
+            bool,
+            Parameter(description="whether to split the input into sentences and translate them as a batch"),
+        ] = False,
+        priority: Annotated[
+            Priority,
+            Parameter(description="the priority class, where interactive translations are decoded before bulk ones"),
+        ] = "interactive",
+        client: str,
+        deadline: float | None,
+    ) -> Translated:
         """
         Summary
         -------
         the POST variant of the `/translator` route
         """
-        return Translated(result=state.translator.translate(data.text, data.source, data.target))
+        translation = await cancel_on_disconnect(
+            request,
+            translator.translate_async(
+                data.text,
+                data.source,
+                data.target,
+                segment=segment,
+                priority=priority,
+                client=client,
+                deadline=deadline,
+            ),
+        )
+        return Translated(result=translation)
 
-    @get("/stream", sync_to_thread=True)
-    def translator_stream(
+    @post("/batch", status_code=HTTP_200_OK)
+    async def translator_batch(
         self,
-        state: AppState,
+        request: Request[Any, Any, Any],
+        translator: Annotated[TranslatorProtocol, Dependency(skip_validation=True)],
+        data: Annotated[
+            list[Translation],
+            Body(description="inputs to translate, each with its own source and target", min_items=1, max_items=1024),
+        ],
+        *,
+        priority: Annotated[
+            Priority,
+            Parameter(description="the priority class, where interactive translations are decoded before bulk ones"),
+        ] = "bulk",
+        client: str,
+        deadline: float | None,
+    ) -> list[Translated]:
+        """
+        Summary
+        -------
+        the `/translator/batch` route translates many inputs at once and returns the results in order
+        """
+        translations = await cancel_on_disconnect(
+            request,
+            translator.translate_batch_async(
+                [(item.text, item.source, item.target) for item in data],
+                priority=priority,
+                client=client,
+                deadline=deadline,
+            ),
+        )
+        return [Translated(result=translation) for translation in translations]
+
+    @get("/stream")
+    async def translator_stream(
+        self,
+        translator: Annotated[TranslatorProtocol, Dependency(skip_validation=True)],
         text: Annotated[
             str,
             Parameter(
@@ -144,6 +438,17 @@ class TranslatorController(Controller):
                 examples=[Example(summary=code, value=code) for code in get_args(Language.__value__)],
             ),
         ] = "spa_Latn",
+        *,
+        segment: Annotated[
+            bool,
+            Parameter(description="whether to split the input into sentences and translate them as a batch"),
+        ] = False,
+        priority: Annotated[
+            Priority,
+            Parameter(description="the priority class, where interactive translations are decoded before bulk ones"),
+        ] = "interactive",
+        client: str,
+        deadline: float | None,
         event_type: Annotated[
             str | None, Parameter(description="the event that an event listener will listen for")
         ] = None,
@@ -153,4 +458,15 @@ class TranslatorController(Controller):
         -------
         the `/translator/stream` returns a Server-Sent Event stream of the translation
         """
-        return ServerSentEvent(state.translator.translate_stream(text, source, target), event_type=event_type)
+        return ServerSentEvent(
+            translator.translate_stream_async(
+                text,
+                source,
+                target,
+                segment=segment,
+                priority=priority,
+                client=client,
+                deadline=deadline,
+            ),
+            event_type=event_type,
+        )
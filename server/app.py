@@ -11,14 +11,23 @@ from litestar.contrib.opentelemetry import OpenTelemetryConfig, OpenTelemetryPlu
 from litestar.openapi import OpenAPIConfig
 from litestar.openapi.spec import Server
 from litestar.plugins import PluginProtocol
-from litestar.status_codes import HTTP_500_INTERNAL_SERVER_ERROR
-from litestar.types import Method
+from litestar.status_codes import (
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTP_504_GATEWAY_TIMEOUT,
+)
+from litestar.stores.base import Store
+from litestar.types import ControllerRouterHandler, Method
 
-from server.api import health, v4
+from server.api import health, metrics, ready, v4
 from server.config import Config
+from server.features.translator import DeadlineExceededError, EngineUnavailableError, ModelUnloadedError, QueueFullError
 from server.lifespans import load_language_detector, load_translator_model
 from server.plugins import ConsulPlugin
-from server.telemetry import get_log_handler, get_meter_provider, get_tracer_provider
+from server.stores import SQLiteCache, SQLiteStore
+from server.telemetry import ServerTimingMiddleware, get_log_handler, get_meter_provider, get_tracer_provider
+from server.typedefs import AppState
 
 
 def exception_handler(logger: Logger, _, exception: Exception) -> Response[dict[str, str]]:
@@ -50,6 +59,98 @@ def exception_handler(logger: Logger, _, exception: Exception) -> Response[dict[
     )
 
 
+def queue_full_handler(_, exception: QueueFullError) -> Response[dict[str, str]]:
+    """
+    Summary
+    -------
+    the exception handler that rejects requests while the translation queue is full
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+
+    exception (QueueFullError)
+        the exception
+
+    Returns
+    -------
+    response (Response[dict[str, str]]) : the response
+    """
+    return Response(
+        content={"detail": "Too Many Requests"},
+        status_code=HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(exception.retry_after)},
+    )
+
+
+def deadline_exceeded_handler(_, __: DeadlineExceededError) -> Response[dict[str, str]]:
+    """
+    Summary
+    -------
+    the exception handler that rejects requests whose translation deadline has passed
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+
+    exception (DeadlineExceededError)
+        the exception
+
+    Returns
+    -------
+    response (Response[dict[str, str]]) : the response
+    """
+    return Response(content={"detail": "Gateway Timeout"}, status_code=HTTP_504_GATEWAY_TIMEOUT)
+
+
+def engine_unavailable_handler(_, __: EngineUnavailableError) -> Response[dict[str, str]]:
+    """
+    Summary
+    -------
+    the exception handler that rejects requests while the translator engine is restarting
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+
+    exception (EngineUnavailableError)
+        the exception
+
+    Returns
+    -------
+    response (Response[dict[str, str]]) : the response
+    """
+    return Response(
+        content={"detail": "Service Unavailable"},
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+
+
+def model_unloaded_handler(_, __: ModelUnloadedError) -> Response[dict[str, str]]:
+    """
+    Summary
+    -------
+    the exception handler that rejects translations while an operator has unloaded the model
+
+    Parameters
+    ----------
+    request (Request)
+        the request
+
+    exception (ModelUnloadedError)
+        the exception
+
+    Returns
+    -------
+    response (Response[dict[str, str]]) : the response
+    """
+    return Response(content={"detail": "Service Unavailable"}, status_code=HTTP_503_SERVICE_UNAVAILABLE)
+
+
 def extract_cors_values(string: str) -> list[str]:
     """
     Summary
@@ -80,6 +181,11 @@ def app(config: Config | None = None) -> Litestar:
     app_id = f"{app_name}-{uuid4().hex[:4]}"
     logger = getLogger(app_name)
     plugins: list[PluginProtocol] = []
+    stores: dict[str, Store] = {}
+    on_shutdown: list[Callable[[], None]] = []
+    shared_cache = (
+        SQLiteCache(config.shared_cache_path, max_bytes=config.shared_cache_bytes) if config.shared_cache_path else None
+    )
     description = (
         "A performant high-throughput CPU-based API for Meta's No Language Left Behind (NLLB) using CTranslate2, "
         "hosted on Hugging Face Spaces."
@@ -99,6 +205,8 @@ def app(config: Config | None = None) -> Litestar:
         route_handlers=[v4.language, v4.TranslatorController],
     )
 
+    route_handlers: list[ControllerRouterHandler] = [v4_router, health, ready]
+
     allow_methods_dict: dict[Method | Literal["*"], bool] = {
         "GET": config.access_control_allow_method_get,
         "POST": config.access_control_allow_method_post,
@@ -120,27 +228,69 @@ def app(config: Config | None = None) -> Litestar:
     )
 
     lifespans: tuple[Callable[[Litestar], AbstractAsyncContextManager[None]], ...] = (
-        load_language_detector(config.language_detector_repository, stub=config.stub_language_detector),
+        load_language_detector(
+            config.language_detector_repository,
+            warmup_rounds=config.warmup_rounds,
+            stub=config.stub_language_detector,
+            stub_detect_latency=config.stub_detect_latency,
+            stub_fallback_latency=config.stub_fallback_latency,
+            stub_fallback_rate=config.stub_fallback_rate,
+        ),
         load_translator_model(
-            config.translator_repository,
+            [config.translator_repository, *extract_cors_values(config.translator_models)],
+            max_resident_bytes=config.translator_resident_bytes,
+            engine_socket=config.translator_engine_socket,
             translator_threads=config.translator_threads,
+            intra_threads=config.translator_intra_threads,
+            compute_type=config.translator_compute_type,
+            max_queued_batches=config.translator_max_queued_batches,
+            cpu_isa=config.translator_cpu_isa,
+            batch_window=config.translator_batch_window,
+            max_batch_tokens=config.translator_max_batch_tokens,
+            max_pending_tokens=config.translator_max_pending_tokens,
+            idle_timeout=config.translator_idle_timeout,
+            idle_to_cpu=config.translator_idle_to_cpu,
+            length_margin=config.translator_length_margin,
+            cache_bytes=config.translator_cache_bytes,
+            shared_cache=shared_cache,
+            warmup_rounds=config.warmup_rounds,
             stub=config.stub_translator,
+            stub_tokenise_latency=config.stub_tokenise_latency,
+            stub_decode_latency=config.stub_decode_latency,
+            stub_runaway_rate=config.stub_runaway_rate,
             testing=config.testing,
             use_cuda=config.use_cuda,
         ),
     )
 
+    if shared_cache is not None:
+        stores["response_cache"] = SQLiteStore(shared_cache, namespace="response_cache")
+        on_shutdown.append(shared_cache.close)
+
     if config.otel_exporter_otlp_endpoint:
         handler = get_log_handler(otlp_service_name=app_name, otlp_service_instance_id=app_id)
         logger.addHandler(handler)
         getLogger("granian.access").addHandler(handler)
+
+    if config.otel_exporter_otlp_endpoint or config.prometheus_metrics:
+        meter_provider = get_meter_provider(
+            otlp_service_name=app_name,
+            otlp_service_instance_id=app_id,
+            otlp_export=config.otel_exporter_otlp_endpoint is not None,
+        )
+
         opentelemetry_config = OpenTelemetryConfig(
-            tracer_provider=get_tracer_provider(otlp_service_name=app_name, otlp_service_instance_id=app_id),
-            meter_provider=get_meter_provider(otlp_service_name=app_name, otlp_service_instance_id=app_id),
+            tracer_provider=get_tracer_provider(otlp_service_name=app_name, otlp_service_instance_id=app_id)
+            if config.otel_exporter_otlp_endpoint
+            else None,
+            meter_provider=meter_provider,
         )
 
         plugins.append(OpenTelemetryPlugin(opentelemetry_config))
 
+    if config.prometheus_metrics:
+        route_handlers.append(metrics)
+
     if config.consul_http_addr and config.consul_service_address:
         consul_plugin = ConsulPlugin(
             app_name=app_name,
@@ -150,6 +300,8 @@ def app(config: Config | None = None) -> Litestar:
             consul_service_port=config.consul_service_port,
             consul_service_scheme=config.consul_service_scheme,
             server_root_path=config.server_root_path,
+            update_interval=config.consul_update_interval,
+            prometheus_metrics=config.prometheus_metrics,
             consul_auth_token=config.consul_auth_token,
         )
 
@@ -158,9 +310,24 @@ def app(config: Config | None = None) -> Litestar:
     return Litestar(
         openapi_config=openapi_config,
         cors_config=cors_config,
-        exception_handlers={HTTP_500_INTERNAL_SERVER_ERROR: partial(exception_handler, logger)},
-        route_handlers=[v4_router, health],
+        exception_handlers={
+            HTTP_500_INTERNAL_SERVER_ERROR: partial(exception_handler, logger),
+            QueueFullError: queue_full_handler,
+            EngineUnavailableError: engine_unavailable_handler,
+            ModelUnloadedError: model_unloaded_handler,
+            DeadlineExceededError: deadline_exceeded_handler,
+        },
+        route_handlers=route_handlers,
+        middleware=[
+            ServerTimingMiddleware(
+                timing_allow_origin=config.access_control_allow_origin,
+                log_access=config.access_log_server_timing,
+            )
+        ],
         plugins=plugins,
         lifespan=lifespans,
-        opt={"auth_token": config.auth_token},
+        state=AppState({"warming_up": set()}),
+        stores=stores,
+        on_shutdown=on_shutdown,
+        opt={"auth_token": config.auth_token, "request_timeout": config.translator_request_timeout},
     )
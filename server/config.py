@@ -2,6 +2,8 @@ from uuid import uuid4
 
 from pydantic_settings import BaseSettings
 
+from server.typedefs import ComputeTypes, CpuIsa
+
 
 class Config(BaseSettings):
     """
@@ -27,23 +29,101 @@ class Config(BaseSettings):
         the auth token to use for the server
 
     translator_repository (str)
-        the repository to download the translator from
+        the repository to download the default translator from
+
+    translator_models (str)
+        the comma-separated repositories of additional translators that requests can select
+
+    translator_resident_bytes (int)
+        the maximum combined size of the loaded translators in bytes, where 0 keeps every translator loaded
+
+    translator_engine (bool)
+        whether to load the translator models once in an engine process that every worker forwards translations to
+
+    translator_engine_socket (str?)
+        the Unix socket of the translator engine that the workers forward translations to
 
     translator_threads (int)
         the number of threads for the translator
 
+    translator_intra_threads (int)
+        the number of threads used to decode each batch, where 0 uses the CTranslate2 default
+
+    translator_compute_type (ComputeTypes)
+        the type of the model weights and computations
+
+    translator_max_queued_batches (int)
+        the maximum number of batches queued inside CTranslate2, where 0 uses the CTranslate2 default
+
+    translator_cpu_isa (CpuIsa?)
+        the CPU instruction set to force CTranslate2 to use instead of the one it detects
+
+    translator_batch_window (float)
+        the number of seconds to wait for concurrent requests before dispatching a batch
+
+    translator_max_batch_tokens (int)
+        the maximum number of padded source tokens in a batch
+
+    translator_max_pending_tokens (int)
+        the maximum number of source tokens waiting for, or undergoing, decoding before requests are rejected
+
+    translator_idle_timeout (float)
+        the number of seconds without traffic before the translator is unloaded, where 0 keeps it loaded
+
+    translator_idle_to_cpu (bool)
+        whether an idle translator is unloaded to CPU instead of being released entirely
+
+    translator_length_margin (float)
+        the multiple of the expected output length that a translation may generate, where 0 disables the budget
+
+    translator_request_timeout (float)
+        the number of seconds after which a translation is abandoned, where 0 disables the timeout
+
+    translator_cache_bytes (int)
+        the maximum size of the translation cache in bytes, where 0 disables the cache
+
     stub_translator (bool)
         whether to use a stub for the translator
 
+    stub_tokenise_latency (float)
+        the number of seconds the stub translator spends tokenising or detokenising each token, where 0 with no
+        decode latency echoes inputs instantly
+
+    stub_decode_latency (float)
+        the number of seconds each decoding step of the stub translator takes on an uncontended core, where 0 with no
+        tokenise latency echoes inputs instantly
+
+    stub_runaway_rate (float)
+        the share of stub translations that never generate an end token and run until they are stopped
+
+    shared_cache_path (str?)
+        the path of the on-disk cache shared by every worker on the host
+
+    shared_cache_bytes (int)
+        the maximum size of the on-disk shared cache in bytes
+
     use_cuda (bool)
         whether to use CUDA for inference
 
+    warmup_rounds (int)
+        the number of times representative inputs are run through the models before the server is ready, where 0
+        skips the warmup
+
     language_detector_repository (str)
         the repository to download the language detector from
 
     stub_language_detector (bool)
         whether to use a stub for the language detector
 
+    stub_detect_latency (float)
+        the number of seconds every detection of the stub language detector takes
+
+    stub_fallback_latency (float)
+        the number of additional seconds a detection of the stub language detector takes when it falls back to lingua
+
+    stub_fallback_rate (float)
+        the share of inputs for which the stub language detector falls back to lingua
+
     access_control_allow_origin (str)
         the allowed origins for CORS
 
@@ -83,9 +163,16 @@ class Config(BaseSettings):
     access_control_max_age (int)
         the maximum age for CORS preflight requests
 
+    access_log_server_timing (bool)
+        whether the access log is written by the application instead of Granian, so that each line ends with the
+        `Server-Timing` breakdown of its request
+
     otel_exporter_otlp_endpoint (str?)
         the endpoint for the OTLP exporter
 
+    prometheus_metrics (bool)
+        whether metrics are collected and served at `/metrics` for Prometheus to scrape
+
     consul_auth_token (str?)
         the auth token for Consul
 
@@ -98,6 +185,9 @@ class Config(BaseSettings):
     consul_service_scheme (str)
         the scheme for the Consul service (http or https)
 
+    consul_update_interval (float)
+        the number of seconds between updates of the Consul service weights and metadata from the current load
+
     consul_service_token (str?)
         the token for the Consul service
     """
@@ -109,13 +199,38 @@ class Config(BaseSettings):
     auth_token: str = str(uuid4())
 
     translator_repository: str = "winstxnhdw/nllb-200-distilled-1.3B-ct2-int8"
+    translator_models: str = ""
+    translator_resident_bytes: int = 0
+    translator_engine: bool = False
+    translator_engine_socket: str | None = None
     translator_threads: int = 1
+    translator_intra_threads: int = 0
+    translator_compute_type: ComputeTypes = "auto"
+    translator_max_queued_batches: int = 0
+    translator_cpu_isa: CpuIsa | None = None
+    translator_batch_window: float = 0.01
+    translator_max_batch_tokens: int = 4096
+    translator_max_pending_tokens: int = 65536
+    translator_idle_timeout: float = 0
+    translator_idle_to_cpu: bool = False
+    translator_length_margin: float = 0
+    translator_request_timeout: float = 0
+    translator_cache_bytes: int = 67108864
     stub_translator: bool = False
+    stub_tokenise_latency: float = 0
+    stub_decode_latency: float = 0
+    stub_runaway_rate: float = 0
+    shared_cache_path: str | None = None
+    shared_cache_bytes: int = 268435456
     testing: bool = False
     use_cuda: bool = False
+    warmup_rounds: int = 1
 
     language_detector_repository: str = "facebook/fasttext-language-identification"
     stub_language_detector: bool = False
+    stub_detect_latency: float = 0
+    stub_fallback_latency: float = 0
+    stub_fallback_rate: float = 0
 
     access_control_allow_origin: str = "*"
     access_control_allow_method_get: bool = True
@@ -131,10 +246,13 @@ class Config(BaseSettings):
     access_control_expose_headers: str = "*"
     access_control_max_age: int = 600
 
+    access_log_server_timing: bool = False
     otel_exporter_otlp_endpoint: str | None = None
+    prometheus_metrics: bool = False
 
     consul_http_addr: str | None = None
     consul_auth_token: str | None = None
     consul_service_address: str | None = None
     consul_service_port: int = 443
     consul_service_scheme: str = "https"
+    consul_update_interval: float = 10
@@ -0,0 +1,107 @@
+from asyncio import run
+from functools import partial
+from logging import getLogger
+from multiprocessing import get_context
+from threading import Event
+from uuid import uuid4
+
+from server.config import Config
+from server.features.translator import TranslatorEngine, get_translator, get_translator_registry
+from server.stores import SQLiteCache
+from server.telemetry import get_meter_provider
+
+ENGINE_RESTART_INTERVAL = 1.0
+
+
+class EngineSocketNotConfiguredError(Exception): ...
+
+
+def main() -> None:
+    """
+    Summary
+    -------
+    load the translator models once and serve them to every HTTP worker over the configured Unix socket
+    """
+    config = Config()
+
+    if config.translator_engine_socket is None:
+        raise EngineSocketNotConfiguredError
+
+    if config.otel_exporter_otlp_endpoint:
+        get_meter_provider(
+            otlp_service_name=config.app_name,
+            otlp_service_instance_id=f"{config.app_name}-engine-{uuid4().hex[:4]}",
+            otlp_export=True,
+        )
+
+    shared_cache = (
+        SQLiteCache(config.shared_cache_path, max_bytes=config.shared_cache_bytes) if config.shared_cache_path else None
+    )
+
+    factory = partial(
+        get_translator,
+        translator_threads=config.translator_threads,
+        intra_threads=config.translator_intra_threads,
+        compute_type=config.translator_compute_type,
+        max_queued_batches=config.translator_max_queued_batches,
+        cpu_isa=config.translator_cpu_isa,
+        batch_window=config.translator_batch_window,
+        max_batch_tokens=config.translator_max_batch_tokens,
+        max_pending_tokens=config.translator_max_pending_tokens,
+        idle_timeout=config.translator_idle_timeout,
+        idle_to_cpu=config.translator_idle_to_cpu,
+        length_margin=config.translator_length_margin,
+        cache_bytes=config.translator_cache_bytes,
+        shared_cache=shared_cache,
+        testing=config.testing,
+        stub=config.stub_translator,
+        stub_tokenise_latency=config.stub_tokenise_latency,
+        stub_decode_latency=config.stub_decode_latency,
+        stub_runaway_rate=config.stub_runaway_rate,
+        use_cuda=config.use_cuda,
+    )
+
+    repositories = [
+        config.translator_repository,
+        *(repository.strip() for repository in config.translator_models.split(",") if repository.strip()),
+    ]
+
+    with get_translator_registry(
+        repositories,
+        factory,
+        max_bytes=config.translator_resident_bytes,
+        stub=config.stub_translator,
+    ) as translators:
+        translators.warm_up(config.warmup_rounds)
+        run(TranslatorEngine(translators).serve(config.translator_engine_socket))
+
+
+def supervise(stopped: Event) -> None:
+    """
+    Summary
+    -------
+    run the translator engine in a child process, restarting it whenever it exits until the server stops
+
+    Parameters
+    ----------
+    stopped (Event)
+        the event set when the server stops
+    """
+    logger = getLogger(__name__)
+    context = get_context("spawn")
+
+    while True:
+        engine = context.Process(target=main, daemon=True)
+        engine.start()
+
+        while engine.is_alive():
+            if stopped.wait(ENGINE_RESTART_INTERVAL):
+                engine.terminate()
+                engine.join()
+                return
+
+        logger.error("The translator engine exited with code %s and is being restarted", engine.exitcode)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from server.features.benchmark.detector import DEFAULT_DETECTOR_CORPUS as DEFAULT_DETECTOR_CORPUS
+from server.features.benchmark.detector import DETECTOR_TEXT_LENGTHS as DETECTOR_TEXT_LENGTHS
+from server.features.benchmark.detector import DETECTOR_THRESHOLDS as DETECTOR_THRESHOLDS
+from server.features.benchmark.detector import DetectorResult as DetectorResult
+from server.features.benchmark.detector import benchmark_detector as benchmark_detector
+from server.features.benchmark.detector import format_detector_results as format_detector_results
+from server.features.benchmark.detector import load_detector_corpus as load_detector_corpus
+from server.features.benchmark.report import BenchmarkReport as BenchmarkReport
+from server.features.benchmark.report import create_report as create_report
+from server.features.benchmark.report import format_report as format_report
+from server.features.benchmark.runner import run_benchmark as run_benchmark
+from server.features.benchmark.workload import DEFAULT_WORKLOAD as DEFAULT_WORKLOAD
+from server.features.benchmark.workload import load_workload as load_workload
@@ -0,0 +1,310 @@
+from collections.abc import Sequence
+from pathlib import Path
+from time import perf_counter_ns
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+
+from msgspec import Struct
+
+from server.features.benchmark.report import percentiles
+from server.features.detector import LanguageDetectorProtocol
+
+DEFAULT_DETECTOR_CORPUS = Path(__file__).with_name("detector_corpus.tsv")
+DETECTOR_TEXT_LENGTHS = (16, 64, 256, 1024)
+DETECTOR_THRESHOLDS = (0.0, 0.85, 1.1)
+
+
+class DetectorCase(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    an input of the language detector benchmark
+
+    Attributes
+    ----------
+    language (str)
+        the language and script of the input
+
+    length (int)
+        the number of characters in the input
+
+    text (str)
+        the input to detect the language of
+    """
+
+    language: str
+    length: int
+    text: str
+
+
+class DetectorResult(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the cost of detecting the language of an input at a fastText confidence threshold
+
+    Attributes
+    ----------
+    language (str)
+        the language and script of the input
+
+    length (int)
+        the number of characters in the input
+
+    fasttext_confidence_threshold (float)
+        the fastText confidence below which lingua is consulted
+
+    calls (int)
+        the number of timed detections
+
+    latency_mean (float)
+        the mean number of microseconds a detection took
+
+    latency_p50 (float)
+        the median number of microseconds a detection took
+
+    latency_p99 (float)
+        the 99th percentile of the number of microseconds a detection took
+
+    fallback_share (float)
+        the share of detections that fell back to lingua
+
+    peak_bytes (int)
+        the peak number of bytes allocated by Python during a detection, excluding allocations made in Rust
+    """
+
+    language: str
+    length: int
+    fasttext_confidence_threshold: float
+    calls: int
+    latency_mean: float
+    latency_p50: float
+    latency_p99: float
+    fallback_share: float
+    peak_bytes: int
+
+
+def fit_length(text: str, length: int) -> str:
+    """
+    Summary
+    -------
+    repeat or cut a text so that it is exactly as long as requested
+
+    Parameters
+    ----------
+    text (str)
+        the text to fit
+
+    length (int)
+        the number of characters to fit the text to
+
+    Returns
+    -------
+    text (str)
+        the fitted text
+    """
+    return " ".join([text] * (length // (len(text) + 1) + 1))[:length].rstrip() or text[:length]
+
+
+def load_detector_corpus(path: Path, lengths: Sequence[int] = DETECTOR_TEXT_LENGTHS) -> list[DetectorCase]:
+    """
+    Summary
+    -------
+    read a corpus with a tab-separated language and text on each line, fitting every text to each length
+
+    Parameters
+    ----------
+    path (Path)
+        the path of the TSV corpus
+
+    lengths (Sequence[int])
+        the numbers of characters to fit each text to
+
+    Returns
+    -------
+    cases (list[DetectorCase])
+        the inputs of the benchmark, for every text and length
+    """
+    rows = [line.split("\t", 1) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    return [
+        DetectorCase(language=language, length=length, text=fit_length(text.strip(), length))
+        for language, text in rows
+        for length in lengths
+    ]
+
+
+def time_detector(
+    language_detector: LanguageDetectorProtocol,
+    case: DetectorCase,
+    *,
+    fasttext_confidence_threshold: float,
+    lingua_confidence_threshold: float,
+    rounds: int,
+) -> DetectorResult:
+    """
+    Summary
+    -------
+    time the detection of an input, then measure its peak Python allocations in a separate untimed call
+
+    Parameters
+    ----------
+    language_detector (LanguageDetectorProtocol)
+        the language detector
+
+    case (DetectorCase)
+        the input to detect the language of
+
+    fasttext_confidence_threshold (float)
+        the fastText confidence below which lingua is consulted
+
+    lingua_confidence_threshold (float)
+        the lingua confidence below which the fastText prediction is kept
+
+    rounds (int)
+        the number of timed detections
+
+    Returns
+    -------
+    result (DetectorResult)
+        the cost of detecting the language of the input
+    """
+    durations: list[float] = []
+    fallbacks = 0
+
+    for _ in range(rounds):
+        start_time = perf_counter_ns()
+        prediction = language_detector.detect(
+            case.text,
+            fasttext_confidence_threshold=fasttext_confidence_threshold,
+            lingua_confidence_threshold=lingua_confidence_threshold,
+        )
+        durations.append((perf_counter_ns() - start_time) / 1e9)
+        fallbacks += prediction.fallback
+
+    start()
+
+    try:
+        reset_peak()
+        baseline, _ = get_traced_memory()
+        language_detector.detect(
+            case.text,
+            fasttext_confidence_threshold=fasttext_confidence_threshold,
+            lingua_confidence_threshold=lingua_confidence_threshold,
+        )
+        _, peak = get_traced_memory()
+
+    finally:
+        stop()
+
+    latency_p50, _, latency_p99 = percentiles(durations)
+
+    return DetectorResult(
+        language=case.language,
+        length=case.length,
+        fasttext_confidence_threshold=fasttext_confidence_threshold,
+        calls=rounds,
+        latency_mean=sum(durations) / rounds * 1e6,
+        latency_p50=latency_p50 * 1000,
+        latency_p99=latency_p99 * 1000,
+        fallback_share=fallbacks / rounds,
+        peak_bytes=peak - baseline,
+    )
+
+
+def benchmark_detector(
+    language_detector: LanguageDetectorProtocol,
+    cases: Sequence[DetectorCase],
+    *,
+    fasttext_confidence_thresholds: Sequence[float] = DETECTOR_THRESHOLDS,
+    lingua_confidence_threshold: float,
+    rounds: int,
+) -> list[DetectorResult]:
+    """
+    Summary
+    -------
+    time the detection of every input at every fastText confidence threshold
+
+    Parameters
+    ----------
+    language_detector (LanguageDetectorProtocol)
+        the language detector
+
+    cases (Sequence[DetectorCase])
+        the inputs to detect the language of
+
+    fasttext_confidence_thresholds (Sequence[float])
+        the fastText confidences below which lingua is consulted, where 0 never and above 1 always consults lingua
+
+    lingua_confidence_threshold (float)
+        the lingua confidence below which the fastText prediction is kept
+
+    rounds (int)
+        the number of timed detections of each input at each threshold
+
+    Returns
+    -------
+    results (list[DetectorResult])
+        the cost of detecting the language of each input at each threshold
+    """
+    return [
+        time_detector(
+            language_detector,
+            case,
+            fasttext_confidence_threshold=fasttext_confidence_threshold,
+            lingua_confidence_threshold=lingua_confidence_threshold,
+            rounds=rounds,
+        )
+        for fasttext_confidence_threshold in fasttext_confidence_thresholds
+        for case in cases
+    ]
+
+
+def format_detector_results(
+    results: Sequence[DetectorResult],
+    baseline: Sequence[DetectorResult] = (),
+) -> list[str]:
+    """
+    Summary
+    -------
+    format the detector benchmark results as table rows, with the relative change from a baseline run if given
+
+    Parameters
+    ----------
+    results (Sequence[DetectorResult])
+        the results of the benchmark run
+
+    baseline (Sequence[DetectorResult])
+        the results of an earlier run to compare against, if any
+
+    Returns
+    -------
+    rows (list[str])
+        the header and a row for each input and threshold, followed by a row for each threshold overall
+    """
+    previous = {(result.language, result.length, result.fasttext_confidence_threshold): result for result in baseline}
+    header = (
+        f"{'language':<10}{'length':>8}{'threshold':>11}{'mean µs':>22}{'p50 µs':>12}{'p99 µs':>12}"
+        f"{'fallback':>10}{'peak bytes':>12}"
+    )
+    rows = [header]
+
+    for result in results:
+        before = previous.get((result.language, result.length, result.fasttext_confidence_threshold))
+        change = f" ({(result.latency_mean - before.latency_mean) / before.latency_mean:+.1%})" if before else ""
+        rows.append(
+            f"{result.language:<10}{result.length:>8}{result.fasttext_confidence_threshold:>11.2f}"
+            f"{f'{result.latency_mean:.1f}{change}':>22}{result.latency_p50:>12.1f}{result.latency_p99:>12.1f}"
+            f"{result.fallback_share:>10.1%}{result.peak_bytes:>12}"
+        )
+
+    for threshold in dict.fromkeys(result.fasttext_confidence_threshold for result in results):
+        group = [result for result in results if result.fasttext_confidence_threshold == threshold]
+        calls = sum(result.calls for result in group)
+        latency_mean = sum(result.latency_mean * result.calls for result in group) / calls
+        fallback_share = sum(result.fallback_share * result.calls for result in group) / calls
+        rows.append(
+            f"{'overall':<10}{'':>8}{threshold:>11.2f}{f'{latency_mean:.1f}':>22}{'':>12}{'':>12}"
+            f"{fallback_share:>10.1%}{max(result.peak_bytes for result in group):>12}"
+        )
+
+    return rows
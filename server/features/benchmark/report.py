@@ -0,0 +1,261 @@
+from collections.abc import Sequence
+from statistics import quantiles
+
+from msgspec import Struct
+
+from server.features.benchmark.runner import Sample
+
+REPORT_METRICS = (
+    "requests_per_second",
+    "output_tokens_per_second",
+    "latency_p50",
+    "latency_p95",
+    "latency_p99",
+    "first_byte_p50",
+)
+
+
+class Summary(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the latency and throughput of a group of benchmark requests
+
+    Attributes
+    ----------
+    requests (int)
+        the number of requests sent
+
+    errors (int)
+        the number of requests that failed or returned an error status, excluding rejections
+
+    rejected (int)
+        the number of requests rejected with `429 Too Many Requests`
+
+    requests_per_second (float)
+        the number of successful requests completed per second
+
+    input_tokens_per_second (float)
+        the number of source tokens translated per second
+
+    output_tokens_per_second (float)
+        the number of tokens generated per second
+
+    latency_p50 (float)
+        the median number of milliseconds until a successful response was received
+
+    latency_p95 (float)
+        the 95th percentile of the number of milliseconds until a successful response was received
+
+    latency_p99 (float)
+        the 99th percentile of the number of milliseconds until a successful response was received
+
+    first_byte_p50 (float)
+        the median number of milliseconds until the first chunk of a successful response was received
+    """
+
+    requests: int
+    errors: int
+    rejected: int
+    requests_per_second: float
+    input_tokens_per_second: float
+    output_tokens_per_second: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    first_byte_p50: float
+
+
+class BenchmarkReport(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the results of a benchmark run, saved to be compared across commits
+
+    Attributes
+    ----------
+    commit (str)
+        the commit of the server that was benchmarked, if known
+
+    created_at (str)
+        the ISO 8601 time at which the benchmark finished
+
+    concurrency (int)
+        the number of clients of a closed-loop benchmark
+
+    rate (float)
+        the mean number of requests sent per second in an open-loop benchmark, where 0 is a closed loop
+
+    duration (float)
+        the number of seconds the benchmark took
+
+    overall (Summary)
+        the summary of every request
+
+    kinds (dict[str, Summary])
+        the summary of the requests to each route
+    """
+
+    commit: str
+    created_at: str
+    concurrency: int
+    rate: float
+    duration: float
+    overall: Summary
+    kinds: dict[str, Summary]
+
+
+def percentiles(values: Sequence[float]) -> tuple[float, float, float]:
+    """
+    Summary
+    -------
+    get the 50th, 95th and 99th percentiles of a sample in milliseconds
+
+    Parameters
+    ----------
+    values (Sequence[float])
+        the sample in seconds
+
+    Returns
+    -------
+    percentiles (tuple[float, float, float])
+        the percentiles in milliseconds, or zeros for an empty sample
+    """
+    if len(values) < 2:  # noqa: PLR2004
+        value = values[0] * 1000 if values else 0.0
+        return value, value, value
+
+    cuts = quantiles(values, n=100, method="inclusive")
+    return cuts[49] * 1000, cuts[94] * 1000, cuts[98] * 1000
+
+
+def summarise(samples: Sequence[Sample], elapsed: float) -> Summary:
+    """
+    Summary
+    -------
+    summarise the latency and throughput of a group of benchmark requests
+
+    Parameters
+    ----------
+    samples (Sequence[Sample])
+        the outcome of each request
+
+    elapsed (float)
+        the number of seconds the benchmark took
+
+    Returns
+    -------
+    summary (Summary)
+        the summary of the requests
+    """
+    successes = [sample for sample in samples if 200 <= sample.status < 300]  # noqa: PLR2004
+    rejected = sum(sample.status == 429 for sample in samples)  # noqa: PLR2004
+    latency_p50, latency_p95, latency_p99 = percentiles([sample.latency for sample in successes])
+    first_byte_p50, _, _ = percentiles([sample.first_byte for sample in successes])
+
+    return Summary(
+        requests=len(samples),
+        errors=len(samples) - len(successes) - rejected,
+        rejected=rejected,
+        requests_per_second=len(successes) / elapsed,
+        input_tokens_per_second=sum(sample.input_tokens for sample in successes) / elapsed,
+        output_tokens_per_second=sum(sample.output_tokens for sample in successes) / elapsed,
+        latency_p50=latency_p50,
+        latency_p95=latency_p95,
+        latency_p99=latency_p99,
+        first_byte_p50=first_byte_p50,
+    )
+
+
+def create_report(
+    samples: Sequence[Sample],
+    elapsed: float,
+    *,
+    commit: str,
+    created_at: str,
+    concurrency: int,
+    rate: float,
+) -> BenchmarkReport:
+    """
+    Summary
+    -------
+    summarise a benchmark run overall and for each route
+
+    Parameters
+    ----------
+    samples (Sequence[Sample])
+        the outcome of each request
+
+    elapsed (float)
+        the number of seconds the benchmark took
+
+    commit (str)
+        the commit of the server that was benchmarked, if known
+
+    created_at (str)
+        the ISO 8601 time at which the benchmark finished
+
+    concurrency (int)
+        the number of clients of a closed-loop benchmark
+
+    rate (float)
+        the mean number of requests sent per second in an open-loop benchmark, where 0 is a closed loop
+
+    Returns
+    -------
+    report (BenchmarkReport)
+        the results of the benchmark run
+    """
+    kinds: dict[str, list[Sample]] = {}
+
+    for sample in samples:
+        kinds.setdefault(sample.kind, []).append(sample)
+
+    return BenchmarkReport(
+        commit=commit,
+        created_at=created_at,
+        concurrency=concurrency,
+        rate=rate,
+        duration=elapsed,
+        overall=summarise(samples, elapsed),
+        kinds={kind: summarise(kind_samples, elapsed) for kind, kind_samples in sorted(kinds.items())},
+    )
+
+
+def format_report(report: BenchmarkReport, baseline: BenchmarkReport | None = None) -> list[str]:
+    """
+    Summary
+    -------
+    format the summaries of a benchmark run as table rows, with the relative change from a baseline run if given
+
+    Parameters
+    ----------
+    report (BenchmarkReport)
+        the results of the benchmark run
+
+    baseline (BenchmarkReport?)
+        the results of an earlier run to compare against, if any
+
+    Returns
+    -------
+    rows (list[str])
+        the header and a row for each route, followed by the overall row
+    """
+    baselines = {**baseline.kinds, "overall": baseline.overall} if baseline else {}
+    rows = [
+        f"{'route':<10}{'requests':>10}{'errors':>8}{'429s':>8}" + "".join(f"{name:>26}" for name in REPORT_METRICS)
+    ]
+
+    for kind, summary in [*report.kinds.items(), ("overall", report.overall)]:
+        before = baselines.get(kind)
+        cells: list[str] = []
+
+        for name in REPORT_METRICS:
+            value: float = getattr(summary, name)
+            previous: float = getattr(before, name) if before is not None else 0.0
+            change = f" ({(value - previous) / previous:+.1%})" if previous else ""
+            cells.append(f"{f'{value:.2f}{change}':>26}")
+
+        rows.append(f"{kind:<10}{summary.requests:>10}{summary.errors:>8}{summary.rejected:>8}" + "".join(cells))
+
+    return rows
@@ -0,0 +1,305 @@
+from asyncio import TaskGroup, sleep
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from random import Random
+from time import perf_counter
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+from msgspec import Struct
+
+from server.features.benchmark.workload import RequestKind, WorkloadRequest, replay_workload
+
+
+class Sample(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the outcome of a single benchmark request
+
+    Attributes
+    ----------
+    kind (RequestKind)
+        the route that the request was sent to
+
+    status (int)
+        the response status code, or 0 if the request failed before a response
+
+    latency (float)
+        the number of seconds until the whole response was received
+
+    first_byte (float)
+        the number of seconds until the first chunk of the response body was received
+
+    input_tokens (int)
+        the number of source tokens reported in the `Server-Timing` header
+
+    output_tokens (int)
+        the number of generated tokens reported in the `Server-Timing` header
+    """
+
+    kind: RequestKind
+    status: int
+    latency: float
+    first_byte: float
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+def parse_token_counts(server_timing: str) -> tuple[int, int]:
+    """
+    Summary
+    -------
+    read the input and output token counts from a `Server-Timing` header
+
+    Parameters
+    ----------
+    server_timing (str)
+        the value of the header
+
+    Returns
+    -------
+    token_counts (tuple[int, int])
+        the number of input and output tokens, where missing counts are 0
+    """
+    counts = {"input-tokens": 0, "output-tokens": 0}
+
+    for metric in server_timing.split(","):
+        name, _, parameters = metric.strip().partition(";")
+
+        if name in counts and parameters.startswith("desc="):
+            counts[name] = int(parameters.removeprefix("desc="))
+
+    return counts["input-tokens"], counts["output-tokens"]
+
+
+async def send(session: ClientSession, url: str, request: WorkloadRequest) -> Sample:
+    """
+    Summary
+    -------
+    send a workload request and time its response
+
+    Parameters
+    ----------
+    session (ClientSession)
+        the HTTP session to send the request with
+
+    url (str)
+        the base URL of the server, including its root path
+
+    request (WorkloadRequest)
+        the request to send
+
+    Returns
+    -------
+    sample (Sample)
+        the outcome of the request
+    """
+    parameters = {"text": request.text, "source": request.source, "target": request.target}
+    start = perf_counter()
+    first_byte = 0.0
+
+    match request.kind:
+        case "get":
+            context = session.get(f"{url}/v4/translator", params=parameters)
+        case "post":
+            context = session.post(f"{url}/v4/translator", json=parameters)
+        case "stream":
+            context = session.get(f"{url}/v4/translator/stream", params=parameters)
+        case "language":
+            context = session.get(f"{url}/v4/language", params={"text": request.text})
+
+    try:
+        async with context as response:
+            async for _ in response.content.iter_any():
+                first_byte = first_byte or perf_counter() - start
+
+            latency = perf_counter() - start
+            input_tokens, output_tokens = parse_token_counts(response.headers.get("Server-Timing", ""))
+
+    except ClientError, TimeoutError:
+        return Sample(kind=request.kind, status=0, latency=perf_counter() - start, first_byte=first_byte)
+
+    return Sample(
+        kind=request.kind,
+        status=response.status,
+        latency=latency,
+        first_byte=first_byte or latency,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+    )
+
+
+async def run_closed_loop(
+    session: ClientSession,
+    url: str,
+    requests: Iterator[WorkloadRequest],
+    *,
+    concurrency: int,
+    deadline: float,
+) -> list[Sample]:
+    """
+    Summary
+    -------
+    replay a workload with a fixed number of clients that each send their next request once the last one completes
+
+    Parameters
+    ----------
+    session (ClientSession)
+        the HTTP session to send the requests with
+
+    url (str)
+        the base URL of the server, including its root path
+
+    requests (Iterator[WorkloadRequest])
+        the requests to send, shared by every client
+
+    concurrency (int)
+        the number of clients
+
+    deadline (float)
+        the `perf_counter` time after which no new request is sent
+
+    Returns
+    -------
+    samples (list[Sample])
+        the outcome of every request
+    """
+    samples: list[Sample] = []
+
+    async def client() -> None:
+        for request in requests:
+            if perf_counter() >= deadline:
+                return
+
+            samples.append(await send(session, url, request))
+
+    async with TaskGroup() as task_group:
+        for _ in range(concurrency):
+            task_group.create_task(client())
+
+    return samples
+
+
+async def run_open_loop(
+    session: ClientSession,
+    url: str,
+    requests: Iterator[WorkloadRequest],
+    *,
+    rate: float,
+    deadline: float,
+    seed: int,
+) -> list[Sample]:
+    """
+    Summary
+    -------
+    replay a workload with Poisson arrivals at a fixed rate, regardless of how quickly the server responds
+
+    Parameters
+    ----------
+    session (ClientSession)
+        the HTTP session to send the requests with
+
+    url (str)
+        the base URL of the server, including its root path
+
+    requests (Iterator[WorkloadRequest])
+        the requests to send
+
+    rate (float)
+        the mean number of requests sent per second
+
+    deadline (float)
+        the `perf_counter` time after which no new request is sent
+
+    seed (int)
+        the seed of the arrival times
+
+    Returns
+    -------
+    samples (list[Sample])
+        the outcome of every request
+    """
+    samples: list[Sample] = []
+    random = Random(seed)  # noqa: S311
+    arrival = perf_counter()
+
+    async def record(request: WorkloadRequest) -> None:
+        samples.append(await send(session, url, request))
+
+    async with TaskGroup() as task_group:
+        for request in requests:
+            arrival += random.expovariate(rate)
+
+            if arrival >= deadline:
+                break
+
+            await sleep(arrival - perf_counter())
+            task_group.create_task(record(request))
+
+    return samples
+
+
+async def run_benchmark(
+    url: str,
+    workload: Sequence[WorkloadRequest],
+    *,
+    concurrency: int,
+    rate: float,
+    duration: float,
+    max_requests: int,
+    request_timeout: float,
+    seed: int,
+) -> tuple[list[Sample], float]:
+    """
+    Summary
+    -------
+    replay a workload against a running server, in a closed loop unless an arrival rate is given
+
+    Parameters
+    ----------
+    url (str)
+        the base URL of the server, including its root path
+
+    workload (Sequence[WorkloadRequest])
+        the requests to replay, repeated in order with numbered inputs until the benchmark ends
+
+    concurrency (int)
+        the number of clients of a closed-loop benchmark
+
+    rate (float)
+        the mean number of requests sent per second in an open-loop benchmark, where 0 runs a closed loop
+
+    duration (float)
+        the number of seconds during which requests are sent
+
+    max_requests (int)
+        the maximum number of requests to send, where 0 only stops after the duration
+
+    request_timeout (float)
+        the number of seconds after which a request is counted as failed
+
+    seed (int)
+        the seed of the open-loop arrival times
+
+    Returns
+    -------
+    result (tuple[list[Sample], float])
+        the outcome of every request and the number of seconds the benchmark took
+    """
+    requests = islice(replay_workload(workload), max_requests or None)
+
+    async with ClientSession(
+        connector=TCPConnector(limit=0),
+        timeout=ClientTimeout(total=request_timeout),
+        raise_for_status=False,
+    ) as session:
+        start = perf_counter()
+        deadline = start + duration
+
+        if rate:
+            samples = await run_open_loop(session, url, requests, rate=rate, deadline=deadline, seed=seed)
+
+        else:
+            samples = await run_closed_loop(session, url, requests, concurrency=concurrency, deadline=deadline)
+
+        return samples, perf_counter() - start
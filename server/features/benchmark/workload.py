@@ -0,0 +1,86 @@
+from collections.abc import Iterator, Sequence
+from itertools import count
+from pathlib import Path
+from typing import Literal
+
+from msgspec import Struct
+from msgspec.json import Decoder
+from msgspec.structs import replace
+
+from server.typedefs import Language
+
+type RequestKind = Literal["get", "post", "stream", "language"]
+
+DEFAULT_WORKLOAD = Path(__file__).with_name("workload.jsonl")
+
+
+class WorkloadRequest(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    a single request of a benchmark workload
+
+    Attributes
+    ----------
+    kind (RequestKind)
+        the route to send the request to, either `get`, `post` or `stream` for the translator, or `language`
+
+    text (str)
+        the input to translate or detect the language of
+
+    source (Language)
+        the source language of a translation
+
+    target (Language)
+        the target language of a translation
+    """
+
+    kind: RequestKind
+    text: str
+    source: Language = "eng_Latn"
+    target: Language = "spa_Latn"
+
+
+def load_workload(path: Path) -> list[WorkloadRequest]:
+    """
+    Summary
+    -------
+    read a benchmark workload with one JSON request per line
+
+    Parameters
+    ----------
+    path (Path)
+        the path of the JSONL workload
+
+    Returns
+    -------
+    workload (list[WorkloadRequest])
+        the requests of the workload in order
+    """
+    decoder = Decoder(WorkloadRequest)
+
+    with path.open("rb") as file:
+        return [decoder.decode(line) for line in file if line.strip()]
+
+
+def replay_workload(workload: Sequence[WorkloadRequest]) -> Iterator[WorkloadRequest]:
+    """
+    Summary
+    -------
+    repeat a workload forever, numbering the inputs of every round after the first so that no round is cached
+
+    Parameters
+    ----------
+    workload (Sequence[WorkloadRequest])
+        the requests of the workload in order
+
+    Returns
+    -------
+    requests (Iterator[WorkloadRequest])
+        the requests of every round in order
+    """
+    yield from workload
+
+    for round_number in count(1):
+        for request in workload:
+            yield replace(request, text=f"{request.text} ({round_number})")
@@ -1,2 +1,5 @@
 from server.features.detector.ensemble import get_language_detector as get_language_detector
+from server.features.detector.metrics import detect_duration as detect_duration
+from server.features.detector.metrics import detections as detections
 from server.features.detector.protocol import LanguageDetectorProtocol as LanguageDetectorProtocol
+from server.features.detector.warmup import warm_up_language_detector as warm_up_language_detector
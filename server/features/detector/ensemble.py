@@ -6,7 +6,14 @@ from server.features.detector.stub import LanguageDetectorStub
 from server.utils import huggingface_file_download
 
 
-def get_language_detector(repository: str, *, stub: bool) -> LanguageDetectorProtocol:
+def get_language_detector(
+    repository: str,
+    *,
+    stub: bool,
+    stub_detect_latency: float,
+    stub_fallback_latency: float,
+    stub_fallback_rate: float,
+) -> LanguageDetectorProtocol:
     """
     Summary
     -------
@@ -20,13 +27,26 @@ def get_language_detector(repository: str, *, stub: bool) -> LanguageDetectorPro
     stub (bool)
         whether to return a stub object
 
+    stub_detect_latency (float)
+        the number of seconds every detection of the stub takes
+
+    stub_fallback_latency (float)
+        the number of additional seconds a detection of the stub takes when it falls back to lingua
+
+    stub_fallback_rate (float)
+        the share of inputs for which the stub falls back to lingua
+
     Returns
     -------
     language_detector (LanguageDetectorProtocol)
         the language detector
     """
     if stub:
-        return LanguageDetectorStub()
+        return LanguageDetectorStub(
+            detect_latency=stub_detect_latency,
+            fallback_latency=stub_fallback_latency,
+            fallback_rate=stub_fallback_rate,
+        )
 
     fast_model = fasttext()
     fast_model.loadModel(huggingface_file_download(repository, "model.bin"))
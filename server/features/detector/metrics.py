@@ -0,0 +1,15 @@
+from opentelemetry.metrics import get_meter
+
+meter = get_meter(__name__)
+
+detections = meter.create_counter(
+    "language_detector.detections",
+    "{detection}",
+    "Language detections by whether the fastText prediction fell back to lingua",
+)
+
+detect_duration = meter.create_histogram(
+    "language_detector.detect.duration",
+    "s",
+    "Time spent detecting the language of an input",
+)
@@ -1,4 +1,6 @@
+from time import sleep
 from types import SimpleNamespace
+from zlib import crc32
 
 from language import Prediction
 from server.features.detector.protocol import LanguageDetectorProtocol
@@ -10,12 +12,30 @@ class LanguageDetectorStub(LanguageDetectorProtocol):
     -------
     a stub class for the language detector
 
+    Parameters
+    ----------
+    detect_latency (float)
+        the number of seconds every detection takes
+
+    fallback_latency (float)
+        the number of additional seconds a detection takes when it falls back to lingua
+
+    fallback_rate (float)
+        the share of inputs that fall back to lingua, chosen by a hash of the input so repeats behave the same
+
     Methods
     -------
     detect(text: str, *, fasttext_confidence_threshold: float, lingua_confidence_threshold: float) -> Prediction
         detect the language of the input text
     """
 
+    __slots__ = ("detect_latency", "fallback_latency", "fallback_rate")
+
+    def __init__(self, *, detect_latency: float = 0, fallback_latency: float = 0, fallback_rate: float = 0) -> None:
+        self.detect_latency = detect_latency
+        self.fallback_latency = fallback_latency
+        self.fallback_rate = fallback_rate
+
     def detect(
         self,
         text: str,
@@ -49,4 +69,7 @@ class LanguageDetectorStub(LanguageDetectorProtocol):
             f"lingua_confidence_threshold@{lingua_confidence_threshold}"
         )
 
-        return SimpleNamespace({"language": language, "confidence": 1.0})  # pyright: ignore [reportReturnType]
+        fallback = crc32(text.encode()) / 2**32 < self.fallback_rate
+        sleep(self.detect_latency + self.fallback_latency * fallback)
+
+        return SimpleNamespace({"language": language, "confidence": 1.0, "fallback": fallback})  # pyright: ignore [reportReturnType]
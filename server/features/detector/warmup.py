@@ -0,0 +1,30 @@
+from math import inf
+
+from server.features.detector.protocol import LanguageDetectorProtocol
+
+WARMUP_TEXTS = (
+    "Hello, world!",
+    "The weather is lovely today, so we are going for a walk in the park.",
+    "我是一名软件工程师！",  # noqa: RUF001
+    "Guten Morgen, wie geht es dir?",
+    "Je voudrais un café, s'il vous plaît.",
+)
+
+
+def warm_up_language_detector(language_detector: LanguageDetectorProtocol, *, rounds: int) -> None:
+    """
+    Summary
+    -------
+    detect the language of representative inputs with both models so that the first requests do not pay for it
+
+    Parameters
+    ----------
+    language_detector (LanguageDetectorProtocol)
+        the language detector
+
+    rounds (int)
+        the number of times the representative inputs are detected
+    """
+    for _ in range(rounds):
+        for text in WARMUP_TEXTS:
+            language_detector.detect(text, fasttext_confidence_threshold=inf, lingua_confidence_threshold=0.0)
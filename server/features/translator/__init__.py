@@ -1,2 +1,11 @@
+from server.features.translator.engine import EngineClient as EngineClient
+from server.features.translator.engine import EngineUnavailableError as EngineUnavailableError
+from server.features.translator.engine import RemoteTranslator as RemoteTranslator
+from server.features.translator.engine import TranslatorEngine as TranslatorEngine
 from server.features.translator.nllb import get_translator as get_translator
 from server.features.translator.protocol import TranslatorProtocol as TranslatorProtocol
+from server.features.translator.registry import ModelUnloadedError as ModelUnloadedError
+from server.features.translator.registry import TranslatorRegistry as TranslatorRegistry
+from server.features.translator.registry import get_translator_registry as get_translator_registry
+from server.features.translator.scheduler import DeadlineExceededError as DeadlineExceededError
+from server.features.translator.scheduler import QueueFullError as QueueFullError
@@ -0,0 +1,255 @@
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from logging import getLogger
+from pathlib import Path
+from time import perf_counter
+
+from ctranslate2 import Translator as CTranslator
+from ctranslate2 import get_supported_compute_types
+from tokenizers import Tokenizer
+
+from server.features.translator.cache import TranslationCache
+from server.features.translator.nllb import Translator
+from server.features.translator.protocol import TranslatorProtocol
+from server.typedefs import ComputeTypes, Language
+from server.utils import huggingface_download
+
+AUTOTUNE_COMPUTE_TYPES: tuple[ComputeTypes, ...] = ("int8", "int8_float32", "int16", "float32")
+
+
+def thread_splits(cores: int) -> Iterator[tuple[int, int]]:
+    """
+    Summary
+    -------
+    split the cores between the number of batches decoded in parallel and the threads used by each batch
+
+    Parameters
+    ----------
+    cores (int)
+        the number of cores to split
+
+    Returns
+    -------
+    splits (Iterator[tuple[int, int]])
+        the inter-batch and intra-batch thread counts that use every core
+    """
+    return (
+        (inter_threads, cores // inter_threads) for inter_threads in range(1, cores + 1) if not cores % inter_threads
+    )
+
+
+def candidate_configurations(
+    cores: int,
+    supported_compute_types: Collection[str],
+) -> Iterator[tuple[ComputeTypes, int, int]]:
+    """
+    Summary
+    -------
+    list every supported compute type with every split of the cores between and within batches
+
+    Parameters
+    ----------
+    cores (int)
+        the number of cores available to the translator
+
+    supported_compute_types (Collection[str])
+        the compute types supported on the current host
+
+    Returns
+    -------
+    configurations (Iterator[tuple[ComputeTypes, int, int]])
+        the compute type, inter-batch threads and intra-batch threads of each configuration
+    """
+    logger = getLogger(__name__)
+
+    for compute_type in AUTOTUNE_COMPUTE_TYPES:
+        if compute_type not in supported_compute_types:
+            logger.info("Skipping %s as it is not supported on this host", compute_type)
+            continue
+
+        for inter_threads, intra_threads in thread_splits(cores):
+            yield compute_type, inter_threads, intra_threads
+
+
+def benchmark(
+    translator: TranslatorProtocol,
+    corpus: Sequence[str],
+    source_language: Language,
+    target_language: Language,
+    *,
+    rounds: int,
+) -> float:
+    """
+    Summary
+    -------
+    measure the throughput of a translator over a corpus after a single warmup round
+
+    Parameters
+    ----------
+    translator (TranslatorProtocol)
+        the translator to measure
+
+    corpus (Sequence[str])
+        the inputs to translate
+
+    source_language (Language)
+        the source language of the corpus
+
+    target_language (Language)
+        the target language of the corpus
+
+    rounds (int)
+        the number of times the corpus is translated
+
+    Returns
+    -------
+    throughput (float)
+        the number of source tokens translated per second
+    """
+    translations: list[tuple[str, Language, Language]] = [(text, source_language, target_language) for text in corpus]
+    tokens = sum(translator.count_tokens(text) for text in corpus)
+    translator.translate_batch(translations)
+
+    start = perf_counter()
+
+    for _ in range(rounds):
+        translator.translate_batch(translations)
+
+    return tokens * rounds / (perf_counter() - start)
+
+
+def rank_configurations(
+    configurations: Iterable[tuple[ComputeTypes, int, int]],
+    factory: Callable[[ComputeTypes, int, int], TranslatorProtocol],
+    corpus: Sequence[str],
+    source_language: Language,
+    target_language: Language,
+    *,
+    rounds: int,
+) -> list[tuple[ComputeTypes, int, int, float]]:
+    """
+    Summary
+    -------
+    benchmark a translator for every configuration and rank the configurations by their throughput
+
+    Parameters
+    ----------
+    configurations (Iterable[tuple[ComputeTypes, int, int]])
+        the compute type, inter-batch threads and intra-batch threads of each configuration
+
+    factory (Callable[[ComputeTypes, int, int], TranslatorProtocol])
+        the function that creates the translator of a configuration
+
+    corpus (Sequence[str])
+        the inputs to translate
+
+    source_language (Language)
+        the source language of the corpus
+
+    target_language (Language)
+        the target language of the corpus
+
+    rounds (int)
+        the number of times the corpus is translated for each configuration
+
+    Returns
+    -------
+    results (list[tuple[ComputeTypes, int, int, float]])
+        the compute type, inter-batch threads, intra-batch threads and throughput of each configuration, fastest first
+    """
+    logger = getLogger(__name__)
+    results: list[tuple[ComputeTypes, int, int, float]] = []
+
+    for compute_type, inter_threads, intra_threads in configurations:
+        with factory(compute_type, inter_threads, intra_threads) as translator:
+            throughput = benchmark(translator, corpus, source_language, target_language, rounds=rounds)
+
+        logger.info(
+            "%s with %d inter-batch and %d intra-batch threads: %.1f tokens/s",
+            compute_type,
+            inter_threads,
+            intra_threads,
+            throughput,
+        )
+        results.append((compute_type, inter_threads, intra_threads, throughput))
+
+    return sorted(results, key=lambda result: result[3], reverse=True)
+
+
+def autotune(
+    repository: str,
+    corpus: Sequence[str],
+    source_language: Language,
+    target_language: Language,
+    *,
+    cores: int,
+    rounds: int,
+    batch_window: float,
+    max_batch_tokens: int,
+) -> list[tuple[ComputeTypes, int, int, float]]:
+    """
+    Summary
+    -------
+    benchmark every supported compute type and split of the cores between and within batches on the current host
+
+    Parameters
+    ----------
+    repository (str)
+        the repository to download the model from
+
+    corpus (Sequence[str])
+        the inputs to translate
+
+    source_language (Language)
+        the source language of the corpus
+
+    target_language (Language)
+        the target language of the corpus
+
+    cores (int)
+        the number of cores available to the translator
+
+    rounds (int)
+        the number of times the corpus is translated for each configuration
+
+    batch_window (float)
+        the number of seconds to wait for concurrent requests before dispatching a batch
+
+    max_batch_tokens (int)
+        the maximum number of padded source tokens in a batch
+
+    Returns
+    -------
+    results (list[tuple[ComputeTypes, int, int, float]])
+        the compute type, inter-batch threads, intra-batch threads and throughput of each configuration, fastest first
+    """
+    model_path = huggingface_download(repository)
+    tokeniser = Tokenizer.from_file(str(Path(model_path) / "tokenizer.json"))
+
+    def factory(compute_type: ComputeTypes, inter_threads: int, intra_threads: int) -> Translator:
+        translator = CTranslator(
+            model_path,
+            "cpu",
+            compute_type=compute_type,
+            inter_threads=inter_threads,
+            intra_threads=intra_threads,
+        )
+
+        return Translator(
+            translator,
+            tokeniser,
+            TranslationCache(0),
+            use_cuda=False,
+            workers=inter_threads,
+            batch_window=batch_window,
+            max_batch_tokens=max_batch_tokens,
+            max_pending_tokens=0,
+        )
+
+    return rank_configurations(
+        candidate_configurations(cores, get_supported_compute_types("cpu")),
+        factory,
+        corpus,
+        source_language,
+        target_language,
+        rounds=rounds,
+    )
@@ -0,0 +1,121 @@
+from math import ceil
+
+from opentelemetry.metrics import get_meter
+
+MAX_DECODING_LENGTH = 1024
+MIN_DECODING_LENGTH = 16
+DEFAULT_LENGTH_RATIO = 1.5
+LENGTH_RATIO_SMOOTHING = 0.05
+
+DEGENERATE_WINDOW = 32
+DEGENERATE_DISTINCT_TOKENS = 4
+
+decoding_stops = get_meter(__name__).create_counter(
+    "translator.decoding.stops",
+    "{job}",
+    "Translations stopped early for exceeding their decoding budget or degenerating",
+)
+
+
+def is_degenerate(token_ids: list[int], token_count: int) -> bool:
+    """
+    Summary
+    -------
+    check whether a generation has degenerated into a loop over a handful of tokens
+
+    Parameters
+    ----------
+    token_ids (list[int])
+        the token indices generated so far
+
+    token_count (int)
+        the number of source tokens
+
+    Returns
+    -------
+    degenerate (bool)
+        whether the generation is longer than its source and its most recent tokens barely vary
+    """
+    return (
+        len(token_ids) > max(token_count, DEGENERATE_WINDOW)
+        and len(set(token_ids[-DEGENERATE_WINDOW:])) <= DEGENERATE_DISTINCT_TOKENS
+    )
+
+
+class DecodingBudget:
+    """
+    Summary
+    -------
+    learn the output-to-input length ratio of each language pair to bound the number of tokens a job may generate
+
+    Parameters
+    ----------
+    margin (float)
+        the multiple of the expected output length that a job may generate, where 0 disables the budget
+
+    Methods
+    -------
+    limit(token_count: int, source_language: str, target_language: str) -> int
+        get the maximum number of tokens a job may generate
+
+    observe(token_count: int, generated_count: int, source_language: str, target_language: str) -> None
+        update the length ratio of a language pair with a job that finished on its own
+    """
+
+    __slots__ = ("margin", "ratios")
+
+    def __init__(self, margin: float) -> None:
+        self.margin = margin
+        self.ratios: dict[tuple[str, str], float] = {}
+
+    def limit(self, token_count: int, source_language: str, target_language: str) -> int:
+        """
+        Summary
+        -------
+        get the maximum number of tokens a job may generate
+
+        Parameters
+        ----------
+        token_count (int)
+            the number of source tokens
+
+        source_language (str)
+            the source language token
+
+        target_language (str)
+            the target language token
+
+        Returns
+        -------
+        max_length (int)
+            the decoding budget of the job
+        """
+        if not self.margin:
+            return MAX_DECODING_LENGTH
+
+        ratio = self.ratios.get((source_language, target_language), DEFAULT_LENGTH_RATIO)
+        return min(MAX_DECODING_LENGTH, MIN_DECODING_LENGTH + ceil(self.margin * ratio * token_count))
+
+    def observe(self, token_count: int, generated_count: int, source_language: str, target_language: str) -> None:
+        """
+        Summary
+        -------
+        update the length ratio of a language pair with a job that finished on its own
+
+        Parameters
+        ----------
+        token_count (int)
+            the number of source tokens
+
+        generated_count (int)
+            the number of generated tokens
+
+        source_language (str)
+            the source language token
+
+        target_language (str)
+            the target language token
+        """
+        pair = (source_language, target_language)
+        ratio = self.ratios.get(pair, DEFAULT_LENGTH_RATIO)
+        self.ratios[pair] = ratio + LENGTH_RATIO_SMOOTHING * (generated_count / token_count - ratio)
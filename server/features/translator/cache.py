@@ -0,0 +1,170 @@
+from collections import OrderedDict
+from threading import Lock
+from time import perf_counter
+from unicodedata import normalize
+
+from server.features.translator.metrics import cache_lookups
+from server.stores import SQLiteCache
+from server.telemetry import record_duration
+from server.typedefs import Language
+
+ENTRY_OVERHEAD = 128
+
+
+class TranslationCache:
+    """
+    Summary
+    -------
+    a thread-safe least-recently-used translation cache bounded by the size of its entries in bytes
+
+    Parameters
+    ----------
+    max_bytes (int)
+        the maximum number of bytes the cached keys and translations may occupy in memory, where 0 disables it
+
+    namespace (str)
+        a value that identifies the decoding parameters, so that translations decoded differently never collide
+
+    shared (SQLiteCache?)
+        an on-disk cache shared by every worker on the host, consulted when a translation is not in memory
+
+    Methods
+    -------
+    key(text: str, source_language: Language, target_language: Language) -> str
+        create the cache key for a translation
+
+    get(key: str) -> str | None
+        get a cached translation and mark it as recently used
+
+    put(key: str, translation: str) -> None
+        cache a translation and evict the least recently used translations that no longer fit
+
+    put_local(key: str, translation: str) -> None
+        cache a translation in memory only
+    """
+
+    __slots__ = ("entries", "lock", "max_bytes", "namespace", "shared", "size")
+
+    def __init__(self, max_bytes: int, *, namespace: str = "", shared: SQLiteCache | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.shared = shared
+        self.entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self.lock = Lock()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def key(self, text: str, source_language: Language, target_language: Language) -> str:
+        """
+        Summary
+        -------
+        create the cache key for a translation
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Language)
+            the source language
+
+        target_language (Language)
+            the target language
+
+        Returns
+        -------
+        key (str)
+            the cache key of the whitespace and Unicode normalised input
+        """
+        normalised_text = " ".join(normalize("NFC", text).split())
+        return f"{self.namespace}\0{source_language}\0{target_language}\0{normalised_text}"
+
+    def get(self, key: str) -> str | None:
+        """
+        Summary
+        -------
+        get a cached translation and mark it as recently used
+
+        Parameters
+        ----------
+        key (str)
+            the cache key
+
+        Returns
+        -------
+        translation (str?)
+            the cached translation, if any
+        """
+        start = perf_counter()
+
+        try:
+            if self.max_bytes:
+                with self.lock:
+                    if (entry := self.entries.get(key)) is not None:
+                        self.entries.move_to_end(key)
+                        cache_lookups.add(1, {"result": "hit", "store": "memory"})
+                        return entry[0]
+
+            if self.shared is None or (value := self.shared.get(key)) is None:
+                cache_lookups.add(1, {"result": "miss"})
+                return None
+
+            translation = value.decode()
+            self.put_local(key, translation)
+            cache_lookups.add(1, {"result": "hit", "store": "shared"})
+
+            return translation
+
+        finally:
+            record_duration("cache", perf_counter() - start)
+
+    def put(self, key: str, translation: str) -> None:
+        """
+        Summary
+        -------
+        cache a translation and evict the least recently used translations that no longer fit
+
+        Parameters
+        ----------
+        key (str)
+            the cache key
+
+        translation (str)
+            the translation to cache
+        """
+        self.put_local(key, translation)
+
+        if self.shared is not None:
+            self.shared.set(key, translation.encode())
+
+    def put_local(self, key: str, translation: str) -> None:
+        """
+        Summary
+        -------
+        cache a translation in memory only
+
+        Parameters
+        ----------
+        key (str)
+            the cache key
+
+        translation (str)
+            the translation to cache
+        """
+        cost = len(key.encode()) + len(translation.encode()) + ENTRY_OVERHEAD
+
+        if cost > self.max_bytes:
+            return
+
+        with self.lock:
+            if (entry := self.entries.pop(key, None)) is not None:
+                self.size -= entry[1]
+
+            while self.entries and self.size + cost > self.max_bytes:
+                _, (_, evicted_cost) = self.entries.popitem(last=False)
+                self.size -= evicted_cost
+
+            self.entries[key] = (translation, cost)
+            self.size += cost
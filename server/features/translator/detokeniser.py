@@ -0,0 +1,104 @@
+from tokenizers import Tokenizer
+
+WORD_BOUNDARY = "▁"
+UNSPACED_SCRIPTS_START = "⺀"
+INCOMPLETE_CHARACTER = "�"
+
+
+class Detokeniser:
+    """
+    Summary
+    -------
+    an incremental detokeniser that only decodes completed words or characters of a token stream
+
+    Parameters
+    ----------
+    tokeniser (Tokenizer)
+        the SentencePiece tokeniser
+
+    max_pending_tokens (int)
+        the maximum number of tokens to hold back before decoding without a boundary
+
+    Methods
+    -------
+    step(token_id: int, token: str) -> str
+        add a generated token and return any newly completed text
+
+    flush(final: bool) -> str
+        decode all pending tokens
+    """
+
+    __slots__ = ("max_pending_tokens", "pending_token_ids", "separator", "started", "tokeniser")
+
+    def __init__(self, tokeniser: Tokenizer, *, max_pending_tokens: int = 16) -> None:
+        self.tokeniser = tokeniser
+        self.max_pending_tokens = max_pending_tokens
+        self.pending_token_ids: list[int] = []
+        self.separator = ""
+        self.started = False
+
+    def step(self, token_id: int, token: str) -> str:
+        """
+        Summary
+        -------
+        add a generated token and return any newly completed text
+
+        Parameters
+        ----------
+        token_id (int)
+            the generated token index
+
+        token (str)
+            the generated token string
+
+        Returns
+        -------
+        text (str)
+            the newly completed text, empty if the pending tokens do not form a complete word or character yet
+        """
+        text = ""
+        is_word_boundary = token.startswith(WORD_BOUNDARY)
+
+        if self.pending_token_ids and (
+            is_word_boundary
+            or token >= UNSPACED_SCRIPTS_START
+            or len(self.pending_token_ids) >= self.max_pending_tokens
+        ):
+            text = self.flush()
+
+        if not self.pending_token_ids:
+            self.separator = " " if is_word_boundary and self.started else ""
+
+        self.pending_token_ids.append(token_id)
+        return text
+
+    def flush(self, *, final: bool = False) -> str:
+        """
+        Summary
+        -------
+        decode all pending tokens
+
+        Parameters
+        ----------
+        final (bool)
+            whether this is the end of the stream, in which case incomplete characters are also emitted
+
+        Returns
+        -------
+        text (str)
+            the decoded text, including the word separator that SentencePiece strips from the first token
+        """
+        text = self.tokeniser.decode(self.pending_token_ids)
+
+        if not final and text.endswith(INCOMPLETE_CHARACTER):
+            return ""
+
+        self.pending_token_ids.clear()
+
+        if not text:
+            return ""
+
+        text = f"{self.separator}{text}"
+        self.started = True
+
+        return text
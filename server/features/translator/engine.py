@@ -0,0 +1,1182 @@
+from asyncio import (
+    CancelledError,
+    Event,
+    IncompleteReadError,
+    Queue,
+    StreamReader,
+    StreamWriter,
+    Task,
+    create_task,
+    open_unix_connection,
+    sleep,
+    start_unix_server,
+    to_thread,
+)
+from collections.abc import AsyncGenerator, Iterator, Sequence
+from contextlib import aclosing, suppress
+from functools import partial
+from itertools import count
+from pathlib import Path
+from socket import AF_UNIX, SOCK_STREAM, socket
+from typing import Self
+
+from msgspec import Struct, convert
+from msgspec.msgpack import Decoder, Encoder
+
+from server.features.translator.protocol import TranslatorProtocol
+from server.features.translator.registry import ModelUnloadedError, TranslatorRegistry
+from server.features.translator.scheduler import DeadlineExceededError, QueueFullError
+from server.typedefs import Language, Priority
+
+RESULT, CHUNK, END, ERROR = range(4)
+
+CONNECT_INTERVAL = 0.5
+
+
+class Request(Struct, tag=True, array_like=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the base of every request sent from an HTTP worker to the translator engine
+
+    Attributes
+    ----------
+    model (str)
+        the repository of the model
+    """
+
+    model: str
+
+
+class TranslationRequest(Request, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the base of the requests that translate a single input
+
+    Attributes
+    ----------
+    text (str)
+        the input to translate
+
+    source_language (Language)
+        the source language of the input
+
+    target_language (Language)
+        the target language of the input
+
+    segment (bool)
+        whether to split the input into sentences and translate them as a batch
+
+    priority (Priority)
+        the priority class of the translation
+
+    client (str)
+        the client that the translation is fairly scheduled against
+
+    deadline (float?)
+        the monotonic time after which the translation is abandoned, if any
+    """
+
+    text: str
+    source_language: Language
+    target_language: Language
+    segment: bool
+    priority: Priority
+    client: str
+    deadline: float | None
+
+
+class Translate(TranslationRequest, frozen=True, gc=False): ...
+
+
+class TranslateStream(TranslationRequest, frozen=True, gc=False): ...
+
+
+class TranslateBatch(Request, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    a request to translate a batch of inputs
+
+    Attributes
+    ----------
+    translations (list[tuple[str, Language, Language]])
+        the inputs to translate with their source and target languages
+
+    priority (Priority)
+        the priority class of the translations
+
+    client (str)
+        the client that the translations are fairly scheduled against
+
+    deadline (float?)
+        the monotonic time after which the translations are abandoned, if any
+    """
+
+    translations: list[tuple[str, Language, Language]]
+    priority: Priority
+    client: str
+    deadline: float | None
+
+
+class CountTokens(Request, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    a request to count the number of tokens in the input text
+
+    Attributes
+    ----------
+    text (str)
+        the input text
+    """
+
+    text: str
+
+
+class QueueStatus(Request, frozen=True, gc=False): ...
+
+
+class UnloadModel(Request, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    a request to unload the model from the current device
+
+    Attributes
+    ----------
+    to_cpu (bool)
+        whether to unload the model to CPU
+
+    idle_only (bool)
+        whether to leave the model loaded if any job is waiting for, or undergoing, decoding
+    """
+
+    to_cpu: bool
+    idle_only: bool = False
+
+
+class LoadModel(Request, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    a request to load the model back to the initial device
+
+    Attributes
+    ----------
+    keep_cache (bool)
+        whether to keep the model cache in RAM
+    """
+
+    keep_cache: bool
+
+
+class Cancel(Request, frozen=True, gc=False): ...
+
+
+type Message = (
+    Translate | TranslateStream | TranslateBatch | CountTokens | QueueStatus | UnloadModel | LoadModel | Cancel
+)
+
+encoder = Encoder()
+request_decoder = Decoder(tuple[int, Message])
+response_decoder = Decoder(tuple[int, int, object])
+
+
+def pack(message: tuple[int, Message] | tuple[int, int, object]) -> bytes:
+    """
+    Summary
+    -------
+    encode a message into a length-prefixed frame
+
+    Parameters
+    ----------
+    message (tuple[int, Message] | tuple[int, int, object])
+        the request or response to encode
+
+    Returns
+    -------
+    frame (bytes)
+        the length-prefixed frame
+    """
+    payload = encoder.encode(message)
+    return len(payload).to_bytes(4) + payload
+
+
+async def read_frame[T](reader: StreamReader, decoder: Decoder[T]) -> T | None:
+    """
+    Summary
+    -------
+    read and decode the next length-prefixed frame from a stream
+
+    Parameters
+    ----------
+    reader (StreamReader)
+        the stream to read from
+
+    decoder (Decoder[T])
+        the decoder of the frame
+
+    Returns
+    -------
+    message (T?)
+        the decoded message, or None if the stream has ended or was reset
+    """
+    try:
+        size = int.from_bytes(await reader.readexactly(4))
+        return decoder.decode(await reader.readexactly(size))
+
+    except IncompleteReadError, ConnectionResetError:
+        return None
+
+
+class EngineUnavailableError(Exception):
+    """
+    Summary
+    -------
+    raised when the translator engine cannot be reached, such as while it is restarting
+    """
+
+    def __init__(self) -> None:
+        super().__init__("the translator engine is unavailable")
+
+
+def engine_error(payload: object) -> Exception:
+    """
+    Summary
+    -------
+    rebuild an exception raised by the translator engine
+
+    Parameters
+    ----------
+    payload (object)
+        the name of the exception followed by its details
+
+    Returns
+    -------
+    error (Exception)
+        the exception to raise in the worker
+    """
+    name, *details = convert(payload, list[str | int])
+
+    if name == QueueFullError.__name__:
+        retry_after, pending_tokens = convert(details, tuple[int, int])
+        return QueueFullError(retry_after=retry_after, pending_tokens=pending_tokens)
+
+    if name == EngineUnavailableError.__name__:
+        return EngineUnavailableError()
+
+    if name == DeadlineExceededError.__name__:
+        return DeadlineExceededError()
+
+    if name == ModelUnloadedError.__name__:
+        return ModelUnloadedError()
+
+    return RuntimeError(f"{name}: {details[0]}")
+
+
+class TranslatorEngine:
+    """
+    Summary
+    -------
+    an engine that serves the translator models of a registry to every HTTP worker over a Unix socket
+
+    Parameters
+    ----------
+    translators (TranslatorRegistry)
+        the registry of translator models loaded in this process
+
+    Methods
+    -------
+    call(request: Message) -> object
+        answer a request that has a single result
+
+    serve(path: str) -> None
+        serve the translator models on a Unix socket until cancelled
+    """
+
+    __slots__ = ("translators",)
+
+    def __init__(self, translators: TranslatorRegistry) -> None:
+        self.translators = translators
+
+    async def call(self, request: Message) -> object:
+        """
+        Summary
+        -------
+        answer a request that has a single result
+
+        Parameters
+        ----------
+        request (Message)
+            the request
+
+        Returns
+        -------
+        result (object)
+            the result of the request
+        """
+        match request:
+            case Translate():
+                translator = await self.translators.get_async(request.model)
+                return await translator.translate_async(
+                    request.text,
+                    request.source_language,
+                    request.target_language,
+                    segment=request.segment,
+                    priority=request.priority,
+                    client=request.client,
+                    deadline=request.deadline,
+                )
+
+            case TranslateBatch():
+                translator = await self.translators.get_async(request.model)
+                return await translator.translate_batch_async(
+                    request.translations,
+                    priority=request.priority,
+                    client=request.client,
+                    deadline=request.deadline,
+                )
+
+            case CountTokens():
+                return self.translators.peek(request.model).count_tokens(request.text)
+
+            case QueueStatus():
+                return self.translators.peek(request.model).queue_status()
+
+            case UnloadModel():
+                unload = (
+                    partial(self.translators.peek(request.model).unload_model, idle_only=True)
+                    if request.idle_only
+                    else partial(self.translators.unload, request.model)
+                )
+
+                return await to_thread(unload, to_cpu=request.to_cpu)
+
+            case LoadModel():
+                return await to_thread(self.translators.load, request.model, keep_cache=request.keep_cache)
+
+            case _:
+                raise ValueError(type(request).__name__)
+
+    async def stream(self, writer: StreamWriter, request_id: int, request: TranslateStream) -> None:
+        """
+        Summary
+        -------
+        stream the chunks of a translation to a worker as they are decoded
+
+        Parameters
+        ----------
+        writer (StreamWriter)
+            the connection of the worker
+
+        request_id (int)
+            the ID of the request
+
+        request (TranslateStream)
+            the request
+        """
+        translator = await self.translators.get_async(request.model)
+        chunks = translator.translate_stream_async(
+            request.text,
+            request.source_language,
+            request.target_language,
+            segment=request.segment,
+            priority=request.priority,
+            client=request.client,
+            deadline=request.deadline,
+        )
+
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                writer.write(pack((request_id, CHUNK, chunk)))
+                await writer.drain()
+
+        writer.write(pack((request_id, END, None)))
+
+    async def dispatch(self, writer: StreamWriter, request_id: int, request: Message) -> None:
+        """
+        Summary
+        -------
+        answer a request and send any exception it raises back to the worker
+
+        Parameters
+        ----------
+        writer (StreamWriter)
+            the connection of the worker
+
+        request_id (int)
+            the ID of the request
+
+        request (Message)
+            the request
+        """
+        try:
+            if isinstance(request, TranslateStream):
+                await self.stream(writer, request_id, request)
+                return
+
+            result = await self.call(request)
+
+        except QueueFullError as error:
+            writer.write(pack((request_id, ERROR, (QueueFullError.__name__, error.retry_after, error.pending_tokens))))
+
+        except Exception as error:  # noqa: BLE001
+            writer.write(pack((request_id, ERROR, (type(error).__name__, str(error)))))
+
+        else:
+            writer.write(pack((request_id, RESULT, result)))
+
+    async def handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """
+        Summary
+        -------
+        answer the requests of a worker concurrently until it disconnects
+
+        Parameters
+        ----------
+        reader (StreamReader)
+            the incoming side of the connection
+
+        writer (StreamWriter)
+            the outgoing side of the connection
+        """
+        tasks: dict[int, Task[None]] = {}
+
+        try:
+            while (frame := await read_frame(reader, request_decoder)) is not None:
+                request_id, request = frame
+
+                if isinstance(request, Cancel):
+                    if task := tasks.get(request_id):
+                        task.cancel()
+
+                    continue
+
+                tasks[request_id] = task = create_task(self.dispatch(writer, request_id, request))
+                task.add_done_callback(lambda _, request_id=request_id: tasks.pop(request_id, None))
+
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+            writer.close()
+
+    async def serve(self, path: str) -> None:
+        """
+        Summary
+        -------
+        serve the translator models on a Unix socket until cancelled
+
+        Parameters
+        ----------
+        path (str)
+            the path of the Unix socket
+        """
+        await to_thread(Path(path).unlink, missing_ok=True)
+
+        async with await start_unix_server(self.handle, path) as server:
+            await server.serve_forever()
+
+
+class EngineClient:
+    """
+    Summary
+    -------
+    a connection from an HTTP worker to the translator engine that reconnects whenever the engine restarts
+
+    Parameters
+    ----------
+    path (str)
+        the path of the Unix socket of the engine
+
+    Methods
+    -------
+    request(request: Message, result_type: type[T]) -> T
+        send a request to the engine and wait for its result
+
+    stream(request: TranslateStream) -> AsyncGenerator[str]
+        send a translation stream request to the engine and stream its chunks
+
+    request_sync(request: Message, result_type: type[T]) -> T
+        send a request to the engine from a thread over a dedicated connection
+
+    stream_sync(request: TranslateStream) -> Iterator[str]
+        send a translation stream request to the engine from a thread over a dedicated connection
+    """
+
+    __slots__ = ("connected", "connection", "path", "reader", "requests", "sequence", "writer")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.sequence = count()
+        self.requests: dict[int, Queue[tuple[int, object]]] = {}
+        self.connected = Event()
+
+    async def __aenter__(self) -> Self:
+        self.connection = create_task(self.connect())
+        await self.connected.wait()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        self.connection.cancel()
+
+        with suppress(CancelledError):
+            await self.connection
+
+    async def connect(self) -> None:
+        """
+        Summary
+        -------
+        keep a connection to the engine open, reconnecting whenever the engine restarts
+        """
+        while True:
+            try:
+                self.reader, self.writer = await open_unix_connection(self.path)
+
+            except FileNotFoundError, ConnectionRefusedError:
+                await sleep(CONNECT_INTERVAL)
+                continue
+
+            self.connected.set()
+
+            try:
+                await self.receive()
+
+            finally:
+                self.connected.clear()
+                self.writer.close()
+
+    async def receive(self) -> None:
+        """
+        Summary
+        -------
+        route every response of the engine to the request waiting for it until the connection is lost
+        """
+        try:
+            while (response := await read_frame(self.reader, response_decoder)) is not None:
+                request_id, kind, payload = response
+
+                if queue := self.requests.get(request_id):
+                    queue.put_nowait((kind, payload))
+
+        finally:
+            for queue in self.requests.values():
+                queue.put_nowait((ERROR, (EngineUnavailableError.__name__,)))
+
+    async def exchange(self, request: Message) -> AsyncGenerator[object]:
+        """
+        Summary
+        -------
+        send a request to the engine and yield its responses, cancelling it if the exchange is abandoned
+
+        Parameters
+        ----------
+        request (Message)
+            the request
+
+        Returns
+        -------
+        payloads (AsyncGenerator[object])
+            the streamed chunks, or the single result of the request
+
+        Raises
+        ------
+        EngineUnavailableError
+            when the engine cannot be reached
+        """
+        if not self.connected.is_set():
+            raise EngineUnavailableError
+
+        request_id = next(self.sequence)
+        self.requests[request_id] = queue = Queue[tuple[int, object]]()
+        finished = False
+
+        try:
+            self.writer.write(pack((request_id, request)))
+
+            while True:
+                kind, payload = await queue.get()
+                finished = kind != CHUNK
+
+                if kind == ERROR:
+                    raise engine_error(payload)
+
+                if kind == END:
+                    return
+
+                yield payload
+
+                if finished:
+                    return
+
+        finally:
+            del self.requests[request_id]
+
+            if not finished and self.connected.is_set():
+                self.writer.write(pack((request_id, Cancel(request.model))))
+
+    async def request[T](self, request: Message, result_type: type[T]) -> T:
+        """
+        Summary
+        -------
+        send a request to the engine and wait for its result
+
+        Parameters
+        ----------
+        request (Message)
+            the request
+
+        result_type (type[T])
+            the type of the result
+
+        Returns
+        -------
+        result (T)
+            the result of the request
+        """
+        async with aclosing(self.exchange(request)) as payloads:
+            return convert(await anext(payloads), result_type)
+
+    async def stream(self, request: TranslateStream) -> AsyncGenerator[str]:
+        """
+        Summary
+        -------
+        send a translation stream request to the engine and stream its chunks
+
+        Parameters
+        ----------
+        request (TranslateStream)
+            the request
+
+        Returns
+        -------
+        chunks (AsyncGenerator[str])
+            the chunks of the translation
+        """
+        async with aclosing(self.exchange(request)) as payloads:
+            async for payload in payloads:
+                yield convert(payload, str)
+
+    def exchange_sync(self, request: Message) -> Iterator[object]:
+        """
+        Summary
+        -------
+        send a request to the engine from a thread over a dedicated connection and yield its responses
+
+        Parameters
+        ----------
+        request (Message)
+            the request
+
+        Returns
+        -------
+        payloads (Iterator[object])
+            the streamed chunks, or the single result of the request
+
+        Raises
+        ------
+        EngineUnavailableError
+            when the engine cannot be reached
+        """
+        with socket(AF_UNIX, SOCK_STREAM) as connection:
+            try:
+                connection.connect(self.path)
+
+            except FileNotFoundError, ConnectionRefusedError:
+                raise EngineUnavailableError from None
+
+            connection.sendall(pack((0, request)))
+
+            with connection.makefile("rb") as file:
+                while True:
+                    if not (header := file.read(4)):
+                        raise EngineUnavailableError
+
+                    _, kind, payload = response_decoder.decode(file.read(int.from_bytes(header)))
+
+                    if kind == ERROR:
+                        raise engine_error(payload)
+
+                    if kind == END:
+                        return
+
+                    yield payload
+
+                    if kind == RESULT:
+                        return
+
+    def request_sync[T](self, request: Message, result_type: type[T]) -> T:
+        """
+        Summary
+        -------
+        send a request to the engine from a thread over a dedicated connection
+
+        Parameters
+        ----------
+        request (Message)
+            the request
+
+        result_type (type[T])
+            the type of the result
+
+        Returns
+        -------
+        result (T)
+            the result of the request
+        """
+        return convert(next(self.exchange_sync(request)), result_type)
+
+    def stream_sync(self, request: TranslateStream) -> Iterator[str]:
+        """
+        Summary
+        -------
+        send a translation stream request to the engine from a thread over a dedicated connection
+
+        Parameters
+        ----------
+        request (TranslateStream)
+            the request
+
+        Returns
+        -------
+        chunks (Iterator[str])
+            the chunks of the translation
+        """
+        return (convert(payload, str) for payload in self.exchange_sync(request))
+
+
+class RemoteTranslator(TranslatorProtocol):
+    """
+    Summary
+    -------
+    a translator that forwards every call to a model loaded in the translator engine
+
+    Parameters
+    ----------
+    client (EngineClient)
+        the connection to the translator engine
+
+    model (str)
+        the repository of the model in the engine
+
+    Methods
+    -------
+    translate(text: str, source_language: Language, target_language: Language, *, segment: bool) -> str
+        translate the input from the source language to the target language
+
+    translate_stream(text: str, source_language: Language, target_language: Language, *, segment: bool) -> Iterator[str]
+        streams the translation input from the source language to the target language
+
+    translate_batch(translations: Sequence[tuple[str, Language, Language]]) -> list[str]
+        translate a batch of inputs, each from its own source language to its own target language
+
+    translate_async(text: str, source_language: Language, target_language: Language, *, segment: bool) -> str
+        translate the input without blocking a thread
+
+    translate_stream_async(text: str, source_language: Language, target_language: Language, *, segment: bool)
+        streams the translation of the input without blocking a thread
+
+    translate_batch_async(translations: Sequence[tuple[str, Language, Language]]) -> list[str]
+        translate a batch of inputs without blocking a thread
+
+    unload_model(to_cpu: bool, idle_only: bool) -> bool
+        unload the model from the current device
+
+    load_model(keep_cache: bool) -> bool
+        load the model back to the initial device
+
+    model_is_loaded() -> bool
+        always true, as the translator engine loads its own models back when they are requested
+
+    warm_up(translations: Sequence[tuple[str, Language, Language]], *, rounds: int) -> None
+        does nothing, as the translator engine warms its models up before accepting connections
+
+    count_tokens(text: str) -> int
+        count the number of tokens in the input text
+
+    queue_status() -> tuple[int, int, float, float]
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
+    """
+
+    __slots__ = ("client", "model")
+
+    def __init__(self, client: EngineClient, model: str) -> None:
+        self.client = client
+        self.model = model
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
+    def unload_model(self, *, to_cpu: bool, idle_only: bool = False) -> bool:
+        """
+        Summary
+        -------
+        unload the model from the current device
+
+        Parameters
+        ----------
+        to_cpu (bool)
+            whether to unload the model to CPU
+
+        idle_only (bool)
+            whether to leave the model loaded if any job is waiting for, or undergoing, decoding
+
+        Returns
+        -------
+        success (bool)
+            whether the model unload was executed
+        """
+        return self.client.request_sync(UnloadModel(self.model, to_cpu, idle_only), bool)
+
+    def load_model(self, *, keep_cache: bool) -> bool:
+        """
+        Summary
+        -------
+        load the model back to the initial device
+
+        Parameters
+        ----------
+        keep_cache (bool)
+            whether to keep the model cache in RAM
+
+        Returns
+        -------
+        success (bool)
+            whether the model load was executed
+        """
+        return self.client.request_sync(LoadModel(self.model, keep_cache), bool)
+
+    def model_is_loaded(self) -> bool:
+        """
+        Summary
+        -------
+        check whether the model is loaded on its device
+
+        Returns
+        -------
+        loaded (bool)
+            always true, as the translator engine loads its own models back when they are requested
+        """
+        return True
+
+    def warm_up(self, translations: Sequence[tuple[str, Language, Language]], *, rounds: int) -> None:
+        """
+        Summary
+        -------
+        does nothing, as the translator engine warms its models up before accepting connections
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the representative inputs with their source and target languages
+
+        rounds (int)
+            the number of times the representative inputs are translated
+        """
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Summary
+        -------
+        count the number of tokens in the input text
+
+        Parameters
+        ----------
+        text (str)
+            the input text
+
+        Returns
+        -------
+        token_count (int)
+            the number of tokens that will be sent to the translator
+        """
+        return self.client.request_sync(CountTokens(self.model, text), int)
+
+    def queue_status(self) -> tuple[int, int, float, float]:
+        """
+        Summary
+        -------
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
+
+        Returns
+        -------
+        pending_jobs (int)
+            the number of jobs waiting for, or undergoing, decoding
+
+        pending_tokens (int)
+            the number of source tokens waiting for, or undergoing, decoding
+
+        estimated_wait (float)
+            the estimated number of seconds before a new job finishes decoding
+
+        throughput (float)
+            the recent decoding throughput in source tokens per second
+        """
+        return self.client.request_sync(QueueStatus(self.model), tuple[int, int, float, float])
+
+    def translate(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> str:
+        """
+        Summary
+        -------
+        translate the input from the source language to the target language
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (str)
+            the translated text
+        """
+        request = Translate(self.model, text, source_language, target_language, segment, priority, client, deadline)
+        return self.client.request_sync(request, str)
+
+    def translate_stream(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> Iterator[str]:
+        """
+        Summary
+        -------
+        streams the translation input from the source language to the target language
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (Iterator[str])
+            the translated text
+        """
+        request = TranslateStream(
+            self.model, text, source_language, target_language, segment, priority, client, deadline
+        )
+        return self.client.stream_sync(request)
+
+    def translate_batch(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> list[str]:
+        """
+        Summary
+        -------
+        translate a batch of inputs, each from its own source language to its own target language
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_texts (list[str])
+            the translated texts in the same order as the inputs
+        """
+        request = TranslateBatch(self.model, list(translations), priority, client, deadline)
+        return self.client.request_sync(request, list[str])
+
+    async def translate_async(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> str:
+        """
+        Summary
+        -------
+        translate the input without blocking a thread
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (str)
+            the translated text
+        """
+        request = Translate(self.model, text, source_language, target_language, segment, priority, client, deadline)
+        return await self.client.request(request, str)
+
+    def translate_stream_async(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> AsyncGenerator[str]:
+        """
+        Summary
+        -------
+        streams the translation of the input without blocking a thread
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (AsyncGenerator[str])
+            the translated text
+        """
+        request = TranslateStream(
+            self.model, text, source_language, target_language, segment, priority, client, deadline
+        )
+        return self.client.stream(request)
+
+    async def translate_batch_async(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> list[str]:
+        """
+        Summary
+        -------
+        translate a batch of inputs without blocking a thread
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_texts (list[str])
+            the translated texts in the same order as the inputs
+        """
+        request = TranslateBatch(self.model, list(translations), priority, client, deadline)
+        return await self.client.request(request, list[str])
@@ -0,0 +1,51 @@
+from opentelemetry.metrics import get_meter
+
+meter = get_meter(__name__)
+
+source_tokens = meter.create_counter(
+    "translator.tokens.source",
+    "{token}",
+    "Source tokens decoded by language pair",
+)
+
+target_tokens = meter.create_counter(
+    "translator.tokens.target",
+    "{token}",
+    "Target tokens generated by language pair",
+)
+
+queue_wait = meter.create_histogram(
+    "translator.queue.wait",
+    "s",
+    "Time a translation job waits in the queue before its batch starts decoding",
+)
+
+tokenise_duration = meter.create_histogram(
+    "translator.tokenise.duration",
+    "s",
+    "Time spent tokenising inputs",
+)
+
+generate_duration = meter.create_histogram(
+    "translator.generate.duration",
+    "s",
+    "Time spent generating a batch with CTranslate2",
+)
+
+detokenise_duration = meter.create_histogram(
+    "translator.detokenise.duration",
+    "s",
+    "Time spent detokenising generated tokens",
+)
+
+batch_size = meter.create_histogram(
+    "translator.batch.size",
+    "{job}",
+    "Number of translation jobs decoded together in a batch",
+)
+
+cache_lookups = meter.create_counter(
+    "translator.cache.lookups",
+    "{lookup}",
+    "Translation cache lookups by result and store",
+)
@@ -1,15 +1,73 @@
-from collections.abc import Iterator
+from asyncio import CancelledError, Task, create_task, shield
+from collections.abc import AsyncGenerator, Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from functools import partial
+from os import environ
 from pathlib import Path
-from typing import Self
+from re import compile as compile_regex
+from threading import Lock
+from time import perf_counter
+from typing import Any, Self
 
 from ctranslate2 import Translator as CTranslator
+from litestar.concurrency import sync_to_thread
+from opentelemetry.trace import Span
 from tokenizers import Tokenizer
 
+from server.features.translator.budget import DecodingBudget, decoding_stops
+from server.features.translator.cache import TranslationCache
+from server.features.translator.detokeniser import Detokeniser
+from server.features.translator.metrics import (
+    batch_size,
+    detokenise_duration,
+    generate_duration,
+    source_tokens,
+    target_tokens,
+    tokenise_duration,
+)
 from server.features.translator.protocol import TranslatorProtocol
+from server.features.translator.registry import ModelUnloadedError
+from server.features.translator.scheduler import QueueFullError, Scheduler, TranslationJob
+from server.features.translator.segmenter import join_sentences, split_sentences
+from server.features.translator.simulator import SimulatedCTranslator, SimulatedTokeniser
 from server.features.translator.stub import TranslatorStub
-from server.typedefs import Language
+from server.stores import SQLiteCache
+from server.telemetry import record_count, record_duration, stage, stage_span
+from server.typedefs import ComputeTypes, CpuIsa, Language, Priority
 from server.utils import huggingface_download
 
+DECODING_OPTIONS: dict[str, Any] = {
+    "beam_size": 1,
+    "sampling_temperature": 0,
+    "no_repeat_ngram_size": 3,
+}
+
+CACHED_WORD = compile_regex(r"\s*\S+")
+
+
+def record_detokenise(span: Span, target_tokens: int, elapsed: float) -> None:
+    """
+    Summary
+    -------
+    record the time spent incrementally detokenising a job and end its span
+
+    Parameters
+    ----------
+    span (Span)
+        the detokenisation span of the job
+
+    target_tokens (int)
+        the number of tokens generated for the job
+
+    elapsed (float)
+        the number of seconds spent detokenising
+    """
+    detokenise_duration.record(elapsed)
+    record_duration("detokenise", elapsed)
+    span.set_attributes({"translator.target_tokens": target_tokens, "translator.detokenise.busy_time": elapsed})
+    span.end()
+
 
 class Translator(TranslatorProtocol):
     """
@@ -19,40 +77,155 @@ class Translator(TranslatorProtocol):
 
     Methods
     -------
-    translate_generator(text: str, source_language: Language, target_language: Language) -> Iterator[str]
-        translate the input from the source language to the target language tokens
+    decode_batch(jobs: Sequence[TranslationJob]) -> None
+        decode a batch of translation jobs in a single call, loading the model back if it was unloaded while idle
+
+    create_job(source: tuple[str, ...], target_language: Language, *, priority: Priority, client: str) -> TranslationJob
+        create a translation job with a decoding budget proportional to its source
+
+    create_jobs(translations: Sequence[tuple[str, Language, Language]]) -> list[TranslationJob]
+        tokenise a batch of inputs into translation jobs
 
-    translate(text: str, source_language: Language, target_language: Language) -> str
+    detokenise_steps(detokeniser: Detokeniser, steps: Sequence[tuple[int, str]], *, final: bool)
+        detokenise newly generated tokens, flushing the held back tokens at the end of the stream
+
+    detokenise(job: TranslationJob) -> Iterator[str]
+        incrementally detokenise the tokens of a job as they are generated
+
+    detokenise_async(job: TranslationJob) -> AsyncGenerator[str]
+        incrementally detokenise the tokens of a job as they are generated without blocking the event loop
+
+    complete_job(key: str, job: TranslationJob) -> None
+        cache the translation of a finished job and stop sharing it with new requests
+
+    release_jobs(jobs: dict[str, TranslationJob]) -> None
+        stop waiting for jobs and cancel the jobs that no other request is waiting for
+
+    acquire_jobs(translations: dict[str, tuple[str, Language, Language]], *, sort: bool) -> dict[str, TranslationJob]
+        join the in-flight job of each translation and queue jobs for the translations that are not in flight
+
+    acquire_translations(translations: Sequence[tuple[str, Language, Language]], *, sort: bool)
+        look up the cached translation of each input and acquire jobs for the rest
+
+    decode_translations(token_ids: Sequence[list[int]]) -> list[str]
+        detokenise the generated tokens of finished jobs
+
+    acquire_async(acquire: Callable[P, tuple[*Ts, dict[str, TranslationJob]]], *args, **kwargs)
+        look up the cache and acquire jobs in a worker thread, releasing the jobs if the request is cancelled
+
+    acquire_sentences(text: str, source_language: Language, target_language: Language, *, segment: bool)
+        look up the cached translation of each sentence and acquire jobs for the rest
+
+    sentence_parts(sentences: list[tuple[str, str | None, str]], leading_whitespace: str, jobs: dict)
+        yield the original whitespace and cached translations as text, and the job of every other sentence
+
+    stream_sentences(sentences: list[tuple[str, str | None, str]], leading_whitespace: str, jobs: dict) -> Iterator[str]
+        stream the cached or detokenised translation of each sentence with the original whitespace
+
+    stream_sentences_async(sentences: list[tuple[str, str | None, str]], leading_whitespace: str, jobs: dict)
+        stream the cached or detokenised translation of each sentence without blocking the event loop
+
+    translate(text: str, source_language: Language, target_language: Language, *, segment: bool) -> str
         translate the input from the source language to the target language
 
-    translate_stream(text: str, source_language: Language, target_language: Language) -> Iterator[str]
+    translate_stream(text: str, source_language: Language, target_language: Language, *, segment: bool) -> Iterator[str]
         streams the translation input from the source language to the target language
 
-    unload_model(to_cpu: bool) -> bool
+    translate_batch(translations: Sequence[tuple[str, Language, Language]]) -> list[str]
+        translate a batch of inputs, each from its own source language to its own target language
+
+    translate_async(text: str, source_language: Language, target_language: Language, *, segment: bool) -> str
+        translate the input without blocking the event loop
+
+    translate_stream_async(text: str, source_language: Language, target_language: Language, *, segment: bool)
+        streams the translation of the input without blocking the event loop
+
+    translate_batch_async(translations: Sequence[tuple[str, Language, Language]]) -> list[str]
+        translate a batch of inputs without blocking the event loop
+
+    unload_model(to_cpu: bool, idle_only: bool) -> bool
         unload the model from the current device
 
+    unload_idle_model() -> bool
+        unload the model while no job is pending, so that the next batch loads it back instead of failing
+
     load_model(keep_cache: bool) -> bool
         load the model back to the initial device
 
+    model_is_loaded() -> bool
+        check whether the model is loaded on its device
+
+    warm_up(translations: Sequence[tuple[str, Language, Language]], *, rounds: int) -> None
+        decode representative inputs on every inter-thread replica of the model
+
     count_tokens(text: str) -> int
         count the number of tokens in the input text
+
+    queue_status() -> tuple[int, int, float, float]
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
     """
 
-    __slots__ = ("tokeniser", "translator", "use_cuda")
+    __slots__ = (
+        "budget",
+        "cache",
+        "idle_to_cpu",
+        "idle_unloaded",
+        "in_flight",
+        "in_flight_lock",
+        "model_lock",
+        "scheduler",
+        "tokeniser",
+        "translator",
+        "use_cuda",
+        "workers",
+    )
 
-    def __init__(self, translator: CTranslator, tokeniser: Tokenizer, *, use_cuda: bool) -> None:
+    def __init__(
+        self,
+        translator: CTranslator,
+        tokeniser: Tokenizer,
+        cache: TranslationCache,
+        *,
+        use_cuda: bool,
+        workers: int,
+        batch_window: float,
+        max_batch_tokens: int,
+        max_pending_tokens: int,
+        idle_timeout: float = 0,
+        idle_to_cpu: bool = False,
+        length_margin: float = 0,
+    ) -> None:
         self.tokeniser = tokeniser
         self.translator = translator
         self.use_cuda = use_cuda
+        self.workers = workers
+        self.idle_to_cpu = idle_to_cpu
+        self.idle_unloaded = False
+        self.model_lock = Lock()
+        self.cache = cache
+        self.budget = DecodingBudget(length_margin)
+        self.in_flight: dict[str, TranslationJob] = {}
+        self.in_flight_lock = Lock()
+        self.scheduler = Scheduler(
+            self.decode_batch,
+            workers=workers,
+            batch_window=batch_window,
+            max_batch_tokens=max_batch_tokens,
+            max_pending_tokens=max_pending_tokens,
+            idle_timeout=idle_timeout,
+            on_idle=self.unload_idle_model,
+        )
 
     def __enter__(self) -> Self:
+        self.scheduler.__enter__()
         return self
 
     def __exit__(self, *_) -> None:
+        self.scheduler.__exit__()
         del self.tokeniser
         del self.translator
 
-    def unload_model(self, *, to_cpu: bool) -> bool:
+    def unload_model(self, *, to_cpu: bool, idle_only: bool = False) -> bool:
         """
         Summary
         -------
@@ -63,15 +236,41 @@ class Translator(TranslatorProtocol):
         to_cpu (bool)
             whether to unload the model to CPU
 
+        idle_only (bool)
+            whether to leave the model loaded if any job is waiting for, or undergoing, decoding
+
+        Returns
+        -------
+        success (bool)
+            whether the model unload was executed
+        """
+        with self.scheduler.paused():
+            if not self.translator.model_is_loaded or (idle_only and self.scheduler.status()[0]):
+                return False
+
+            self.translator.unload_model(to_cpu=self.use_cuda and to_cpu)
+            self.idle_unloaded = False
+
+        return True
+
+    def unload_idle_model(self) -> bool:
+        """
+        Summary
+        -------
+        unload the model while no job is pending, so that the next batch loads it back instead of failing
+
         Returns
         -------
         success (bool)
             whether the model unload was executed
         """
-        if not self.translator.model_is_loaded:
-            return False
+        with self.scheduler.paused():
+            if not self.translator.model_is_loaded or self.scheduler.status()[0]:
+                return False
+
+            self.translator.unload_model(to_cpu=self.use_cuda and self.idle_to_cpu)
+            self.idle_unloaded = True
 
-        self.translator.unload_model(to_cpu=self.use_cuda and to_cpu)
         return True
 
     def load_model(self, *, keep_cache: bool) -> bool:
@@ -90,12 +289,127 @@ class Translator(TranslatorProtocol):
         success (bool)
             whether the model load was executed
         """
-        if self.translator.model_is_loaded:
-            return False
+        with self.model_lock:
+            if self.translator.model_is_loaded:
+                return False
+
+            self.translator.load_model(keep_cache=self.use_cuda and keep_cache)
+            self.idle_unloaded = False
 
-        self.translator.load_model(keep_cache=self.use_cuda and keep_cache)
         return True
 
+    def model_is_loaded(self) -> bool:
+        """
+        Summary
+        -------
+        check whether the model is loaded on its device
+
+        Returns
+        -------
+        loaded (bool)
+            whether the model is loaded
+        """
+        return self.translator.model_is_loaded
+
+    def decode_batch(self, jobs: Sequence[TranslationJob]) -> None:
+        """
+        Summary
+        -------
+        decode a batch of translation jobs in a single call
+
+        Parameters
+        ----------
+        jobs (Sequence[TranslationJob])
+            the jobs to decode together
+
+        Raises
+        ------
+        ModelUnloadedError
+            if the model was unloaded by an operator after the jobs were queued
+        """
+        with self.model_lock:
+            if not self.translator.model_is_loaded:
+                if not self.idle_unloaded:
+                    raise ModelUnloadedError
+
+                self.translator.load_model(keep_cache=self.use_cuda and self.idle_to_cpu)
+                self.idle_unloaded = False
+
+        target_prefixes = [job.target_prefix for job in jobs]
+        batch_size.record(len(jobs))
+
+        with stage(
+            "translator.generate",
+            generate_duration,
+            {"translator.batch_size": len(jobs)},
+            [job.span_context for job in jobs],
+        ) as span:
+            self.translator.translate_batch(
+                [job.source for job in jobs],
+                target_prefixes,
+                **DECODING_OPTIONS,
+                max_decoding_length=max(job.max_length for job in jobs),
+                suppress_sequences=list(dict.fromkeys(target_prefixes)),
+                callback=lambda step: jobs[step.batch_id].push(step),
+            )
+
+            if span.is_recording():
+                span.set_attribute("translator.source_tokens", sum(job.token_count for job in jobs))
+                span.set_attribute("translator.target_tokens", sum(len(job.token_ids) for job in jobs))
+
+        for job in jobs:
+            source_language, target_language = job.source[0], job.target_prefix[0]
+            language_pair = {"source_language": source_language, "target_language": target_language}
+            source_tokens.add(job.token_count, language_pair)
+            target_tokens.add(len(job.token_ids), language_pair)
+
+            if job.stop_reason is None:
+                self.budget.observe(job.token_count, len(job.token_ids), source_language, target_language)
+                continue
+
+            decoding_stops.add(1, {"reason": job.stop_reason, **language_pair})
+
+    def warm_up(self, translations: Sequence[tuple[str, Language, Language]], *, rounds: int) -> None:
+        """
+        Summary
+        -------
+        decode representative inputs on every inter-thread replica of the model, bypassing the scheduler so that the
+        batches are not merged into one
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the representative inputs with their source and target languages
+
+        rounds (int)
+            the number of times the representative inputs are decoded on each replica
+        """
+        with ThreadPoolExecutor(self.workers) as executor:
+            for _ in range(rounds):
+                list(executor.map(self.decode_batch, [self.create_jobs(translations) for _ in range(self.workers)]))
+
+    def queue_status(self) -> tuple[int, int, float, float]:
+        """
+        Summary
+        -------
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
+
+        Returns
+        -------
+        pending_jobs (int)
+            the number of jobs waiting for, or undergoing, decoding
+
+        pending_tokens (int)
+            the number of source tokens waiting for, or undergoing, decoding
+
+        estimated_wait (float)
+            the estimated number of seconds before a new job finishes decoding
+
+        throughput (float)
+            the recent decoding throughput in source tokens per second
+        """
+        return self.scheduler.status()
+
     def count_tokens(self, text: str) -> int:
         """
         Summary
@@ -114,11 +428,475 @@ class Translator(TranslatorProtocol):
         """
         return len(self.tokeniser.encode(text)) + 1
 
-    def translate_generator(self, text: str, source_language: Language, target_language: Language) -> Iterator[int]:
+    def create_job(
+        self,
+        source: tuple[str, ...],
+        target_language: Language,
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+    ) -> TranslationJob:
+        """
+        Summary
+        -------
+        create a translation job with a decoding budget proportional to its source
+
+        Parameters
+        ----------
+        source (tuple[str, ...])
+            the source tokens, starting with the source language token
+
+        target_language (Language)
+            the target language
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        Returns
+        -------
+        job (TranslationJob)
+            the translation job
+        """
+        return TranslationJob(
+            source,
+            (target_language,),
+            max_length=self.budget.limit(len(source), source[0], target_language),
+            priority=priority,
+            client=client,
+        )
+
+    def create_jobs(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+    ) -> list[TranslationJob]:
         """
         Summary
         -------
-        translate the input from the source language to the target language tokens
+        tokenise a batch of inputs into translation jobs
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        Returns
+        -------
+        jobs (list[TranslationJob])
+            the translation jobs in the same order as the inputs
+        """
+        with stage(
+            "translator.tokenise",
+            tokenise_duration,
+            {"translator.batch_size": len(translations)},
+            timing="tokenise",
+        ) as span:
+            encodings = self.tokeniser.encode_batch([text for text, *_ in translations])
+
+            if span.is_recording():
+                span.set_attribute("translator.source_tokens", sum(len(encoding.tokens) for encoding in encodings))
+
+        return [
+            self.create_job((source_language, *encoding.tokens), target_language, priority=priority, client=client)
+            for (_, source_language, target_language), encoding in zip(translations, encodings, strict=True)
+        ]
+
+    def detokenise_steps(
+        self,
+        detokeniser: Detokeniser,
+        steps: Sequence[tuple[int, str]],
+        *,
+        final: bool = False,
+    ) -> tuple[list[str], float]:
+        """
+        Summary
+        -------
+        detokenise newly generated tokens, flushing the held back tokens at the end of the stream
+
+        Parameters
+        ----------
+        detokeniser (Detokeniser)
+            the incremental detokeniser of the job
+
+        steps (Sequence[tuple[int, str]])
+            the newly generated token indices and their token strings
+
+        final (bool)
+            whether this is the end of the stream
+
+        Returns
+        -------
+        texts (list[str])
+            the newly completed words or characters
+
+        elapsed (float)
+            the number of seconds spent detokenising
+        """
+        start = perf_counter()
+        texts = [text for token_id, token in steps if (text := detokeniser.step(token_id, token))]
+
+        if final and (text := detokeniser.flush(final=True)):
+            texts.append(text)
+
+        return texts, perf_counter() - start
+
+    def detokenise(self, job: TranslationJob) -> Iterator[str]:
+        """
+        Summary
+        -------
+        incrementally detokenise the tokens of a job as they are generated
+
+        Parameters
+        ----------
+        job (TranslationJob)
+            the submitted translation job
+
+        Returns
+        -------
+        texts (Iterator[str])
+            the newly completed words or characters
+        """
+        detokeniser = Detokeniser(self.tokeniser)
+        span = stage_span("translator.detokenise")
+        elapsed = 0.0
+
+        try:
+            for steps in job.chunks():
+                texts, duration = self.detokenise_steps(detokeniser, steps)
+                elapsed += duration
+                yield from texts
+
+            texts, duration = self.detokenise_steps(detokeniser, (), final=True)
+            elapsed += duration
+
+        finally:
+            record_detokenise(span, len(job.token_ids), elapsed)
+
+        yield from texts
+
+    async def detokenise_async(self, job: TranslationJob) -> AsyncGenerator[str]:
+        """
+        Summary
+        -------
+        incrementally detokenise the tokens of a job as they are generated without blocking the event loop
+
+        Parameters
+        ----------
+        job (TranslationJob)
+            the submitted translation job
+
+        Returns
+        -------
+        texts (AsyncGenerator[str])
+            the newly completed words or characters
+        """
+        detokeniser = Detokeniser(self.tokeniser)
+        span = stage_span("translator.detokenise")
+        elapsed = 0.0
+
+        try:
+            async with aclosing(job.chunks_async()) as chunks:
+                async for steps in chunks:
+                    texts, duration = await sync_to_thread(self.detokenise_steps, detokeniser, steps)
+                    elapsed += duration
+
+                    for text in texts:
+                        yield text
+
+            texts, duration = await sync_to_thread(self.detokenise_steps, detokeniser, (), final=True)
+            elapsed += duration
+
+        finally:
+            record_detokenise(span, len(job.token_ids), elapsed)
+
+        for text in texts:
+            yield text
+
+    def complete_job(self, key: str, job: TranslationJob) -> None:
+        """
+        Summary
+        -------
+        cache the translation of a finished job and stop sharing it with new requests
+
+        Parameters
+        ----------
+        key (str)
+            the cache key of the job
+
+        job (TranslationJob)
+            the finished translation job
+        """
+        try:
+            if job.error is None and job.stop_reason is None:
+                self.cache.put(key, self.tokeniser.decode(job.token_ids))
+
+        finally:
+            with self.in_flight_lock:
+                if self.in_flight.get(key) is job:
+                    del self.in_flight[key]
+
+    def acquire_jobs(
+        self,
+        translations: dict[str, tuple[str, Language, Language]],
+        *,
+        sort: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> dict[str, TranslationJob]:
+        """
+        Summary
+        -------
+        join the in-flight job of each translation and queue jobs for the translations that are not in flight
+
+        Parameters
+        ----------
+        translations (dict[str, tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages, keyed by their cache keys
+
+        sort (bool)
+            whether to queue the new jobs by their token count instead of in order
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        jobs (dict[str, TranslationJob])
+            the in-flight or newly queued job of each translation
+
+        Raises
+        ------
+        QueueFullError
+            if the new jobs would exceed the pending token limit
+        """
+        with self.in_flight_lock:
+            jobs = {
+                key: job
+                for key in translations
+                if (job := self.in_flight.get(key)) is not None and job.stop_reason is None
+            }
+
+        pending = {key: translation for key, translation in translations.items() if key not in jobs}
+        created = dict(
+            zip(pending, self.create_jobs(list(pending.values()), priority=priority, client=client), strict=True)
+        )
+        queued: dict[str, TranslationJob] = {}
+
+        with self.in_flight_lock:
+            for key, job in created.items():
+                if (in_flight_job := self.in_flight.get(key)) is None or in_flight_job.stop_reason is not None:
+                    self.in_flight[key] = in_flight_job = job
+                    job.add_done_callback(partial(self.complete_job, key))
+                    queued[key] = job
+
+                jobs[key] = in_flight_job
+
+            try:
+                self.scheduler.submit_many(
+                    sorted(queued.values(), key=lambda job: job.token_count) if sort else list(queued.values())
+                )
+
+            except QueueFullError:
+                for key in queued:
+                    del self.in_flight[key]
+
+                raise
+
+            for job in jobs.values():
+                job.attach(deadline)
+
+        return {key: jobs[key] for key in translations}
+
+    def release_jobs(self, jobs: dict[str, TranslationJob]) -> None:
+        """
+        Summary
+        -------
+        stop waiting for jobs and cancel the jobs that no other request is waiting for
+
+        Parameters
+        ----------
+        jobs (dict[str, TranslationJob])
+            the jobs acquired by a request, keyed by their cache keys
+        """
+        if timings := [
+            (job.started_at - job.created_at, job.finished_at - job.started_at, job.token_count, len(job.token_ids))
+            for job in jobs.values()
+            if job.started_at is not None and job.finished_at is not None
+        ]:
+            queued, generated, input_tokens, output_tokens = zip(*timings, strict=True)
+            record_duration("queue", max(queued))
+            record_duration("generate", max(generated))
+            record_count("input-tokens", sum(input_tokens))
+            record_count("output-tokens", sum(output_tokens))
+
+        with self.in_flight_lock:
+            abandoned = {key: job for key, job in jobs.items() if job.detach()}
+
+            for key, job in abandoned.items():
+                if self.in_flight.get(key) is job:
+                    del self.in_flight[key]
+
+        if abandoned:
+            self.scheduler.cancel(list(abandoned.values()))
+
+    def acquire_translations(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        sort: bool,
+        priority: Priority,
+        client: str,
+        deadline: float | None,
+    ) -> tuple[list[str], dict[str, str], dict[str, TranslationJob]]:
+        """
+        Summary
+        -------
+        look up the cached translation of each input and acquire jobs for the rest
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        sort (bool)
+            whether to queue the new jobs by their token count instead of in order
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        keys (list[str])
+            the cache key of each input
+
+        translated (dict[str, str])
+            the cached translations, keyed by their cache keys
+
+        jobs (dict[str, TranslationJob])
+            the jobs of the inputs without a cached translation, keyed by their cache keys
+        """
+        keys = [self.cache.key(*translation) for translation in translations]
+        translated = {key: translation for key in keys if (translation := self.cache.get(key)) is not None}
+        pending = {
+            key: translation for key, translation in zip(keys, translations, strict=True) if key not in translated
+        }
+
+        if not pending:
+            return keys, translated, {}
+
+        return (
+            keys,
+            translated,
+            self.acquire_jobs(pending, sort=sort, priority=priority, client=client, deadline=deadline),
+        )
+
+    def decode_translations(self, token_ids: Sequence[list[int]]) -> list[str]:
+        """
+        Summary
+        -------
+        detokenise the generated tokens of finished jobs
+
+        Parameters
+        ----------
+        token_ids (Sequence[list[int]])
+            the generated token indices of each job
+
+        Returns
+        -------
+        translated_texts (list[str])
+            the translated texts in the same order as the jobs
+        """
+        with stage(
+            "translator.detokenise",
+            detokenise_duration,
+            {"translator.batch_size": len(token_ids)},
+            timing="detokenise",
+        ) as span:
+            if span.is_recording():
+                span.set_attribute("translator.target_tokens", sum(map(len, token_ids)))
+
+            return self.tokeniser.decode_batch(token_ids)
+
+    async def acquire_async[**P, *Ts](
+        self,
+        acquire: Callable[P, tuple[*Ts, dict[str, TranslationJob]]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> tuple[*Ts, dict[str, TranslationJob]]:
+        """
+        Summary
+        -------
+        look up the cache and acquire jobs in a worker thread, releasing the jobs if the request is cancelled before
+        they are handed over
+
+        Parameters
+        ----------
+        acquire (Callable[P, tuple[*Ts, dict[str, TranslationJob]]])
+            the function that acquires the jobs, returning them last
+
+        *args (P.args)
+            the positional arguments of the function
+
+        **kwargs (P.kwargs)
+            the keyword arguments of the function
+
+        Returns
+        -------
+        acquired (tuple[*Ts, dict[str, TranslationJob]])
+            the return value of the function
+        """
+        acquisition = create_task(sync_to_thread(acquire, *args, **kwargs))
+
+        def release(task: Task[tuple[*Ts, dict[str, TranslationJob]]]) -> None:
+            if not task.cancelled() and task.exception() is None:
+                self.release_jobs(task.result()[-1])
+
+        try:
+            return await shield(acquisition)
+
+        except CancelledError:
+            acquisition.add_done_callback(release)
+            raise
+
+    def acquire_sentences(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool,
+        priority: Priority,
+        client: str,
+        deadline: float | None,
+    ) -> tuple[list[tuple[str, str | None, str]], str, dict[str, TranslationJob]]:
+        """
+        Summary
+        -------
+        look up the cached translation of each sentence and acquire jobs for the rest
 
         Parameters
         ----------
@@ -129,25 +907,175 @@ class Translator(TranslatorProtocol):
             the source language
 
         target_language (Languages)
-            the target languages
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
 
         Returns
         -------
-        token_indices (Iterator[int]) : the translated tokens indices
+        sentences (list[tuple[str, str?, str]])
+            the cache key, cached translation and trailing whitespace of each sentence
+
+        leading_whitespace (str)
+            the whitespace before the first sentence
+
+        jobs (dict[str, TranslationJob])
+            the jobs of the sentences without a cached translation, keyed by their cache keys
         """
-        target_prefix = (target_language,)
-        results = self.translator.generate_tokens(
-            (source_language, *self.tokeniser.encode(text).tokens),
-            target_prefix,
-            max_decoding_length=1024,
-            sampling_temperature=0,
-            no_repeat_ngram_size=3,
-            suppress_sequences=(target_prefix,),
+        sentences, separators = split_sentences(text) if segment else ([text], ["", ""])
+        keys, translated, jobs = self.acquire_translations(
+            [(sentence, source_language, target_language) for sentence in sentences],
+            sort=False,
+            priority=priority,
+            client=client,
+            deadline=deadline,
         )
 
-        return (result.token_id for result in results if not result.is_last)
+        return (
+            [(key, translated.get(key), separator) for key, separator in zip(keys, separators[1:], strict=True)],
+            separators[0],
+            jobs,
+        )
 
-    def translate(self, text: str, source_language: Language, target_language: Language) -> str:
+    def sentence_parts(
+        self,
+        sentences: list[tuple[str, str | None, str]],
+        leading_whitespace: str,
+        jobs: dict[str, TranslationJob],
+    ) -> Iterator[str | TranslationJob]:
+        """
+        Summary
+        -------
+        yield the original whitespace and cached translations as text, and the job of every other sentence in its place
+
+        Parameters
+        ----------
+        sentences (list[tuple[str, str?, str]])
+            the cache key, cached translation and trailing whitespace of each sentence
+
+        leading_whitespace (str)
+            the whitespace before the first sentence
+
+        jobs (dict[str, TranslationJob])
+            the jobs of the sentences without a cached translation, keyed by their cache keys
+
+        Returns
+        -------
+        parts (Iterator[str | TranslationJob])
+            the text to stream as is, or the job to stream the detokenised translation of
+        """
+        if leading_whitespace:
+            yield leading_whitespace
+
+        for key, translation, separator in sentences:
+            if translation is None:
+                yield jobs[key]
+
+            else:
+                yield from CACHED_WORD.findall(translation)
+
+            if separator:
+                yield separator
+
+    def stream_sentences(
+        self,
+        sentences: list[tuple[str, str | None, str]],
+        leading_whitespace: str,
+        jobs: dict[str, TranslationJob],
+    ) -> Iterator[str]:
+        """
+        Summary
+        -------
+        stream the cached or detokenised translation of each sentence with the original whitespace
+
+        Parameters
+        ----------
+        sentences (list[tuple[str, str?, str]])
+            the cache key, cached translation and trailing whitespace of each sentence
+
+        leading_whitespace (str)
+            the whitespace before the first sentence
+
+        jobs (dict[str, TranslationJob])
+            the jobs of the sentences without a cached translation, keyed by their cache keys
+
+        Returns
+        -------
+        translated_text (Iterator[str])
+            the translated text
+        """
+        try:
+            for part in self.sentence_parts(sentences, leading_whitespace, jobs):
+                if isinstance(part, str):
+                    yield part
+
+                else:
+                    yield from self.detokenise(part)
+
+        finally:
+            self.release_jobs(jobs)
+
+    async def stream_sentences_async(
+        self,
+        sentences: list[tuple[str, str | None, str]],
+        leading_whitespace: str,
+        jobs: dict[str, TranslationJob],
+    ) -> AsyncGenerator[str]:
+        """
+        Summary
+        -------
+        stream the cached or detokenised translation of each sentence without blocking the event loop
+
+        Parameters
+        ----------
+        sentences (list[tuple[str, str?, str]])
+            the cache key, cached translation and trailing whitespace of each sentence
+
+        leading_whitespace (str)
+            the whitespace before the first sentence
+
+        jobs (dict[str, TranslationJob])
+            the jobs of the sentences without a cached translation, keyed by their cache keys
+
+        Returns
+        -------
+        translated_text (AsyncGenerator[str])
+            the translated text
+        """
+        try:
+            for part in self.sentence_parts(sentences, leading_whitespace, jobs):
+                if isinstance(part, str):
+                    yield part
+                    continue
+
+                async with aclosing(self.detokenise_async(part)) as texts:
+                    async for text in texts:
+                        yield text
+
+        finally:
+            self.release_jobs(jobs)
+
+    def translate(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> str:
         """
         Summary
         -------
@@ -164,14 +1092,44 @@ class Translator(TranslatorProtocol):
         target_language (Languages)
             the target language
 
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
         Returns
         -------
         translated_text (str)
             the translated text
         """
-        return self.tokeniser.decode(tuple(self.translate_generator(text, source_language, target_language)))
+        sentences, separators = split_sentences(text) if segment else ([text], ["", ""])
+        translations = self.translate_batch(
+            [(sentence, source_language, target_language) for sentence in sentences],
+            priority=priority,
+            client=client,
+            deadline=deadline,
+        )
+
+        return join_sentences(translations, separators)
 
-    def translate_stream(self, text: str, source_language: Language, target_language: Language) -> Iterator[str]:
+    def translate_stream(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> Iterator[str]:
         """
         Summary
         -------
@@ -188,23 +1146,272 @@ class Translator(TranslatorProtocol):
         target_language (Languages)
             the target language
 
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
         Returns
         -------
         translated_text (Iterator[str])
             the translated text
         """
+        return self.stream_sentences(
+            *self.acquire_sentences(
+                text,
+                source_language,
+                target_language,
+                segment=segment,
+                priority=priority,
+                client=client,
+                deadline=deadline,
+            )
+        )
+
+    def translate_batch(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> list[str]:
+        """
+        Summary
+        -------
+        translate a batch of inputs, each from its own source language to its own target language
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_texts (list[str])
+            the translated texts in the same order as the inputs
+        """
+        keys, translated, jobs = self.acquire_translations(
+            translations,
+            sort=True,
+            priority=priority,
+            client=client,
+            deadline=deadline,
+        )
+
+        if jobs:
+            try:
+                token_ids = [job.result(deadline) for job in jobs.values()]
+
+            finally:
+                self.release_jobs(jobs)
+
+            translated.update(zip(jobs, self.decode_translations(token_ids), strict=True))
+
+        return [translated[key] for key in keys]
+
+    async def translate_async(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> str:
+        """
+        Summary
+        -------
+        translate the input without blocking the event loop
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (str)
+            the translated text
+        """
+        sentences, separators = split_sentences(text) if segment else ([text], ["", ""])
+        translations = await self.translate_batch_async(
+            [(sentence, source_language, target_language) for sentence in sentences],
+            priority=priority,
+            client=client,
+            deadline=deadline,
+        )
 
-        return (
-            self.tokeniser.decode((token,))
-            for token in self.translate_generator(text, source_language, target_language)
+        return join_sentences(translations, separators)
+
+    async def translate_stream_async(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> AsyncGenerator[str]:
+        """
+        Summary
+        -------
+        streams the translation of the input without blocking the event loop
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (AsyncGenerator[str])
+            the translated text
+        """
+        acquired = await self.acquire_async(
+            self.acquire_sentences,
+            text,
+            source_language,
+            target_language,
+            segment=segment,
+            priority=priority,
+            client=client,
+            deadline=deadline,
+        )
+
+        async with aclosing(self.stream_sentences_async(*acquired)) as translated_text:
+            async for chunk in translated_text:
+                yield chunk
+
+    async def translate_batch_async(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> list[str]:
+        """
+        Summary
+        -------
+        translate a batch of inputs without blocking the event loop
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_texts (list[str])
+            the translated texts in the same order as the inputs
+        """
+        keys, translated, jobs = await self.acquire_async(
+            self.acquire_translations,
+            translations,
+            sort=True,
+            priority=priority,
+            client=client,
+            deadline=deadline,
         )
 
+        if jobs:
+            try:
+                token_ids = [await job.result_async(deadline) for job in jobs.values()]
+
+            finally:
+                self.release_jobs(jobs)
+
+            translated.update(zip(jobs, await sync_to_thread(self.decode_translations, token_ids), strict=True))
+
+        return [translated[key] for key in keys]
+
 
 def get_translator(
     repository: str,
     *,
     translator_threads: int,
+    intra_threads: int,
+    compute_type: ComputeTypes,
+    max_queued_batches: int,
+    cpu_isa: CpuIsa | None,
+    batch_window: float,
+    max_batch_tokens: int,
+    max_pending_tokens: int,
+    idle_timeout: float,
+    idle_to_cpu: bool,
+    length_margin: float,
+    cache_bytes: int,
+    shared_cache: SQLiteCache | None,
     stub: bool,
+    stub_tokenise_latency: float,
+    stub_decode_latency: float,
+    stub_runaway_rate: float,
     testing: bool,
     use_cuda: bool,
 ) -> TranslatorProtocol:
@@ -221,9 +1428,54 @@ def get_translator(
     translator_threads (int)
         the number of threads to use for the translator
 
+    intra_threads (int)
+        the number of threads used to decode each batch
+
+    compute_type (ComputeTypes)
+        the type of the model weights and computations
+
+    max_queued_batches (int)
+        the maximum number of batches queued inside CTranslate2
+
+    cpu_isa (CpuIsa?)
+        the CPU instruction set to force CTranslate2 to use before the first model is loaded
+
+    batch_window (float)
+        the number of seconds to wait for concurrent requests before dispatching a batch
+
+    max_batch_tokens (int)
+        the maximum number of padded source tokens in a batch
+
+    max_pending_tokens (int)
+        the maximum number of source tokens waiting for, or undergoing, decoding
+
+    idle_timeout (float)
+        the number of seconds without traffic before the model is unloaded, where 0 keeps the model loaded
+
+    idle_to_cpu (bool)
+        whether an idle model is unloaded to CPU and its cache kept in RAM when it is reloaded
+
+    length_margin (float)
+        the multiple of the expected output length that a translation may generate, where 0 disables the budget
+
+    cache_bytes (int)
+        the maximum size of the translation cache in bytes
+
+    shared_cache (SQLiteCache?)
+        the on-disk cache shared by every worker on the host
+
     stub (bool)
         whether to return a stub translator for testing
 
+    stub_tokenise_latency (float)
+        the number of seconds the simulated tokeniser of the stub spends on each token, where 0 echoes the input
+
+    stub_decode_latency (float)
+        the number of seconds each decoding step of the stub takes, where 0 echoes the input
+
+    stub_runaway_rate (float)
+        the share of inputs for which the stub never generates an end token
+
     testing (bool)
         whether the application is running in integration testing mode
 
@@ -235,16 +1487,61 @@ def get_translator(
     translator (TranslatorProtocol)
         the translator
     """
-    if stub:
+    if stub and not (stub_tokenise_latency or stub_decode_latency):
         return TranslatorStub()
 
+    if stub:
+        simulated_tokeniser = SimulatedTokeniser(stub_tokenise_latency)
+        simulated_translator = SimulatedCTranslator(
+            simulated_tokeniser,
+            inter_threads=translator_threads,
+            intra_threads=intra_threads,
+            step_latency=stub_decode_latency,
+            runaway_rate=stub_runaway_rate,
+        )
+
+        return Translator(
+            simulated_translator,  # pyright: ignore [reportArgumentType]
+            simulated_tokeniser,  # pyright: ignore [reportArgumentType]
+            TranslationCache(cache_bytes, namespace=f"{repository}:stub:{length_margin}", shared=shared_cache),
+            use_cuda=False,
+            workers=translator_threads,
+            batch_window=batch_window,
+            max_batch_tokens=max_batch_tokens,
+            max_pending_tokens=max_pending_tokens,
+            idle_timeout=idle_timeout,
+            idle_to_cpu=idle_to_cpu,
+            length_margin=length_margin,
+        )
+
+    if cpu_isa is not None:
+        environ["CT2_FORCE_CPU_ISA"] = cpu_isa
+
     model_path = huggingface_download(repository)
     tokeniser = Tokenizer.from_file(str(Path(model_path) / "tokenizer.json"))
     translator = CTranslator(
         model_path,
         "cuda" if use_cuda else "cpu",
-        compute_type="default" if testing else "auto",
+        compute_type="default" if testing else compute_type,
         inter_threads=translator_threads,
+        intra_threads=intra_threads,
+        max_queued_batches=max_queued_batches,
     )
 
-    return Translator(translator, tokeniser, use_cuda=use_cuda)
+    return Translator(
+        translator,
+        tokeniser,
+        TranslationCache(
+            cache_bytes,
+            namespace=f"{repository}:{sorted(DECODING_OPTIONS.items())}:{length_margin}",
+            shared=shared_cache,
+        ),
+        use_cuda=use_cuda,
+        workers=translator_threads,
+        batch_window=batch_window,
+        max_batch_tokens=max_batch_tokens,
+        max_pending_tokens=max_pending_tokens,
+        idle_timeout=idle_timeout,
+        idle_to_cpu=idle_to_cpu,
+        length_margin=length_margin,
+    )
@@ -0,0 +1,373 @@
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ExitStack
+from pathlib import Path
+from threading import Lock
+from typing import Self
+
+from litestar.concurrency import sync_to_thread
+
+from server.features.translator.protocol import TranslatorProtocol
+from server.typedefs import Language
+from server.utils import huggingface_download
+
+WARMUP_TRANSLATIONS: tuple[tuple[str, Language, Language], ...] = (
+    ("Hello, world!", "eng_Latn", "spa_Latn"),
+    ("The weather is lovely today, so we are going for a walk in the park.", "eng_Latn", "fra_Latn"),
+    ("我是一名软件工程师！", "zho_Hans", "eng_Latn"),  # noqa: RUF001
+    ("Guten Morgen, wie geht es dir?", "deu_Latn", "jpn_Jpan"),
+)
+
+
+class ModelUnloadedError(Exception):
+    """
+    Summary
+    -------
+    raised when a translation is requested from a model that an operator unloaded until it is loaded again
+    """
+
+    def __init__(self) -> None:
+        super().__init__("the translator model is unloaded")
+
+
+class TranslatorRegistry:
+    """
+    Summary
+    -------
+    a registry of translator models that keeps the most recently used models loaded within a memory budget
+
+    Parameters
+    ----------
+    default (str)
+        the repository of the model used when a request does not select one
+
+    max_bytes (int)
+        the maximum combined size of the loaded models in bytes, where 0 keeps every model loaded
+
+    Methods
+    -------
+    register(model: str, translator: TranslatorProtocol, size: int) -> None
+        add a loaded model to the registry and unload the least recently used models that no longer fit
+
+    peek(model: str | None) -> TranslatorProtocol
+        get the translator of a model without changing which models are loaded
+
+    get(model: str | None) -> TranslatorProtocol
+        get the translator of a model, loading it and unloading the least recently used models if needed
+
+    get_async(model: str | None) -> TranslatorProtocol
+        get the translator of a model without blocking the event loop when it has to be loaded
+
+    unload(model: str | None, *, to_cpu: bool) -> bool
+        unload a model and reject its translations until it is loaded again
+
+    load(model: str | None, *, keep_cache: bool) -> bool
+        load a model that was unloaded and accept its translations again
+
+    warm_up(rounds: int) -> None
+        translate representative inputs with every loaded model so that the first requests do not pay for it
+    """
+
+    __slots__ = ("default", "lock", "max_bytes", "resident", "sizes", "stack", "translators", "unloaded")
+
+    def __init__(self, default: str, *, max_bytes: int) -> None:
+        self.default = default
+        self.max_bytes = max_bytes
+        self.lock = Lock()
+        self.stack = ExitStack()
+        self.translators: dict[str, TranslatorProtocol] = {}
+        self.sizes: dict[str, int] = {}
+        self.resident: OrderedDict[str, None] = OrderedDict()
+        self.unloaded: set[str] = set()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stack.close()
+
+    def __contains__(self, model: str) -> bool:
+        return model in self.translators
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.translators)
+
+    def evict(self, keep: str) -> None:
+        """
+        Summary
+        -------
+        unload the least recently used idle models until the loaded models fit within the memory budget
+
+        Parameters
+        ----------
+        keep (str)
+            the model that must stay loaded
+        """
+        if not self.max_bytes:
+            return
+
+        resident_bytes = sum(self.sizes[model] for model in self.resident)
+
+        for model in list(self.resident):
+            if resident_bytes <= self.max_bytes:
+                break
+
+            translator = self.translators[model]
+
+            if model == keep:
+                continue
+
+            translator.unload_model(to_cpu=True, idle_only=True)
+
+            if translator.model_is_loaded():
+                continue
+
+            del self.resident[model]
+            resident_bytes -= self.sizes[model]
+
+    def register(self, model: str, translator: TranslatorProtocol, size: int) -> None:
+        """
+        Summary
+        -------
+        add a loaded model to the registry and unload the least recently used models that no longer fit
+
+        Parameters
+        ----------
+        model (str)
+            the repository of the model
+
+        translator (TranslatorProtocol)
+            the translator of the model
+
+        size (int)
+            the size of the model in bytes
+        """
+        with self.lock:
+            self.translators[model] = self.stack.enter_context(translator)
+            self.sizes[model] = size
+            self.resident[model] = None
+            self.evict(self.default)
+
+    def peek(self, model: str | None = None) -> TranslatorProtocol:
+        """
+        Summary
+        -------
+        get the translator of a model without changing which models are loaded
+
+        Parameters
+        ----------
+        model (str?)
+            the repository of the model, defaulting to the default model
+
+        Returns
+        -------
+        translator (TranslatorProtocol)
+            the translator of the model
+        """
+        return self.translators[model or self.default]
+
+    def get(self, model: str | None = None) -> TranslatorProtocol:
+        """
+        Summary
+        -------
+        get the translator of a model, loading it and unloading the least recently used models if needed
+
+        Parameters
+        ----------
+        model (str?)
+            the repository of the model, defaulting to the default model
+
+        Returns
+        -------
+        translator (TranslatorProtocol)
+            the translator of the model
+
+        Raises
+        ------
+        ModelUnloadedError
+            if an operator unloaded the model
+        """
+        model = model or self.default
+        translator = self.translators[model]
+
+        with self.lock:
+            if model in self.unloaded:
+                raise ModelUnloadedError
+
+            if model not in self.resident:
+                self.resident[model] = None
+                self.evict(model)
+
+            self.resident.move_to_end(model)
+
+            if not translator.model_is_loaded():
+                translator.load_model(keep_cache=True)
+
+        return translator
+
+    async def get_async(self, model: str | None = None) -> TranslatorProtocol:
+        """
+        Summary
+        -------
+        get the translator of a model without blocking the event loop when it has to be loaded
+
+        Parameters
+        ----------
+        model (str?)
+            the repository of the model, defaulting to the default model
+
+        Returns
+        -------
+        translator (TranslatorProtocol)
+            the translator of the model
+
+        Raises
+        ------
+        ModelUnloadedError
+            if an operator unloaded the model
+        """
+        model = model or self.default
+        translator = self.translators[model]
+
+        if self.lock.acquire(blocking=False):
+            try:
+                if model in self.resident and model not in self.unloaded and translator.model_is_loaded():
+                    self.resident.move_to_end(model)
+                    return translator
+
+            finally:
+                self.lock.release()
+
+        return await sync_to_thread(self.get, model)
+
+    def unload(self, model: str | None = None, *, to_cpu: bool) -> bool:
+        """
+        Summary
+        -------
+        unload a model and reject its translations until it is loaded again
+
+        Parameters
+        ----------
+        model (str?)
+            the repository of the model, defaulting to the default model
+
+        to_cpu (bool)
+            whether to unload the model to CPU
+
+        Returns
+        -------
+        success (bool)
+            whether the model unload was executed
+        """
+        model = model or self.default
+
+        with self.lock:
+            self.unloaded.add(model)
+            self.resident.pop(model, None)
+            return self.translators[model].unload_model(to_cpu=to_cpu)
+
+    def load(self, model: str | None = None, *, keep_cache: bool) -> bool:
+        """
+        Summary
+        -------
+        load a model that was unloaded and accept its translations again
+
+        Parameters
+        ----------
+        model (str?)
+            the repository of the model, defaulting to the default model
+
+        keep_cache (bool)
+            whether to keep the model cache in RAM
+
+        Returns
+        -------
+        success (bool)
+            whether the model load was executed
+        """
+        model = model or self.default
+
+        with self.lock:
+            self.unloaded.discard(model)
+            loaded = self.translators[model].load_model(keep_cache=keep_cache)
+            self.resident[model] = None
+            self.evict(model)
+
+        return loaded
+
+    def warm_up(self, rounds: int) -> None:
+        """
+        Summary
+        -------
+        translate representative inputs with every loaded model so that the first requests do not pay for it
+
+        Parameters
+        ----------
+        rounds (int)
+            the number of times the representative inputs are translated
+        """
+        for model in list(self.resident):
+            self.translators[model].warm_up(WARMUP_TRANSLATIONS, rounds=rounds)
+
+
+def model_size(repository: str) -> int:
+    """
+    Summary
+    -------
+    get the size of the weights of a model on disk
+
+    Parameters
+    ----------
+    repository (str)
+        the repository of the model
+
+    Returns
+    -------
+    size (int)
+        the size of the model weights in bytes
+    """
+    return sum(path.stat().st_size for path in Path(huggingface_download(repository)).glob("*.bin"))
+
+
+def get_translator_registry(
+    repositories: Sequence[str],
+    factory: Callable[[str], TranslatorProtocol],
+    *,
+    max_bytes: int,
+    stub: bool,
+) -> TranslatorRegistry:
+    """
+    Summary
+    -------
+    load every translator model into a registry, keeping the first model loaded
+
+    Parameters
+    ----------
+    repositories (Sequence[str])
+        the repositories of the models, starting with the default model
+
+    factory (Callable[[str], TranslatorProtocol])
+        a function that loads the translator of a repository
+
+    max_bytes (int)
+        the maximum combined size of the loaded models in bytes, where 0 keeps every model loaded
+
+    stub (bool)
+        whether the translators are stubs without any weights
+
+    Returns
+    -------
+    registry (TranslatorRegistry)
+        the translator registry
+    """
+    registry = TranslatorRegistry(repositories[0], max_bytes=max_bytes)
+
+    with ExitStack() as stack:
+        stack.callback(registry.stack.close)
+
+        for repository in dict.fromkeys(repositories):
+            registry.register(repository, factory(repository), model_size(repository) if max_bytes and not stub else 0)
+
+        stack.pop_all()
+
+    return registry
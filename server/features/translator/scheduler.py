@@ -0,0 +1,957 @@
+from asyncio import AbstractEventLoop, Event, get_running_loop, timeout_at
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator, Sequence
+from contextlib import contextmanager, suppress
+from functools import partial
+from heapq import heapify, heappop, heappush
+from itertools import count
+from logging import getLogger
+from math import ceil, inf
+from threading import Condition, Thread
+from time import monotonic
+from typing import Self
+
+from ctranslate2 import GenerationStepResult
+from opentelemetry.trace import get_current_span
+
+from server.features.translator.budget import MAX_DECODING_LENGTH, is_degenerate
+from server.features.translator.metrics import queue_wait
+from server.typedefs import Priority
+
+THROUGHPUT_SMOOTHING = 0.2
+
+PRIORITY_CLASSES: dict[Priority, int] = {
+    "interactive": 0,
+    "bulk": 1,
+}
+
+
+class QueueFullError(Exception):
+    """
+    Summary
+    -------
+    raised when the scheduler cannot admit more source tokens
+
+    Parameters
+    ----------
+    retry_after (int)
+        the estimated number of seconds until the jobs fit in the queue
+
+    pending_tokens (int)
+        the number of source tokens waiting for, or undergoing, decoding
+    """
+
+    def __init__(self, *, retry_after: int, pending_tokens: int) -> None:
+        super().__init__(f"the translation queue is full with {pending_tokens} pending tokens")
+        self.retry_after = retry_after
+        self.pending_tokens = pending_tokens
+
+
+class DeadlineExceededError(Exception):
+    """
+    Summary
+    -------
+    raised when a translation is abandoned because its deadline has passed
+    """
+
+    def __init__(self) -> None:
+        super().__init__("the translation deadline has passed")
+
+
+def wake(loop: AbstractEventLoop, event: Event, *_) -> None:
+    """
+    Summary
+    -------
+    set an asyncio event from a decoding thread
+
+    Parameters
+    ----------
+    loop (AbstractEventLoop)
+        the event loop that owns the event
+
+    event (Event)
+        the event to set
+    """
+    with suppress(RuntimeError):
+        loop.call_soon_threadsafe(event.set)
+
+
+class TranslationJob:
+    """
+    Summary
+    -------
+    a single translation request that is waiting for, or undergoing, batched decoding
+
+    Attributes
+    ----------
+    source (tuple[str, ...])
+        the source tokens, including the source language token
+
+    target_prefix (tuple[str, ...])
+        the target prefix tokens
+
+    token_count (int)
+        the number of source tokens
+
+    max_length (int)
+        the maximum number of tokens the job may generate
+
+    created_at (float)
+        the monotonic time at which the job was created
+
+    started_at (float?)
+        the monotonic time at which the batch of the job started decoding, if it has
+
+    finished_at (float?)
+        the monotonic time at which the job was done, if it is
+
+    span_context (SpanContext)
+        the span of the request that created the job, linked to from the span of the batch that decodes it
+
+    deadline (float)
+        the monotonic time after which decoding stops, the latest deadline of the requests waiting for the job
+
+    consumers (int)
+        the number of requests waiting for the job
+
+    priority (int)
+        the priority class of the job, where lower classes are always decoded first
+
+    client (str)
+        the client that the job is fairly scheduled against
+
+    token_ids (list[int])
+        the token indices generated so far
+
+    tokens (list[str])
+        the token strings generated so far
+
+    stop_reason (str?)
+        why decoding was stopped before the model finished, either `length`, `degenerate`, `deadline` or `cancelled`
+
+    Methods
+    -------
+    chunks() -> Iterator[list[tuple[int, str]]]
+        block on and yield the tokens generated since the last chunk as they arrive
+
+    chunks_async() -> AsyncGenerator[list[tuple[int, str]]]
+        asynchronously yield the tokens generated since the last chunk as they arrive without blocking a thread
+
+    attach(deadline: float | None) -> None
+        register a request waiting for the job and extend the deadline of the job to cover it
+
+    detach() -> bool
+        unregister a request waiting for the job and return whether no request is left
+
+    push(step: GenerationStepResult) -> bool
+        record a generated token and return whether decoding should stop
+
+    add_done_callback(callback: Callable[[TranslationJob], None]) -> None
+        call a function once the job is done
+
+    finish(error: BaseException | None) -> None
+        mark the job as done, wake up all consumers and call the done callbacks
+
+    result(deadline: float | None) -> list[int]
+        block until the job is done and return the generated token indices
+
+    result_async(deadline: float | None) -> list[int]
+        wait until the job is done without blocking a thread and return the generated token indices
+    """
+
+    __slots__ = (
+        "callbacks",
+        "client",
+        "condition",
+        "consumers",
+        "created_at",
+        "deadline",
+        "error",
+        "finished",
+        "finished_at",
+        "listeners",
+        "max_length",
+        "priority",
+        "source",
+        "span_context",
+        "started_at",
+        "stop_reason",
+        "target_prefix",
+        "token_count",
+        "token_ids",
+        "tokens",
+    )
+
+    def __init__(
+        self,
+        source: tuple[str, ...],
+        target_prefix: tuple[str, ...],
+        *,
+        max_length: int = MAX_DECODING_LENGTH,
+        priority: Priority = "interactive",
+        client: str = "",
+    ) -> None:
+        self.source = source
+        self.target_prefix = target_prefix
+        self.token_count = len(source)
+        self.max_length = max_length
+        self.created_at = monotonic()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.span_context = get_current_span().get_span_context()
+        self.deadline = inf
+        self.consumers = 0
+        self.stop_reason: str | None = None
+        self.priority = PRIORITY_CLASSES[priority]
+        self.client = client
+        self.token_ids: list[int] = []
+        self.tokens: list[str] = []
+        self.finished = False
+        self.error: BaseException | None = None
+        self.condition = Condition()
+        self.callbacks: list[Callable[[TranslationJob], None]] = []
+        self.listeners: list[Callable[[], None]] = []
+
+    def chunks(self) -> Iterator[list[tuple[int, str]]]:
+        """
+        Summary
+        -------
+        block on and yield the tokens generated since the last chunk as they arrive
+
+        Returns
+        -------
+        chunks (Iterator[list[tuple[int, str]]])
+            the newly generated token indices and their token strings
+        """
+        index = 0
+
+        while True:
+            with self.condition:
+                while index >= len(self.token_ids) and not self.finished:
+                    self.condition.wait()
+
+                token_ids = self.token_ids[index:]
+                tokens = self.tokens[index : index + len(token_ids)]
+
+            if not token_ids:
+                break
+
+            index += len(token_ids)
+            yield list(zip(token_ids, tokens, strict=True))
+
+        if self.error is not None:
+            raise self.error
+
+    async def chunks_async(self) -> AsyncGenerator[list[tuple[int, str]]]:
+        """
+        Summary
+        -------
+        asynchronously yield the tokens generated since the last chunk as they arrive without blocking a thread
+
+        Returns
+        -------
+        chunks (AsyncGenerator[list[tuple[int, str]]])
+            the newly generated token indices and their token strings
+        """
+        event = Event()
+        listener = partial(wake, get_running_loop(), event)
+        index = 0
+
+        with self.condition:
+            self.listeners.append(listener)
+
+        try:
+            while True:
+                event.clear()
+
+                with self.condition:
+                    token_ids = self.token_ids[index:]
+                    tokens = self.tokens[index : index + len(token_ids)]
+                    finished = self.finished
+
+                if token_ids:
+                    index += len(token_ids)
+                    yield list(zip(token_ids, tokens, strict=True))
+
+                elif finished:
+                    break
+
+                else:
+                    await event.wait()
+
+        finally:
+            with self.condition:
+                self.listeners.remove(listener)
+
+        if self.error is not None:
+            raise self.error
+
+    def attach(self, deadline: float | None = None) -> None:
+        """
+        Summary
+        -------
+        register a request waiting for the job and extend the deadline of the job to cover it
+
+        Parameters
+        ----------
+        deadline (float?)
+            the monotonic time after which the request gives up, if any
+        """
+        deadline = inf if deadline is None else deadline
+        self.deadline = max(self.deadline, deadline) if self.consumers else deadline
+        self.consumers += 1
+
+    def detach(self) -> bool:
+        """
+        Summary
+        -------
+        unregister a request waiting for the job and return whether no request is left
+
+        Returns
+        -------
+        abandoned (bool)
+            whether the job is unfinished and no request is waiting for it
+        """
+        self.consumers -= 1
+        return not self.consumers and not self.finished
+
+    def push(self, step: GenerationStepResult) -> bool:
+        """
+        Summary
+        -------
+        record a generated token and return whether decoding should stop
+
+        Parameters
+        ----------
+        step (GenerationStepResult)
+            the generation step result
+
+        Returns
+        -------
+        stop (bool)
+            whether the job was cancelled, has exhausted its decoding budget or deadline, or has degenerated
+        """
+        if step.is_last:
+            return False
+
+        if self.stop_reason is not None:
+            return True
+
+        with self.condition:
+            self.token_ids.append(step.token_id)
+            self.tokens.append(step.token)
+            self.condition.notify_all()
+
+            for listener in self.listeners:
+                listener()
+
+        if len(self.token_ids) >= self.max_length:
+            self.stop_reason = "length"
+
+        elif monotonic() >= self.deadline:
+            self.stop_reason = "deadline"
+
+        elif is_degenerate(self.token_ids, self.token_count):
+            self.stop_reason = "degenerate"
+
+        return self.stop_reason is not None
+
+    def add_done_callback(self, callback: Callable[[TranslationJob], None]) -> None:
+        """
+        Summary
+        -------
+        call a function once the job is done, or immediately if it is already done
+
+        Parameters
+        ----------
+        callback (Callable[[TranslationJob], None])
+            the function to call with the finished job
+        """
+        with self.condition:
+            if not self.finished:
+                self.callbacks.append(callback)
+                return
+
+        callback(self)
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """
+        Summary
+        -------
+        mark the job as done, wake up all consumers and call the done callbacks, logging any callback that fails so that
+        the remaining callbacks still run
+
+        Parameters
+        ----------
+        error (BaseException?)
+            the error raised during decoding, if any
+        """
+        with self.condition:
+            self.error = error
+            self.finished = True
+            self.finished_at = monotonic()
+            self.condition.notify_all()
+
+            for listener in self.listeners:
+                listener()
+
+        for callback in self.callbacks:
+            try:
+                callback(self)
+
+            except Exception:
+                getLogger(__name__).exception("A done callback of a translation job failed")
+
+    def result(self, deadline: float | None = None) -> list[int]:
+        """
+        Summary
+        -------
+        block until the job is done and return the generated token indices
+
+        Parameters
+        ----------
+        deadline (float?)
+            the monotonic time after which to stop waiting, if any
+
+        Returns
+        -------
+        token_ids (list[int])
+            the generated token indices
+
+        Raises
+        ------
+        DeadlineExceededError
+            if the deadline passes before the job is done
+        """
+        with self.condition:
+            while not self.finished:
+                if deadline is None:
+                    self.condition.wait()
+
+                elif (remaining := deadline - monotonic()) > 0:
+                    self.condition.wait(remaining)
+
+                else:
+                    raise DeadlineExceededError
+
+        if self.error is not None:
+            raise self.error
+
+        return self.token_ids
+
+    async def result_async(self, deadline: float | None = None) -> list[int]:
+        """
+        Summary
+        -------
+        wait until the job is done without blocking a thread and return the generated token indices
+
+        Parameters
+        ----------
+        deadline (float?)
+            the monotonic time after which to stop waiting, if any
+
+        Returns
+        -------
+        token_ids (list[int])
+            the generated token indices
+
+        Raises
+        ------
+        DeadlineExceededError
+            if the deadline passes before the job is done
+        """
+        event = Event()
+        self.add_done_callback(partial(wake, get_running_loop(), event))
+
+        try:
+            async with timeout_at(deadline):
+                await event.wait()
+
+        except TimeoutError:
+            raise DeadlineExceededError from None
+
+        if self.error is not None:
+            raise self.error
+
+        return self.token_ids
+
+
+class Scheduler:
+    """
+    Summary
+    -------
+    a dynamic micro-batching scheduler that gathers concurrent jobs into a single decoding batch
+
+    Jobs of a lower priority class are always dispatched first. Within a class, jobs are dispatched in order of their
+    virtual finish tags, so that each client receives a fair share of the decoded tokens no matter how much it queues.
+
+    Parameters
+    ----------
+    process (Callable[[Sequence[TranslationJob]], None])
+        the function that decodes a batch of jobs
+
+    workers (int)
+        the number of batches that may be decoded in parallel
+
+    batch_window (float)
+        the number of seconds to wait for more jobs before dispatching a batch
+
+    max_batch_tokens (int)
+        the maximum number of padded source tokens in a batch
+
+    max_pending_tokens (int)
+        the maximum number of source tokens waiting for, or undergoing, decoding, where 0 disables the limit
+
+    idle_timeout (float)
+        the number of seconds without pending jobs before the idle callback is called, where 0 disables it
+
+    on_idle (Callable[[], object]?)
+        the function called once whenever the scheduler becomes idle
+
+    Methods
+    -------
+    paused() -> Generator[None]
+        stop dispatching batches and wait for the batches being decoded to finish
+
+    submit(job: TranslationJob) -> TranslationJob
+        queue a job for batched decoding
+
+    submit_many(jobs: Sequence[TranslationJob]) -> Sequence[TranslationJob]
+        queue consecutive jobs for batched decoding
+
+    cancel(jobs: Sequence[TranslationJob]) -> None
+        stop jobs that no request is waiting for, dropping them from the queue or from the batch being decoded
+
+    status() -> tuple[int, int, float, float]
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
+    """
+
+    __slots__ = (
+        "batch_window",
+        "closed",
+        "condition",
+        "decoding",
+        "finish_tags",
+        "idle",
+        "idle_timeout",
+        "jobs",
+        "last_active",
+        "max_batch_tokens",
+        "max_pending_tokens",
+        "on_idle",
+        "pauses",
+        "pending_jobs",
+        "pending_tokens",
+        "process",
+        "sequence",
+        "threads",
+        "throughput",
+        "virtual_times",
+    )
+
+    def __init__(
+        self,
+        process: Callable[[Sequence[TranslationJob]], None],
+        *,
+        workers: int,
+        batch_window: float,
+        max_batch_tokens: int,
+        max_pending_tokens: int = 0,
+        idle_timeout: float = 0,
+        on_idle: Callable[[], object] | None = None,
+    ) -> None:
+        self.process = process
+        self.batch_window = batch_window
+        self.max_batch_tokens = max_batch_tokens
+        self.max_pending_tokens = max_pending_tokens
+        self.pending_jobs = 0
+        self.pending_tokens = 0
+        self.throughput = 0.0
+        self.jobs: list[tuple[int, float, int, TranslationJob]] = []
+        self.finish_tags: dict[tuple[int, str], float] = {}
+        self.virtual_times = [0.0] * len(PRIORITY_CLASSES)
+        self.sequence = count()
+        self.condition = Condition()
+        self.idle_timeout = idle_timeout
+        self.on_idle = on_idle
+        self.last_active = monotonic()
+        self.idle = False
+        self.decoding = 0
+        self.pauses = 0
+        self.closed = False
+        self.threads = [Thread(target=self.work, daemon=True) for _ in range(max(workers, 1))]
+
+        if idle_timeout and on_idle is not None:
+            self.threads.append(Thread(target=self.watch, daemon=True))
+
+    def __enter__(self) -> Self:
+        for thread in self.threads:
+            thread.start()
+
+        return self
+
+    def __exit__(self, *_) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+        for thread in self.threads:
+            thread.join()
+
+    @contextmanager
+    def paused(self) -> Generator[None]:
+        """
+        Summary
+        -------
+        stop dispatching batches and wait for the batches being decoded to finish
+
+        Returns
+        -------
+        context (Generator[None])
+            a context in which no batch is being decoded
+        """
+        with self.condition:
+            self.pauses += 1
+
+            while self.decoding:
+                self.condition.wait()
+
+        try:
+            yield
+
+        finally:
+            with self.condition:
+                self.pauses -= 1
+                self.condition.notify_all()
+
+    def wait_idle(self) -> bool:
+        """
+        Summary
+        -------
+        block until no job has been pending for the idle timeout since the scheduler was last active
+
+        Returns
+        -------
+        idle (bool)
+            whether the scheduler became idle, false if the scheduler was closed first
+        """
+        with self.condition:
+            while not self.closed:
+                remaining = self.last_active + self.idle_timeout - monotonic()
+
+                if not self.idle and not self.pending_jobs and remaining <= 0:
+                    self.idle = True
+                    return True
+
+                self.condition.wait(None if self.idle else remaining if remaining > 0 else self.idle_timeout)
+
+            return False
+
+    def watch(self) -> None:
+        """
+        Summary
+        -------
+        call the idle callback whenever the scheduler becomes idle until the scheduler is closed
+        """
+        while self.wait_idle() and self.on_idle is not None:
+            self.on_idle()
+
+    def fits(self, batch: list[TranslationJob], job: TranslationJob) -> bool:
+        """
+        Summary
+        -------
+        check if a job can join the batch without exceeding the padded token budget
+
+        Parameters
+        ----------
+        batch (list[TranslationJob])
+            the batch being gathered
+
+        job (TranslationJob)
+            the candidate job
+
+        Returns
+        -------
+        fits (bool)
+            whether the job fits in the batch
+        """
+        longest = max(job.token_count, *(queued_job.token_count for queued_job in batch))
+        return longest * (len(batch) + 1) <= self.max_batch_tokens
+
+    def enqueue(self, job: TranslationJob) -> None:
+        """
+        Summary
+        -------
+        tag a job with its virtual finish time and queue it, where the caller must hold the condition
+
+        Parameters
+        ----------
+        job (TranslationJob)
+            the job to queue
+        """
+        lane = (job.priority, job.client)
+        start = max(self.virtual_times[job.priority], self.finish_tags.get(lane, 0.0))
+        self.finish_tags[lane] = finish = start + job.token_count
+        heappush(self.jobs, (job.priority, finish, next(self.sequence), job))
+
+    def dequeue(self) -> TranslationJob:
+        """
+        Summary
+        -------
+        remove the job with the highest priority and the earliest virtual finish time, where the caller must hold the
+        condition
+
+        Returns
+        -------
+        job (TranslationJob)
+            the next job to decode
+        """
+        _, finish, _, job = heappop(self.jobs)
+        self.virtual_times[job.priority] = max(self.virtual_times[job.priority], finish - job.token_count)
+
+        if not self.jobs:
+            self.finish_tags.clear()
+            self.virtual_times = [0.0] * len(PRIORITY_CLASSES)
+
+        return job
+
+    def next_batch(self) -> list[TranslationJob]:
+        """
+        Summary
+        -------
+        block until a job arrives and gather more jobs until the batch window elapses or the token budget is hit
+
+        Returns
+        -------
+        batch (list[TranslationJob])
+            the jobs to decode together, empty if the scheduler is closed
+        """
+        with self.condition:
+            while (not self.jobs or self.pauses) and not self.closed:
+                self.condition.wait()
+
+            if not self.jobs:
+                return []
+
+            self.decoding += 1
+            batch = [self.dequeue()]
+            deadline = monotonic() + self.batch_window
+
+            while True:
+                if self.jobs:
+                    if not self.fits(batch, self.jobs[0][3]):
+                        break
+
+                    batch.append(self.dequeue())
+                    continue
+
+                if self.closed or (remaining := deadline - monotonic()) <= 0:
+                    break
+
+                self.condition.wait(remaining)
+
+            return batch
+
+    def work(self) -> None:
+        """
+        Summary
+        -------
+        decode batches until the scheduler is closed
+        """
+        while batch := self.next_batch():
+            start = monotonic()
+            batch_tokens = sum(job.token_count for job in batch)
+            error: Exception | None = None
+
+            for job in batch:
+                job.started_at = start
+                queue_wait.record(start - job.created_at)
+
+                if job.stop_reason is None and job.deadline <= start:
+                    job.stop_reason = "deadline"
+
+            try:
+                if live_jobs := [job for job in batch if job.stop_reason is None]:
+                    self.process(live_jobs)
+
+            except Exception as exception:  # noqa: BLE001
+                error = exception
+
+            finally:
+                try:
+                    for job in batch:
+                        job.finish(DeadlineExceededError() if job.stop_reason == "deadline" else error)
+
+                finally:
+                    self.release(batch_tokens, len(batch), monotonic() - start)
+
+    def release(self, batch_tokens: int, batch_size: int, elapsed: float) -> None:
+        """
+        Summary
+        -------
+        remove a decoded batch from the pending work, mark the scheduler as active and update the decoding throughput
+
+        Parameters
+        ----------
+        batch_tokens (int)
+            the number of source tokens in the batch
+
+        batch_size (int)
+            the number of jobs in the batch
+
+        elapsed (float)
+            the number of seconds spent decoding the batch
+        """
+        with self.condition:
+            self.pending_tokens -= batch_tokens
+            self.pending_jobs -= batch_size
+            self.decoding -= 1
+            self.last_active = monotonic()
+            self.idle = False
+            self.condition.notify_all()
+
+            if elapsed > 0:
+                throughput = batch_tokens / elapsed
+                self.throughput = (
+                    throughput
+                    if not self.throughput
+                    else self.throughput + THROUGHPUT_SMOOTHING * (throughput - self.throughput)
+                )
+
+    def admit(self, jobs: Sequence[TranslationJob]) -> None:
+        """
+        Summary
+        -------
+        reserve room for the jobs in the pending work, where the caller must hold the condition
+
+        Parameters
+        ----------
+        jobs (Sequence[TranslationJob])
+            the jobs to admit
+
+        Raises
+        ------
+        QueueFullError
+            if other jobs are pending and the jobs would exceed the pending token limit
+        """
+        tokens = sum(job.token_count for job in jobs)
+        excess = self.pending_tokens + tokens - self.max_pending_tokens
+
+        if self.max_pending_tokens and self.pending_tokens and excess > 0:
+            retry_after = ceil(excess / self.throughput) if self.throughput else 1
+            raise QueueFullError(retry_after=max(retry_after, 1), pending_tokens=self.pending_tokens)
+
+        self.pending_tokens += tokens
+        self.pending_jobs += len(jobs)
+
+    def status(self) -> tuple[int, int, float, float]:
+        """
+        Summary
+        -------
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
+
+        Returns
+        -------
+        pending_jobs (int)
+            the number of jobs waiting for, or undergoing, decoding
+
+        pending_tokens (int)
+            the number of source tokens waiting for, or undergoing, decoding
+
+        estimated_wait (float)
+            the estimated number of seconds before a new job finishes decoding
+
+        throughput (float)
+            the recent decoding throughput in source tokens per second
+        """
+        with self.condition:
+            estimated_wait = self.pending_tokens / self.throughput if self.throughput else 0.0
+            return self.pending_jobs, self.pending_tokens, estimated_wait, self.throughput
+
+    def submit(self, job: TranslationJob) -> TranslationJob:
+        """
+        Summary
+        -------
+        queue a job for batched decoding
+
+        Parameters
+        ----------
+        job (TranslationJob)
+            the job to queue
+
+        Returns
+        -------
+        job (TranslationJob)
+            the queued job
+
+        Raises
+        ------
+        QueueFullError
+            if the job would exceed the pending token limit
+        """
+        with self.condition:
+            self.admit([job])
+            self.enqueue(job)
+            self.condition.notify_all()
+
+        return job
+
+    def submit_many(self, jobs: Sequence[TranslationJob]) -> Sequence[TranslationJob]:
+        """
+        Summary
+        -------
+        queue consecutive jobs for batched decoding
+
+        Parameters
+        ----------
+        jobs (Sequence[TranslationJob])
+            the jobs to queue in order
+
+        Returns
+        -------
+        jobs (Sequence[TranslationJob])
+            the queued jobs
+
+        Raises
+        ------
+        QueueFullError
+            if the jobs would exceed the pending token limit
+        """
+        with self.condition:
+            self.admit(jobs)
+
+            for job in jobs:
+                self.enqueue(job)
+            self.condition.notify_all()
+
+        return jobs
+
+    def cancel(self, jobs: Sequence[TranslationJob]) -> None:
+        """
+        Summary
+        -------
+        stop jobs that no request is waiting for, dropping them from the queue or from the batch being decoded
+
+        Parameters
+        ----------
+        jobs (Sequence[TranslationJob])
+            the abandoned jobs
+        """
+        cancelled = {id(job) for job in jobs}
+
+        with self.condition:
+            for job in jobs:
+                job.stop_reason = "cancelled"
+
+            if queued := [job for *_, job in self.jobs if id(job) in cancelled]:
+                self.jobs = [entry for entry in self.jobs if id(entry[3]) not in cancelled]
+                heapify(self.jobs)
+                self.pending_tokens -= sum(job.token_count for job in queued)
+                self.pending_jobs -= len(queued)
+                self.condition.notify_all()
+
+                if not self.jobs:
+                    self.finish_tags.clear()
+                    self.virtual_times = [0.0] * len(PRIORITY_CLASSES)
+
+        for job in queued:
+            job.finish()
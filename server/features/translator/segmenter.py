@@ -0,0 +1,72 @@
+from collections.abc import Iterable
+from re import compile as compile_regex
+
+ABBREVIATIONS = ("Dr", "Mr", "Mrs", "Ms", "Prof", "St", "Mt", "vs", "Fig", "Gen", "Col", "Lt", "Sgt", "Rev")
+NOT_AFTER_ABBREVIATION = (
+    "".join(rf"(?<!\b{abbreviation}\.)" for abbreviation in ABBREVIATIONS) + r"(?<!\b[A-Z]\.)(?<!\.[A-Za-z]\.)"
+)
+SENTENCE_BOUNDARY = compile_regex(
+    r"(\s*\n\s*"
+    rf"|(?<=[.!?…]){NOT_AFTER_ABBREVIATION}\s+(?![a-z])"
+    r"|(?<=[.!?…][\"'”’»)\]])\s+(?![a-z])"  # noqa: RUF001
+    r"|(?<=[。！？]))"  # noqa: RUF001
+)
+
+
+def split_sentences(text: str) -> tuple[list[str], list[str]]:
+    """
+    Summary
+    -------
+    split the input into sentences while keeping the whitespace between them
+
+    Parameters
+    ----------
+    text (str)
+        the input to split
+
+    Returns
+    -------
+    sentences (list[str])
+        the sentences without surrounding whitespace
+
+    separators (list[str])
+        the whitespace around the sentences, always one more than the number of sentences
+    """
+    sentences: list[str] = []
+    separators = [""]
+
+    for index, piece in enumerate(SENTENCE_BOUNDARY.split(text)):
+        if index % 2 or not (sentence := piece.strip()):
+            separators[-1] += piece
+            continue
+
+        leading_whitespace = len(piece) - len(piece.lstrip())
+        separators[-1] += piece[:leading_whitespace]
+        sentences.append(sentence)
+        separators.append(piece[leading_whitespace + len(sentence) :])
+
+    return sentences, separators
+
+
+def join_sentences(sentences: Iterable[str], separators: list[str]) -> str:
+    """
+    Summary
+    -------
+    put translated sentences back together with the original whitespace
+
+    Parameters
+    ----------
+    sentences (Iterable[str])
+        the translated sentences
+
+    separators (list[str])
+        the whitespace returned by `split_sentences`
+
+    Returns
+    -------
+    text (str)
+        the reassembled text
+    """
+    return separators[0] + "".join(
+        f"{sentence}{separator}" for sentence, separator in zip(sentences, separators[1:], strict=True)
+    )
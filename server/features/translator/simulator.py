@@ -0,0 +1,408 @@
+from collections.abc import Callable, Iterable, Sequence
+from math import ceil
+from os import process_cpu_count
+from random import Random
+from threading import Lock
+from time import sleep
+from typing import Any, NamedTuple
+
+from server.features.translator.detokeniser import WORD_BOUNDARY
+
+SIMULATED_LENGTH_RATIO = 1.2
+SIMULATED_BATCH_STEP_COST = 0.05
+SIMULATED_RUNAWAY_CYCLE = 3
+SIMULATED_END_TOKEN = "</s>"  # noqa: S105
+
+
+class SimulatedEncoding:
+    """
+    Summary
+    -------
+    the tokens of a simulated encoding
+
+    Parameters
+    ----------
+    tokens (list[str])
+        the SentencePiece-like tokens of the input
+
+    Attributes
+    ----------
+    tokens (list[str])
+        the SentencePiece-like tokens of the input
+    """
+
+    __slots__ = ("tokens",)
+
+    def __init__(self, tokens: list[str]) -> None:
+        self.tokens = tokens
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+
+class SimulatedStep(NamedTuple):
+    """
+    Summary
+    -------
+    a simulated generation step result
+
+    Attributes
+    ----------
+    batch_id (int)
+        the index of the input in the batch
+
+    step (int)
+        the decoding step
+
+    token_id (int)
+        the generated token index
+
+    token (str)
+        the generated token string
+
+    is_last (bool)
+        whether the step is the last one of the input
+    """
+
+    batch_id: int
+    step: int
+    token_id: int
+    token: str
+    is_last: bool
+
+
+class SimulatedTokeniser:
+    """
+    Summary
+    -------
+    a tokeniser that splits inputs into words and spends a fixed time on every token it encodes or decodes
+
+    Parameters
+    ----------
+    latency (float)
+        the number of seconds spent on each token
+
+    Methods
+    -------
+    token_to_id(token: str) -> int
+        get the index of a token, adding it to the vocabulary if it is new
+
+    encode(sequence: str) -> SimulatedEncoding
+        tokenise an input
+
+    encode_batch(sequences: Sequence[str]) -> list[SimulatedEncoding]
+        tokenise a batch of inputs
+
+    decode(ids: Sequence[int]) -> str
+        detokenise a sequence of token indices
+
+    decode_batch(ids: Sequence[Sequence[int]]) -> list[str]
+        detokenise a batch of token index sequences
+    """
+
+    __slots__ = ("latency", "lock", "tokens", "vocabulary")
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.lock = Lock()
+        self.vocabulary: dict[str, int] = {}
+        self.tokens: list[str] = []
+
+    def token_to_id(self, token: str) -> int:
+        """
+        Summary
+        -------
+        get the index of a token, adding it to the vocabulary if it is new
+
+        Parameters
+        ----------
+        token (str)
+            the token string
+
+        Returns
+        -------
+        token_id (int)
+            the token index
+        """
+        if (token_id := self.vocabulary.get(token)) is not None:
+            return token_id
+
+        with self.lock:
+            if (token_id := self.vocabulary.get(token)) is None:
+                token_id = self.vocabulary[token] = len(self.tokens)
+                self.tokens.append(token)
+
+        return token_id
+
+    def encode(self, sequence: str) -> SimulatedEncoding:
+        """
+        Summary
+        -------
+        tokenise an input
+
+        Parameters
+        ----------
+        sequence (str)
+            the input to tokenise
+
+        Returns
+        -------
+        encoding (SimulatedEncoding)
+            the tokens of the input
+        """
+        tokens = [f"{WORD_BOUNDARY}{word}" for word in sequence.split()]
+        sleep(self.latency * len(tokens))
+
+        return SimulatedEncoding(tokens)
+
+    def encode_batch(self, sequences: Sequence[str]) -> list[SimulatedEncoding]:
+        """
+        Summary
+        -------
+        tokenise a batch of inputs
+
+        Parameters
+        ----------
+        sequences (Sequence[str])
+            the inputs to tokenise
+
+        Returns
+        -------
+        encodings (list[SimulatedEncoding])
+            the tokens of each input
+        """
+        return [self.encode(sequence) for sequence in sequences]
+
+    def decode(self, ids: Sequence[int]) -> str:
+        """
+        Summary
+        -------
+        detokenise a sequence of token indices
+
+        Parameters
+        ----------
+        ids (Sequence[int])
+            the token indices
+
+        Returns
+        -------
+        text (str)
+            the detokenised text
+        """
+        sleep(self.latency * len(ids))
+        return "".join(self.tokens[token_id] for token_id in ids).replace(WORD_BOUNDARY, " ").strip()
+
+    def decode_batch(self, ids: Sequence[Sequence[int]]) -> list[str]:
+        """
+        Summary
+        -------
+        detokenise a batch of token index sequences
+
+        Parameters
+        ----------
+        ids (Sequence[Sequence[int]])
+            the token indices of each sequence
+
+        Returns
+        -------
+        texts (list[str])
+            the detokenised texts
+        """
+        return [self.decode(sequence) for sequence in ids]
+
+
+class SimulatedCTranslator:
+    """
+    Summary
+    -------
+    a CTranslate2 translator that echoes its inputs at the pace of a real model sharing the cores of the host
+
+    Parameters
+    ----------
+    tokeniser (SimulatedTokeniser)
+        the tokeniser that owns the vocabulary of the generated tokens
+
+    inter_threads (int)
+        the number of batches that may be decoded in parallel
+
+    intra_threads (int)
+        the number of threads used to decode each batch, where 0 splits the cores between the batches
+
+    step_latency (float)
+        the number of seconds a decoding step of a single input takes when its batch has the cores it needs
+
+    runaway_rate (float)
+        the share of inputs that never generate an end token and repeat themselves until they are stopped
+
+    seed (int)
+        the seed of the inputs that run away
+
+    Attributes
+    ----------
+    model_is_loaded (bool)
+        whether the simulated model is loaded
+
+    Methods
+    -------
+    unload_model(*, to_cpu: bool) -> None
+        mark the model as unloaded
+
+    load_model(*, keep_cache: bool) -> None
+        mark the model as loaded
+
+    translate_batch(source: Iterable[Sequence[str]], target_prefix: Iterable[Sequence[str]], **options) -> list
+        generate a translation for each input, calling back on every step and stopping an input when asked to
+    """
+
+    __slots__ = (
+        "active",
+        "cores",
+        "lock",
+        "model_is_loaded",
+        "random",
+        "runaway_rate",
+        "step_latency",
+        "threads_per_batch",
+        "tokeniser",
+    )
+
+    def __init__(
+        self,
+        tokeniser: SimulatedTokeniser,
+        *,
+        inter_threads: int,
+        intra_threads: int,
+        step_latency: float,
+        runaway_rate: float,
+        seed: int = 0,
+    ) -> None:
+        self.tokeniser = tokeniser
+        self.cores = process_cpu_count() or 1
+        self.threads_per_batch = intra_threads or max(1, self.cores // inter_threads)
+        self.step_latency = step_latency
+        self.runaway_rate = runaway_rate
+        self.random = Random(seed)  # noqa: S311
+        self.lock = Lock()
+        self.active = 0
+        self.model_is_loaded = True
+
+    def unload_model(self, *, to_cpu: bool) -> None:  # noqa: ARG002
+        """
+        Summary
+        -------
+        mark the model as unloaded
+
+        Parameters
+        ----------
+        to_cpu (bool)
+            whether the model would be unloaded to CPU
+        """
+        self.model_is_loaded = False
+
+    def load_model(self, *, keep_cache: bool) -> None:  # noqa: ARG002
+        """
+        Summary
+        -------
+        mark the model as loaded
+
+        Parameters
+        ----------
+        keep_cache (bool)
+            whether the model cache would be kept in RAM
+        """
+        self.model_is_loaded = True
+
+    def generated_tokens(self, source: Sequence[str], max_decoding_length: int) -> list[str]:
+        """
+        Summary
+        -------
+        choose the tokens generated for an input, echoing it at a typical length or repeating it until stopped
+
+        Parameters
+        ----------
+        source (Sequence[str])
+            the source tokens, starting with the source language token
+
+        max_decoding_length (int)
+            the maximum number of tokens to generate
+
+        Returns
+        -------
+        tokens (list[str])
+            the tokens to generate, followed by the end token if the input does not run away
+        """
+        words = list(source[1:]) or [f"{WORD_BOUNDARY}."]
+
+        with self.lock:
+            runaway = self.random.random() < self.runaway_rate
+
+        if runaway:
+            cycle = words[:SIMULATED_RUNAWAY_CYCLE]
+            return [cycle[index % len(cycle)] for index in range(max_decoding_length)]
+
+        length = min(max_decoding_length, ceil(SIMULATED_LENGTH_RATIO * len(words)))
+        return [*(words[index % len(words)] for index in range(length)), SIMULATED_END_TOKEN]
+
+    def translate_batch(
+        self,
+        source: Iterable[Sequence[str]],
+        target_prefix: Iterable[Sequence[str]],  # noqa: ARG002
+        *,
+        max_decoding_length: int = 256,
+        callback: Callable[[SimulatedStep], bool] | None = None,
+        **_: Any,  # noqa: ANN401
+    ) -> list[Any]:
+        """
+        Summary
+        -------
+        generate a translation for each input, calling back on every step and stopping an input when asked to
+
+        Parameters
+        ----------
+        source (Iterable[Sequence[str]])
+            the source tokens of each input
+
+        target_prefix (Iterable[Sequence[str]])
+            the target prefix of each input
+
+        max_decoding_length (int)
+            the maximum number of tokens to generate for each input
+
+        callback (Callable[[SimulatedStep], bool]?)
+            the function called on every generated token, returning whether to stop the input
+
+        Returns
+        -------
+        results (list[Any])
+            no results, as translations are only delivered through the callback
+        """
+        pending = {
+            batch_id: self.generated_tokens(tokens, max_decoding_length) for batch_id, tokens in enumerate(source)
+        }
+
+        with self.lock:
+            self.active += 1
+
+        try:
+            for step in range(max_decoding_length + 1):
+                if not pending:
+                    break
+
+                with self.lock:
+                    contention = max(1.0, self.active * self.threads_per_batch / self.cores)
+
+                sleep(self.step_latency * contention * (1 + SIMULATED_BATCH_STEP_COST * (len(pending) - 1)))
+
+                for batch_id, tokens in list(pending.items()):
+                    token = tokens[step]
+                    is_last = token == SIMULATED_END_TOKEN or step + 1 == len(tokens)
+                    result = SimulatedStep(batch_id, step, self.tokeniser.token_to_id(token), token, is_last)
+
+                    if (callback is not None and callback(result)) or is_last:
+                        del pending[batch_id]
+
+        finally:
+            with self.lock:
+                self.active -= 1
+
+        return []
@@ -1,8 +1,9 @@
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator, Iterator, Sequence
 from typing import Self
 
 from server.features.translator.protocol import TranslatorProtocol
-from server.typedefs import Language
+from server.features.translator.segmenter import join_sentences, split_sentences
+from server.typedefs import Language, Priority
 
 
 class TranslatorStub(TranslatorProtocol):
@@ -13,23 +14,40 @@ class TranslatorStub(TranslatorProtocol):
 
     Methods
     -------
-    translate_generator(text: str, source_language: Language, target_language: Language) -> Iterator[str]
-        translate the input from the source language to the target language tokens
-
-    translate(text: str, source_language: Language, target_language: Language) -> str
+    translate(text: str, source_language: Language, target_language: Language, *, segment: bool) -> str
         translate the input from the source language to the target language
 
-    translate_stream(text: str, source_language: Language, target_language: Language) -> Iterator[str]
+    translate_stream(text: str, source_language: Language, target_language: Language, *, segment: bool) -> Iterator[str]
         streams the translation input from the source language to the target language
 
-    unload_model(to_cpu: bool) -> bool
+    translate_batch(translations: Sequence[tuple[str, Language, Language]]) -> list[str]
+        translate a batch of inputs, each from its own source language to its own target language
+
+    translate_async(text: str, source_language: Language, target_language: Language, *, segment: bool) -> str
+        translate the input without blocking a thread
+
+    translate_stream_async(text: str, source_language: Language, target_language: Language, *, segment: bool)
+        streams the translation of the input without blocking a thread
+
+    translate_batch_async(translations: Sequence[tuple[str, Language, Language]]) -> list[str]
+        translate a batch of inputs without blocking a thread
+
+    unload_model(to_cpu: bool, idle_only: bool) -> bool
         unload the model from the current device
 
     load_model(keep_cache: bool) -> bool
         load the model back to the initial device
 
+    model_is_loaded() -> bool
+        check whether the model is loaded on its device
+
     count_tokens(text: str) -> int
         count the number of tokens in the input text
+
+    queue_status() -> tuple[int, int, float, float]
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
+    warm_up(translations: Sequence[tuple[str, Language, Language]], *, rounds: int) -> None
+        translate representative inputs so that lazily initialised resources are ready before the first request
     """
 
     def __enter__(self) -> Self:
@@ -38,7 +56,7 @@ class TranslatorStub(TranslatorProtocol):
     def __exit__(self, *_) -> None:
         pass
 
-    def unload_model(self, *, to_cpu: bool) -> bool:
+    def unload_model(self, *, to_cpu: bool, idle_only: bool = False) -> bool:  # noqa: ARG002
         """
         Summary
         -------
@@ -49,6 +67,9 @@ class TranslatorStub(TranslatorProtocol):
         to_cpu (bool)
             whether to unload the model to CPU
 
+        idle_only (bool)
+            whether to leave the model loaded if any job is waiting for, or undergoing, decoding
+
         Returns
         -------
         success (bool)
@@ -74,6 +95,58 @@ class TranslatorStub(TranslatorProtocol):
         """
         return keep_cache
 
+    def model_is_loaded(self) -> bool:
+        """
+        Summary
+        -------
+        check whether the model is loaded on its device
+
+        Returns
+        -------
+        loaded (bool)
+            always true, as the stub has no model to unload
+        """
+        return True
+
+    def queue_status(self) -> tuple[int, int, float, float]:
+        """
+        Summary
+        -------
+        get the number of pending jobs, the number of pending tokens, the estimated wait and the decoding throughput
+
+        Returns
+        -------
+        pending_jobs (int)
+            the number of jobs waiting for, or undergoing, decoding
+
+        pending_tokens (int)
+            the number of source tokens waiting for, or undergoing, decoding
+
+        estimated_wait (float)
+            the estimated number of seconds before a new job finishes decoding
+
+        throughput (float)
+            the recent decoding throughput in source tokens per second
+        """
+        return 0, 0, 0.0, 0.0
+
+    def warm_up(self, translations: Sequence[tuple[str, Language, Language]], *, rounds: int) -> None:
+        """
+        Summary
+        -------
+        translate representative inputs so that lazily initialised resources are ready before the first request
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the representative inputs with their source and target languages
+
+        rounds (int)
+            the number of times the representative inputs are translated
+        """
+        for _ in range(rounds):
+            self.translate_batch(translations)
+
     def count_tokens(self, text: str) -> int:
         """
         Summary
@@ -92,7 +165,17 @@ class TranslatorStub(TranslatorProtocol):
         """
         return len(text.split())
 
-    def translate(self, text: str, source_language: Language, target_language: Language) -> str:
+    def translate(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> str:
         """
         Summary
         -------
@@ -109,14 +192,47 @@ class TranslatorStub(TranslatorProtocol):
         target_language (Languages)
             the target language
 
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
         Returns
         -------
         translated_text (str)
             the translated text
         """
-        return f"{text} from {source_language} to {target_language}"
+        if not segment:
+            return f"{text} from {source_language} to {target_language}"
 
-    def translate_stream(self, text: str, source_language: Language, target_language: Language) -> Iterator[str]:
+        sentences, separators = split_sentences(text)
+        translations = self.translate_batch(
+            [(sentence, source_language, target_language) for sentence in sentences],
+            priority=priority,
+            client=client,
+            deadline=deadline,
+        )
+
+        return join_sentences(translations, separators)
+
+    def translate_stream(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",  # noqa: ARG002
+        client: str = "",  # noqa: ARG002
+        deadline: float | None = None,  # noqa: ARG002
+    ) -> Iterator[str]:
         """
         Summary
         -------
@@ -133,9 +249,210 @@ class TranslatorStub(TranslatorProtocol):
         target_language (Languages)
             the target language
 
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
         Returns
         -------
         translated_text (Iterator[str])
             the translated text
         """
-        yield from (f"{word} from {source_language} to {target_language}" for word in text.split())
+        sentences, separators = split_sentences(text) if segment else ([text], ["", ""])
+
+        if separators[0]:
+            yield separators[0]
+
+        for sentence, separator in zip(sentences, separators[1:], strict=True):
+            yield from (f"{word} from {source_language} to {target_language}" for word in sentence.split())
+
+            if separator:
+                yield separator
+
+    def translate_batch(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> list[str]:
+        """
+        Summary
+        -------
+        translate a batch of inputs, each from its own source language to its own target language
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_texts (list[str])
+            the translated texts in the same order as the inputs
+        """
+        return [
+            self.translate(text, source_language, target_language, priority=priority, client=client, deadline=deadline)
+            for text, source_language, target_language in translations
+        ]
+
+    async def translate_async(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> str:
+        """
+        Summary
+        -------
+        translate the input without blocking a thread
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (str)
+            the translated text
+        """
+        return self.translate(
+            text,
+            source_language,
+            target_language,
+            segment=segment,
+            priority=priority,
+            client=client,
+            deadline=deadline,
+        )
+
+    async def translate_stream_async(
+        self,
+        text: str,
+        source_language: Language,
+        target_language: Language,
+        *,
+        segment: bool = False,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> AsyncGenerator[str]:
+        """
+        Summary
+        -------
+        streams the translation of the input without blocking a thread
+
+        Parameters
+        ----------
+        text (str)
+            the input to translate
+
+        source_language (Languages)
+            the source language
+
+        target_language (Languages)
+            the target language
+
+        segment (bool)
+            whether to split the input into sentences and translate them as a batch
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_text (AsyncGenerator[str])
+            the translated text
+        """
+        for translated_text in self.translate_stream(
+            text,
+            source_language,
+            target_language,
+            segment=segment,
+            priority=priority,
+            client=client,
+            deadline=deadline,
+        ):
+            yield translated_text
+
+    async def translate_batch_async(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> list[str]:
+        """
+        Summary
+        -------
+        translate a batch of inputs without blocking a thread
+
+        Parameters
+        ----------
+        translations (Sequence[tuple[str, Language, Language]])
+            the inputs to translate with their source and target languages
+
+        priority (Priority)
+            the priority class of the translation
+
+        client (str)
+            the client that the translation is fairly scheduled against
+
+        deadline (float?)
+            the monotonic time after which the translation is abandoned, if any
+
+        Returns
+        -------
+        translated_texts (list[str])
+            the translated texts in the same order as the inputs
+        """
+        return self.translate_batch(translations, priority=priority, client=client, deadline=deadline)
@@ -1,9 +1,11 @@
 from collections.abc import AsyncGenerator, Callable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import partial
 
 from litestar import Litestar
 
-from server.features.detector import get_language_detector
+from server.features.detector import get_language_detector, warm_up_language_detector
+from server.lifespans.warm_up import warming_up
 
 
 @asynccontextmanager
@@ -11,7 +13,11 @@ async def language_detector_lifespan(
     app: Litestar,
     *,
     language_detector_repository: str,
+    warmup_rounds: int,
     stub: bool,
+    stub_detect_latency: float,
+    stub_fallback_latency: float,
+    stub_fallback_rate: float,
 ) -> AsyncGenerator[None]:
     """
     Summary
@@ -26,16 +32,34 @@ async def language_detector_lifespan(
     language_detector_repository (str)
         the repository to download the model from
 
+    warmup_rounds (int)
+        the number of times representative inputs are detected after the model loads, where 0 skips the warmup
+
     stub (bool)
         whether to use a stub object
+
+    stub_detect_latency (float)
+        the number of seconds every detection of the stub takes
+
+    stub_fallback_latency (float)
+        the number of additional seconds a detection of the stub takes when it falls back to lingua
+
+    stub_fallback_rate (float)
+        the share of inputs for which the stub falls back to lingua
     """
     app.state.language_detector = get_language_detector(
         language_detector_repository,
         stub=stub,
+        stub_detect_latency=stub_detect_latency,
+        stub_fallback_latency=stub_fallback_latency,
+        stub_fallback_rate=stub_fallback_rate,
     )
 
+    warm_up = partial(warm_up_language_detector, app.state.language_detector, rounds=warmup_rounds)
+
     try:
-        yield
+        async with warming_up(app, "language_detector", warm_up):
+            yield
 
     finally:
         del app.state.language_detector
@@ -44,7 +68,11 @@ async def language_detector_lifespan(
 def load_language_detector(
     language_detector_repository: str,
     *,
+    warmup_rounds: int,
     stub: bool,
+    stub_detect_latency: float,
+    stub_fallback_latency: float,
+    stub_fallback_rate: float,
 ) -> Callable[[Litestar], AbstractAsyncContextManager[None]]:
     """
     Summary
@@ -56,9 +84,21 @@ def load_language_detector(
     language_detector_repository (str)
         the repository to download the model from
 
+    warmup_rounds (int)
+        the number of times representative inputs are detected after the model loads, where 0 skips the warmup
+
     stub (bool)
         whether to use a stub object
 
+    stub_detect_latency (float)
+        the number of seconds every detection of the stub takes
+
+    stub_fallback_latency (float)
+        the number of additional seconds a detection of the stub takes when it falls back to lingua
+
+    stub_fallback_rate (float)
+        the share of inputs for which the stub falls back to lingua
+
     Returns
     -------
     lifespan (Callable[[Litestar], AbstractAsyncContextManager[None]])
@@ -67,5 +107,9 @@ def load_language_detector(
     return lambda app: language_detector_lifespan(
         app,
         language_detector_repository=language_detector_repository,
+        warmup_rounds=warmup_rounds,
         stub=stub,
+        stub_detect_latency=stub_detect_latency,
+        stub_fallback_latency=stub_fallback_latency,
+        stub_fallback_rate=stub_fallback_rate,
     )
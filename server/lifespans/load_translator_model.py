@@ -1,62 +1,190 @@
-from collections.abc import AsyncGenerator, Callable
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from collections.abc import AsyncGenerator, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
+from functools import partial
 
 from litestar import Litestar
 
-from server.features.translator import get_translator
+from server.features.translator import EngineClient, RemoteTranslator, get_translator, get_translator_registry
+from server.lifespans.warm_up import warming_up
+from server.stores import SQLiteCache
+from server.typedefs import ComputeTypes, CpuIsa
 
 
 @asynccontextmanager
 async def translator_lifespan(
     app: Litestar,
     *,
-    translator_repository: str,
+    translator_repositories: Sequence[str],
+    max_resident_bytes: int,
+    engine_socket: str | None,
     translator_threads: int,
+    intra_threads: int,
+    compute_type: ComputeTypes,
+    max_queued_batches: int,
+    cpu_isa: CpuIsa | None,
+    batch_window: float,
+    max_batch_tokens: int,
+    max_pending_tokens: int,
+    idle_timeout: float,
+    idle_to_cpu: bool,
+    length_margin: float,
+    cache_bytes: int,
+    shared_cache: SQLiteCache | None,
+    warmup_rounds: int,
     stub: bool,
+    stub_tokenise_latency: float,
+    stub_decode_latency: float,
+    stub_runaway_rate: float,
     testing: bool,
     use_cuda: bool,
 ) -> AsyncGenerator[None]:
     """
     Summary
     -------
-    lifespan to load the translator model
+    lifespan to load the translator models
 
     Parameters
     ----------
     app (Litestar)
         the application instance
 
-    translator_repository (str)
-        the repository to download the model from
+    translator_repositories (Sequence[str])
+        the repositories to download the models from, starting with the default model
+
+    max_resident_bytes (int)
+        the maximum combined size of the loaded models in bytes, where 0 keeps every model loaded
+
+    engine_socket (str?)
+        the Unix socket of a translator engine to forward translations to instead of loading the models
 
     translator_threads (int)
         the number of threads to use for translation
 
+    intra_threads (int)
+        the number of threads used to decode each batch
+
+    compute_type (ComputeTypes)
+        the type of the model weights and computations
+
+    max_queued_batches (int)
+        the maximum number of batches queued inside CTranslate2
+
+    cpu_isa (CpuIsa?)
+        the CPU instruction set to force CTranslate2 to use
+
+    batch_window (float)
+        the number of seconds to wait for concurrent requests before dispatching a batch
+
+    max_batch_tokens (int)
+        the maximum number of padded source tokens in a batch
+
+    max_pending_tokens (int)
+        the maximum number of source tokens waiting for, or undergoing, decoding
+
+    idle_timeout (float)
+        the number of seconds without traffic before a model is unloaded, where 0 keeps the models loaded
+
+    idle_to_cpu (bool)
+        whether an idle model is unloaded to CPU and its cache kept in RAM when it is reloaded
+
+    length_margin (float)
+        the multiple of the expected output length that a translation may generate, where 0 disables the budget
+
+    cache_bytes (int)
+        the maximum size of the translation cache in bytes
+
+    shared_cache (SQLiteCache?)
+        the on-disk cache shared by every worker on the host
+
+    warmup_rounds (int)
+        the number of times representative inputs are translated after the models load, where 0 skips the warmup
+
     stub (bool)
         whether to use a stub object
 
+    stub_tokenise_latency (float)
+        the number of seconds the simulated tokeniser of the stub spends on each token, where 0 echoes the input
+
+    stub_decode_latency (float)
+        the number of seconds each decoding step of the stub takes, where 0 echoes the input
+
+    stub_runaway_rate (float)
+        the share of inputs for which the stub never generates an end token
+
     testing (bool)
         whether the application is running in testing mode
 
     use_cuda (bool)
         whether to use CUDA for translation
     """
-    with get_translator(
-        translator_repository,
-        translator_threads=translator_threads,
-        testing=testing,
-        stub=stub,
-        use_cuda=use_cuda,
-    ) as translator:
-        app.state.translator = translator
+    async with AsyncExitStack() as stack:
+        if engine_socket is None:
+            factory = partial(
+                get_translator,
+                translator_threads=translator_threads,
+                intra_threads=intra_threads,
+                compute_type=compute_type,
+                max_queued_batches=max_queued_batches,
+                cpu_isa=cpu_isa,
+                batch_window=batch_window,
+                max_batch_tokens=max_batch_tokens,
+                max_pending_tokens=max_pending_tokens,
+                idle_timeout=idle_timeout,
+                idle_to_cpu=idle_to_cpu,
+                length_margin=length_margin,
+                cache_bytes=cache_bytes,
+                shared_cache=shared_cache,
+                testing=testing,
+                stub=stub,
+                stub_tokenise_latency=stub_tokenise_latency,
+                stub_decode_latency=stub_decode_latency,
+                stub_runaway_rate=stub_runaway_rate,
+                use_cuda=use_cuda,
+            )
+
+        else:
+            client = await stack.enter_async_context(EngineClient(engine_socket))
+            factory = partial(RemoteTranslator, client)
+
+        app.state.translators = stack.enter_context(
+            get_translator_registry(
+                translator_repositories,
+                factory,
+                max_bytes=max_resident_bytes if engine_socket is None else 0,
+                stub=stub,
+            )
+        )
+
+        await stack.enter_async_context(
+            warming_up(app, "translator", partial(app.state.translators.warm_up, warmup_rounds))
+        )
+
         yield
 
 
 def load_translator_model(
-    translator_repository: str,
+    translator_repositories: Sequence[str],
     *,
+    max_resident_bytes: int,
+    engine_socket: str | None,
     translator_threads: int,
+    intra_threads: int,
+    compute_type: ComputeTypes,
+    max_queued_batches: int,
+    cpu_isa: CpuIsa | None,
+    batch_window: float,
+    max_batch_tokens: int,
+    max_pending_tokens: int,
+    idle_timeout: float,
+    idle_to_cpu: bool,
+    length_margin: float,
+    cache_bytes: int,
+    shared_cache: SQLiteCache | None,
+    warmup_rounds: int,
     stub: bool,
+    stub_tokenise_latency: float,
+    stub_decode_latency: float,
+    stub_runaway_rate: float,
     testing: bool,
     use_cuda: bool,
 ) -> Callable[[Litestar], AbstractAsyncContextManager[None]]:
@@ -67,15 +195,69 @@ def load_translator_model(
 
     Parameters
     ----------
-    translator_repository (str)
-        the repository to download the model from
+    translator_repositories (Sequence[str])
+        the repositories to download the models from, starting with the default model
+
+    max_resident_bytes (int)
+        the maximum combined size of the loaded models in bytes, where 0 keeps every model loaded
+
+    engine_socket (str?)
+        the Unix socket of a translator engine to forward translations to instead of loading the models
 
     translator_threads (int)
         the number of threads to use for translation
 
+    intra_threads (int)
+        the number of threads used to decode each batch
+
+    compute_type (ComputeTypes)
+        the type of the model weights and computations
+
+    max_queued_batches (int)
+        the maximum number of batches queued inside CTranslate2
+
+    cpu_isa (CpuIsa?)
+        the CPU instruction set to force CTranslate2 to use
+
+    batch_window (float)
+        the number of seconds to wait for concurrent requests before dispatching a batch
+
+    max_batch_tokens (int)
+        the maximum number of padded source tokens in a batch
+
+    max_pending_tokens (int)
+        the maximum number of source tokens waiting for, or undergoing, decoding
+
+    idle_timeout (float)
+        the number of seconds without traffic before a model is unloaded, where 0 keeps the models loaded
+
+    idle_to_cpu (bool)
+        whether an idle model is unloaded to CPU and its cache kept in RAM when it is reloaded
+
+    length_margin (float)
+        the multiple of the expected output length that a translation may generate, where 0 disables the budget
+
+    cache_bytes (int)
+        the maximum size of the translation cache in bytes
+
+    shared_cache (SQLiteCache?)
+        the on-disk cache shared by every worker on the host
+
+    warmup_rounds (int)
+        the number of times representative inputs are translated after the models load, where 0 skips the warmup
+
     stub (bool)
         whether to use a stub object
 
+    stub_tokenise_latency (float)
+        the number of seconds the simulated tokeniser of the stub spends on each token, where 0 echoes the input
+
+    stub_decode_latency (float)
+        the number of seconds each decoding step of the stub takes, where 0 echoes the input
+
+    stub_runaway_rate (float)
+        the share of inputs for which the stub never generates an end token
+
     testing (bool)
         whether the application is running in testing mode
 
@@ -89,9 +271,27 @@ def load_translator_model(
     """
     return lambda app: translator_lifespan(
         app,
-        translator_repository=translator_repository,
+        translator_repositories=translator_repositories,
+        max_resident_bytes=max_resident_bytes,
+        engine_socket=engine_socket,
         translator_threads=translator_threads,
+        intra_threads=intra_threads,
+        compute_type=compute_type,
+        max_queued_batches=max_queued_batches,
+        cpu_isa=cpu_isa,
+        batch_window=batch_window,
+        max_batch_tokens=max_batch_tokens,
+        max_pending_tokens=max_pending_tokens,
+        idle_timeout=idle_timeout,
+        idle_to_cpu=idle_to_cpu,
+        length_margin=length_margin,
+        cache_bytes=cache_bytes,
+        shared_cache=shared_cache,
+        warmup_rounds=warmup_rounds,
         stub=stub,
+        stub_tokenise_latency=stub_tokenise_latency,
+        stub_decode_latency=stub_decode_latency,
+        stub_runaway_rate=stub_runaway_rate,
         testing=testing,
         use_cuda=use_cuda,
     )
@@ -0,0 +1,46 @@
+from asyncio import create_task
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from logging import getLogger
+
+from litestar import Litestar
+from litestar.concurrency import sync_to_thread
+
+
+@asynccontextmanager
+async def warming_up(app: Litestar, model: str, warm_up: Callable[[], object]) -> AsyncGenerator[None]:
+    """
+    Summary
+    -------
+    report a model as warming up until its warmup finishes in a thread, logging the warmup if it fails
+
+    Parameters
+    ----------
+    app (Litestar)
+        the application instance
+
+    model (str)
+        the name reported by the `/ready` route while the model is warming up
+
+    warm_up (Callable[[], object])
+        the blocking function that warms up the model
+    """
+
+    async def run() -> None:
+        try:
+            await sync_to_thread(warm_up)
+
+        except Exception:
+            getLogger(__name__).exception("The %s failed to warm up and is serving requests cold", model)
+
+        finally:
+            app.state.warming_up.discard(model)
+
+    app.state.warming_up.add(model)
+    warmup = create_task(run())
+
+    try:
+        yield
+
+    finally:
+        await warmup
@@ -1,16 +1,67 @@
+from asyncio import create_task, sleep
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from math import ceil
+from typing import Any
 
-from aiohttp import ClientSession
+from aiohttp import ClientError, ClientSession
+from litestar import Litestar
+from litestar.concurrency import sync_to_thread
 from litestar.config.app import AppConfig
 from litestar.plugins import InitPlugin
 
-from server.api import health
+from server.api import health, metrics
+
+CONSUL_MAX_WEIGHT = 100
+CONSUL_SATURATED_WAIT = 5.0
+
+
+def service_load(app: Litestar) -> tuple[dict[str, int], dict[str, str], str]:
+    """
+    Summary
+    -------
+    summarise the load of every translator model into Consul service weights, metadata and a check status
+
+    Parameters
+    ----------
+    app (Litestar)
+        the application instance
+
+    Returns
+    -------
+    weights (dict[str, int])
+        the weights of the service when its checks are passing or warning, lower when requests wait longer
+
+    meta (dict[str, str])
+        the queue depth, throughput, estimated wait and readiness of the service
+
+    status (str)
+        `critical` when the service is not ready, `warning` when it is saturated and `passing` otherwise
+    """
+    translators = app.state.translators
+    statuses = [translators.peek(model).queue_status() for model in translators]
+    pending_jobs = sum(status[0] for status in statuses)
+    pending_tokens = sum(status[1] for status in statuses)
+    estimated_wait = max(status[2] for status in statuses)
+    throughput = sum(status[3] for status in statuses)
+    ready = not app.state.warming_up and not translators.unloaded
+    weight = ceil(CONSUL_MAX_WEIGHT / (1 + estimated_wait))
+
+    meta = {
+        "pending_jobs": f"{pending_jobs}",
+        "pending_tokens": f"{pending_tokens}",
+        "estimated_wait": f"{estimated_wait:.3f}",
+        "throughput": f"{throughput:.1f}",
+        "ready": f"{ready}".lower(),
+    }
+
+    status = "critical" if not ready else "warning" if estimated_wait >= CONSUL_SATURATED_WAIT else "passing"
+    return {"Passing": weight, "Warning": 1}, meta, status
 
 
 @asynccontextmanager
 async def consul_register(
-    _,
+    app: Litestar,
     *,
     app_name: str,
     app_id: str,
@@ -19,12 +70,15 @@ async def consul_register(
     consul_service_port: int,
     consul_service_scheme: str,
     server_root_path: str,
+    update_interval: float,
+    prometheus_metrics: bool,
     consul_auth_token: str | None = None,
 ) -> AsyncGenerator[None]:
     """
     Summary
     -------
-    a Consul service lifespan that registers the service on startup and deregisters it on shutdown
+    a Consul service lifespan that registers the service on startup, keeps its weights and metadata in step with its
+    load, and deregisters it on shutdown
 
     Parameters
     ----------
@@ -52,6 +106,12 @@ async def consul_register(
     server_root_path (str)
         the root path of the server
 
+    update_interval (float)
+        the number of seconds between updates of the service weights and metadata
+
+    prometheus_metrics (bool)
+        whether the service serves metrics for Prometheus to scrape
+
     consul_auth_token (str?)
         an optional auth token for populating the `Authorization` header
     """
@@ -69,23 +129,35 @@ async def consul_register(
         "Timeout": "10s",
     }
 
-    payload = {
-        "Name": app_name,
-        "ID": app_id,
-        "Tags": ["prometheus"],
-        "Address": consul_service_address,
-        "Port": consul_service_port,
-        "Check": health_check,
-        "Meta": {
-            "metrics_port": f"{consul_service_port}",
-            "metrics_path": "/metrics",
-        },
-    }
-
     if consul_auth_token:
         headers["Authorization"] = f"Bearer {consul_auth_token}"
 
-    async with ClientSession(headers=headers) as session:
+    tags = ["prometheus"] if prometheus_metrics else []
+    metrics_meta = (
+        {"metrics_port": f"{consul_service_port}", "metrics_path": f"{server_root_path}{next(iter(metrics.paths))}"}
+        if prometheus_metrics
+        else {}
+    )
+
+    async def register(session: ClientSession) -> None:
+        weights, meta, status = await sync_to_thread(service_load, app)
+        load_check = {
+            "CheckID": f"{app_id}:load",
+            "Name": "load",
+            "TTL": f"{ceil(3 * update_interval)}s",
+        }
+
+        payload: dict[str, Any] = {
+            "Name": app_name,
+            "ID": app_id,
+            "Tags": tags,
+            "Address": consul_service_address,
+            "Port": consul_service_port,
+            "Checks": [health_check, load_check],
+            "Weights": weights,
+            "Meta": {**metrics_meta, **meta},
+        }
+
         async with session.put(
             f"{consul_server}/register",
             json=payload,
@@ -93,11 +165,30 @@ async def consul_register(
         ) as response:
             response.raise_for_status()
 
+        async with session.put(
+            f"{consul_http_addr}/v1/agent/check/update/{load_check['CheckID']}",
+            json={"Status": status, "Output": f"{meta['pending_jobs']} pending jobs, {meta['estimated_wait']}s wait"},
+        ) as response:
+            response.raise_for_status()
+
+    async def update(session: ClientSession) -> None:
+        while True:
+            await sleep(update_interval)
+
+            with suppress(ClientError):
+                await register(session)
+
+    async with ClientSession(headers=headers) as session:
+        await register(session)
+        updater = create_task(update(session))
+
         try:
             yield
 
         finally:
-            async with session.put(f"{consul_server}/deregister/{payload['ID']}"):
+            updater.cancel()
+
+            async with session.put(f"{consul_server}/deregister/{app_id}"):
                 pass
 
 
@@ -130,6 +221,12 @@ class ConsulPlugin(InitPlugin):
     server_root_path (str)
         the root path of the server
 
+    update_interval (float)
+        the number of seconds between updates of the service weights and metadata
+
+    prometheus_metrics (bool)
+        whether the service serves metrics for Prometheus to scrape
+
     consul_auth_token (str?)
         an optional auth token for populating the `Authorization` header
     """
@@ -142,7 +239,9 @@ class ConsulPlugin(InitPlugin):
         "consul_service_address",
         "consul_service_port",
         "consul_service_scheme",
+        "prometheus_metrics",
         "server_root_path",
+        "update_interval",
     )
 
     def __init__(
@@ -155,6 +254,8 @@ class ConsulPlugin(InitPlugin):
         consul_service_port: int,
         consul_service_scheme: str,
         server_root_path: str,
+        update_interval: float,
+        prometheus_metrics: bool,
         consul_auth_token: str | None = None,
     ) -> None:
         self.app_name = app_name
@@ -164,6 +265,8 @@ class ConsulPlugin(InitPlugin):
         self.consul_service_port = consul_service_port
         self.consul_service_scheme = consul_service_scheme
         self.server_root_path = server_root_path
+        self.update_interval = update_interval
+        self.prometheus_metrics = prometheus_metrics
         self.consul_auth_token = consul_auth_token
 
     def on_app_init(self, app_config: AppConfig) -> AppConfig:
@@ -177,6 +280,8 @@ class ConsulPlugin(InitPlugin):
                 consul_service_port=self.consul_service_port,
                 consul_service_scheme=self.consul_service_scheme,
                 server_root_path=self.server_root_path,
+                update_interval=self.update_interval,
+                prometheus_metrics=self.prometheus_metrics,
                 consul_auth_token=self.consul_auth_token,
             )
         )
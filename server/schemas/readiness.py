@@ -0,0 +1,24 @@
+from msgspec import Struct
+
+
+class Readiness(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the readiness response schema
+
+    Attributes
+    ----------
+    ready (bool)
+        whether the server is ready to serve requests
+
+    warming_up (list[str])
+        the models that are still warming up
+
+    unloaded_models (list[str])
+        the translator models unloaded through the API
+    """
+
+    ready: bool
+    warming_up: list[str]
+    unloaded_models: list[str]
@@ -1,4 +1,5 @@
 from server.schemas.v1.language import LanguageResult as LanguageResult
+from server.schemas.v1.queue import Queue as Queue
 from server.schemas.v1.tokens import Tokens as Tokens
 from server.schemas.v1.translated import Translated as Translated
 from server.schemas.v1.translation import Translation as Translation
@@ -0,0 +1,45 @@
+from typing import Annotated
+
+from msgspec import Meta, Struct
+
+
+class Queue(Struct, kw_only=True, frozen=True, gc=False):
+    """
+    Summary
+    -------
+    the translation queue schema
+
+    Attributes
+    ----------
+    pending_jobs (int)
+        the number of translations waiting for, or undergoing, decoding
+
+    pending_tokens (int)
+        the number of source tokens waiting for, or undergoing, decoding
+
+    estimated_wait (float)
+        the estimated number of seconds before a new translation finishes decoding
+
+    throughput (float)
+        the recent decoding throughput in source tokens per second
+    """
+
+    pending_jobs: Annotated[
+        int,
+        Meta(description="the number of translations waiting for, or undergoing, decoding", examples=[4]),
+    ]
+
+    pending_tokens: Annotated[
+        int,
+        Meta(description="the number of source tokens waiting for, or undergoing, decoding", examples=[512]),
+    ]
+
+    estimated_wait: Annotated[
+        float,
+        Meta(description="the estimated number of seconds before a new translation finishes decoding", examples=[0.5]),
+    ]
+
+    throughput: Annotated[
+        float,
+        Meta(description="the recent decoding throughput in source tokens per second", examples=[1024.0]),
+    ]
@@ -1,14 +1,52 @@
+from argparse import ArgumentParser
+from asyncio import run as run_async
+from collections.abc import Generator
+from contextlib import ExitStack, contextmanager, suppress
+from datetime import UTC, datetime
+from logging import INFO, basicConfig, getLogger
 from os import environ as env
+from os import process_cpu_count
+from pathlib import Path
 from shutil import which
 from socket import AF_INET, SOCK_STREAM, socket
-from subprocess import run
+from subprocess import Popen, run
+from sys import executable
+from time import sleep
+from typing import get_args
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from msgspec.json import decode, encode
+from msgspec.json import format as format_json
 
 from server import main
+from server.config import Config
+from server.features.benchmark import (
+    DEFAULT_DETECTOR_CORPUS,
+    DEFAULT_WORKLOAD,
+    DETECTOR_TEXT_LENGTHS,
+    DETECTOR_THRESHOLDS,
+    BenchmarkReport,
+    DetectorResult,
+    benchmark_detector,
+    create_report,
+    format_detector_results,
+    format_report,
+    load_detector_corpus,
+    load_workload,
+    run_benchmark,
+)
+from server.features.detector import get_language_detector
+from server.features.translator.autotune import autotune as autotune_translator
+from server.typedefs import Language
 
 
 class PortsNotAvailableError(Exception): ...
 
 
+class ServerExitedError(Exception): ...
+
+
 def get_oci() -> str:
     """
     Summary
@@ -137,3 +175,218 @@ def huggingface() -> None:
 
     run(docker_build, check=True)
     run(docker_run, check=True)
+
+
+def autotune() -> None:
+    """
+    Summary
+    -------
+    benchmark the translator settings on the current host and write the fastest to an environment file
+    """
+    languages = get_args(Language.__value__)
+    parser = ArgumentParser(description="benchmark the translator settings on the current host")
+    parser.add_argument("corpus", type=Path, help="a text file with one input to translate per line")
+    parser.add_argument("--source", choices=languages, default="eng_Latn", help="the source language of the corpus")
+    parser.add_argument("--target", choices=languages, default="fra_Latn", help="the target language of the corpus")
+    parser.add_argument("--cores", type=int, default=process_cpu_count() or 1, help="the number of cores to use")
+    parser.add_argument("--rounds", type=int, default=3, help="the number of times to translate the corpus")
+    parser.add_argument("--output", type=Path, default=Path("autotune.env"), help="the environment file to write")
+    args = parser.parse_args()
+
+    basicConfig(level=INFO, format="%(message)s")
+    config = Config()
+
+    if config.translator_cpu_isa is not None:
+        env["CT2_FORCE_CPU_ISA"] = config.translator_cpu_isa
+
+    corpus = [line for line in args.corpus.read_text().splitlines() if line.strip()]
+    results = autotune_translator(
+        config.translator_repository,
+        corpus,
+        args.source,
+        args.target,
+        cores=args.cores,
+        rounds=args.rounds,
+        batch_window=config.translator_batch_window,
+        max_batch_tokens=config.translator_max_batch_tokens,
+    )
+
+    compute_type, inter_threads, intra_threads, _ = results[0]
+    args.output.write_text(
+        f"TRANSLATOR_COMPUTE_TYPE={compute_type}\n"
+        f"TRANSLATOR_THREADS={inter_threads}\n"
+        f"TRANSLATOR_INTRA_THREADS={intra_threads}\n"
+    )
+
+
+def get_commit() -> str:
+    """
+    Summary
+    -------
+    get the current commit of the repository, if any
+
+    Returns
+    -------
+    commit (str)
+        the short hash of the current commit, or an empty string outside of a git repository
+    """
+    if (git := which("git")) is None:
+        return ""
+
+    return run([git, "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False).stdout.strip()
+
+
+@contextmanager
+def stub_server() -> Generator[str]:
+    """
+    Summary
+    -------
+    run the server without any models in a subprocess until it is ready
+
+    Returns
+    -------
+    url (str)
+        the base URL of the server, including its root path
+
+    Raises
+    ------
+    ServerExitedError
+        if the server exits before it is ready
+    """
+    port = get_unused_port()
+    url = f"http://localhost:{port}{Config().server_root_path}"
+    process = Popen(
+        [executable, "-c", "from server.scripts import stub; stub()"], env={**env, "SERVER_PORT": str(port)}
+    )
+
+    try:
+        while process.poll() is None:
+            with suppress(URLError, ConnectionError), urlopen(f"{url}/ready"):  # noqa: S310
+                break
+
+            sleep(0.5)
+
+        else:
+            raise ServerExitedError
+
+        yield url
+
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def benchmark() -> None:
+    """
+    Summary
+    -------
+    replay a workload against the server and report its latency and throughput
+    """
+    parser = ArgumentParser(description="replay a workload against the server and report its latency and throughput")
+    parser.add_argument(
+        "workload",
+        type=Path,
+        nargs="?",
+        default=DEFAULT_WORKLOAD,
+        help="a JSONL file with one request per line, defaulting to a mix of every route",
+    )
+    parser.add_argument("--url", help="the base URL of a running server, instead of starting one without models")
+    parser.add_argument("--concurrency", type=int, default=8, help="the number of clients in a closed loop")
+    parser.add_argument("--rate", type=float, default=0, help="the requests per second of an open loop")
+    parser.add_argument("--duration", type=float, default=30, help="the number of seconds to send requests for")
+    parser.add_argument("--requests", type=int, default=0, help="the maximum number of requests to send")
+    parser.add_argument("--timeout", type=float, default=60, help="the number of seconds before a request fails")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the open-loop arrival times")
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"), help="the report file to write")
+    parser.add_argument("--baseline", type=Path, help="an earlier report file to compare against")
+    args = parser.parse_args()
+
+    basicConfig(level=INFO, format="%(message)s")
+    logger = getLogger(__name__)
+    workload = load_workload(args.workload)
+
+    with ExitStack() as stack:
+        samples, elapsed = run_async(
+            run_benchmark(
+                args.url or stack.enter_context(stub_server()),
+                workload,
+                concurrency=args.concurrency,
+                rate=args.rate,
+                duration=args.duration,
+                max_requests=args.requests,
+                request_timeout=args.timeout,
+                seed=args.seed,
+            )
+        )
+
+    report = create_report(
+        samples,
+        elapsed,
+        commit=get_commit(),
+        created_at=datetime.now(UTC).isoformat(),
+        concurrency=0 if args.rate else args.concurrency,
+        rate=args.rate,
+    )
+    baseline = decode(args.baseline.read_bytes(), type=BenchmarkReport) if args.baseline else None
+    args.output.write_bytes(format_json(encode(report), indent=2))
+
+    for row in format_report(report, baseline):
+        logger.info(row)
+
+
+def benchmark_language_detector() -> None:
+    """
+    Summary
+    -------
+    time the language detector over a corpus of lengths, scripts and thresholds and report its cost per call
+    """
+    parser = ArgumentParser(description="time the language detector over a corpus of lengths, scripts and thresholds")
+    parser.add_argument(
+        "corpus",
+        type=Path,
+        nargs="?",
+        default=DEFAULT_DETECTOR_CORPUS,
+        help="a TSV file with a language and text on each line, defaulting to a sentence in several scripts",
+    )
+    parser.add_argument(
+        "--lengths",
+        type=int,
+        nargs="+",
+        default=list(DETECTOR_TEXT_LENGTHS),
+        help="the numbers of characters to fit each text to",
+    )
+    parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=list(DETECTOR_THRESHOLDS),
+        help="the fastText confidences below which lingua is consulted",
+    )
+    parser.add_argument("--lingua-threshold", type=float, default=0.35, help="the lingua confidence to accept")
+    parser.add_argument("--rounds", type=int, default=200, help="the number of timed detections of each input")
+    parser.add_argument("--output", type=Path, default=Path("detector.json"), help="the results file to write")
+    parser.add_argument("--baseline", type=Path, help="an earlier results file to compare against")
+    args = parser.parse_args()
+
+    basicConfig(level=INFO, format="%(message)s")
+    logger = getLogger(__name__)
+    config = Config()
+    language_detector = get_language_detector(
+        config.language_detector_repository,
+        stub=config.stub_language_detector,
+        stub_detect_latency=config.stub_detect_latency,
+        stub_fallback_latency=config.stub_fallback_latency,
+        stub_fallback_rate=config.stub_fallback_rate,
+    )
+    results = benchmark_detector(
+        language_detector,
+        load_detector_corpus(args.corpus, args.lengths),
+        fasttext_confidence_thresholds=args.thresholds,
+        lingua_confidence_threshold=args.lingua_threshold,
+        rounds=args.rounds,
+    )
+    baseline = decode(args.baseline.read_bytes(), type=list[DetectorResult]) if args.baseline else []
+    args.output.write_bytes(format_json(encode(results), indent=2))
+
+    for row in format_detector_results(results, baseline):
+        logger.info(row)
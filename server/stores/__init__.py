@@ -0,0 +1,2 @@
+from server.stores.sqlite import SQLiteCache as SQLiteCache
+from server.stores.sqlite import SQLiteStore as SQLiteStore
@@ -0,0 +1,265 @@
+from datetime import timedelta
+from pathlib import Path
+from sqlite3 import connect
+from threading import Lock
+from time import time
+
+from litestar.concurrency import sync_to_thread
+from litestar.stores.base import Store
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+EVICT_LEAST_RECENTLY_USED = """
+DELETE FROM entries WHERE key IN (SELECT key FROM entries WHERE key != ? ORDER BY accessed_at LIMIT ?)
+"""
+
+EVICTION_BATCH_SIZE = 64
+
+
+class SQLiteCache:
+    """
+    Summary
+    -------
+    a process-safe least-recently-used key-value cache stored in an SQLite database on the local disk
+
+    Parameters
+    ----------
+    path (str)
+        the path of the database file, shared by every worker on the host
+
+    max_bytes (int)
+        the maximum number of bytes the database pages in use may occupy
+
+    Methods
+    -------
+    get(key: str) -> bytes | None
+        get an unexpired value and mark it as recently used
+
+    set(key: str, value: bytes, expires_at: float | None) -> None
+        store a value and evict the least recently used values that no longer fit
+
+    expires_at(key: str) -> float | None
+        get the UNIX timestamp at which a value expires
+
+    delete(key: str) -> None
+        delete a value
+
+    delete_prefix(prefix: str) -> None
+        delete every value with a key that starts with the prefix
+
+    close() -> None
+        close the database connection
+    """
+
+    __slots__ = ("connection", "lock", "max_bytes", "page_size")
+
+    def __init__(self, path: str, *, max_bytes: int) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = Lock()
+        self.connection = connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.page_size: int = self.connection.execute("PRAGMA page_size").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def used_bytes(self) -> int:
+        """
+        Summary
+        -------
+        get the number of bytes occupied by the database pages in use
+
+        Returns
+        -------
+        used_bytes (int)
+            the size of the pages that are not on the freelist
+        """
+        page_count: int = self.connection.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count: int = self.connection.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - freelist_count) * self.page_size
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Summary
+        -------
+        get an unexpired value and mark it as recently used
+
+        Parameters
+        ----------
+        key (str)
+            the key of the value
+
+        Returns
+        -------
+        value (bytes?)
+            the stored value, if any
+        """
+        now = time()
+
+        with self.lock:
+            row = self.connection.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            if row[1] is not None and row[1] <= now:
+                self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+
+            self.connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: bytes, *, expires_at: float | None = None) -> None:
+        """
+        Summary
+        -------
+        store a value and evict the least recently used values that no longer fit
+
+        Parameters
+        ----------
+        key (str)
+            the key of the value
+
+        value (bytes)
+            the value to store
+
+        expires_at (float?)
+            the UNIX timestamp at which the value expires, if ever
+        """
+        if len(key.encode()) + len(value) > self.max_bytes:
+            return
+
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, time()),
+            )
+
+            while self.used_bytes() > self.max_bytes:
+                if not self.connection.execute(EVICT_LEAST_RECENTLY_USED, (key, EVICTION_BATCH_SIZE)).rowcount:
+                    break
+
+    def expires_at(self, key: str) -> float | None:
+        """
+        Summary
+        -------
+        get the UNIX timestamp at which a value expires
+
+        Parameters
+        ----------
+        key (str)
+            the key of the value
+
+        Returns
+        -------
+        expires_at (float?)
+            the expiry timestamp, if the value exists and expires
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+
+        return None if row is None else row[0]
+
+    def delete(self, key: str) -> None:
+        """
+        Summary
+        -------
+        delete a value
+
+        Parameters
+        ----------
+        key (str)
+            the key of the value
+        """
+        with self.lock:
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Summary
+        -------
+        delete every value with a key that starts with the prefix
+
+        Parameters
+        ----------
+        prefix (str)
+            the key prefix
+        """
+        upper_bound = f"{prefix[:-1]}{chr(ord(prefix[-1]) + 1)}"
+
+        with self.lock:
+            self.connection.execute("DELETE FROM entries WHERE key >= ? AND key < ?", (prefix, upper_bound))
+
+    def close(self) -> None:
+        """
+        Summary
+        -------
+        close the database connection
+        """
+        with self.lock:
+            self.connection.close()
+
+
+class SQLiteStore(Store):
+    """
+    Summary
+    -------
+    a Litestar store that keeps its values in a namespace of a shared SQLite cache
+
+    Parameters
+    ----------
+    cache (SQLiteCache)
+        the shared SQLite cache
+
+    namespace (str)
+        the namespace that prefixes every key of this store
+    """
+
+    __slots__ = ("cache", "prefix")
+
+    def __init__(self, cache: SQLiteCache, *, namespace: str) -> None:
+        self.cache = cache
+        self.prefix = f"{namespace}\0"
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        if isinstance(value, str):
+            value = value.encode()
+
+        if isinstance(expires_in, timedelta):
+            expires_in = int(expires_in.total_seconds())
+
+        expires_at = None if expires_in is None else time() + expires_in
+        await sync_to_thread(self.cache.set, f"{self.prefix}{key}", value, expires_at=expires_at)
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        value = await sync_to_thread(self.cache.get, f"{self.prefix}{key}")
+
+        if value is not None and renew_for is not None:
+            await self.set(key, value, renew_for)
+
+        return value
+
+    async def delete(self, key: str) -> None:
+        await sync_to_thread(self.cache.delete, f"{self.prefix}{key}")
+
+    async def delete_all(self) -> None:
+        await sync_to_thread(self.cache.delete_prefix, self.prefix)
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def expires_in(self, key: str) -> int | None:
+        expires_at = await sync_to_thread(self.cache.expires_at, f"{self.prefix}{key}")
+        return None if expires_at is None else int(expires_at - time())
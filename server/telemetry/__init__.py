@@ -1,3 +1,9 @@
 from server.telemetry.log_handler import get_log_handler as get_log_handler
 from server.telemetry.meter_provider import get_meter_provider as get_meter_provider
+from server.telemetry.server_timing import ACCESS_LOG_FORMAT as ACCESS_LOG_FORMAT
+from server.telemetry.server_timing import ServerTimingMiddleware as ServerTimingMiddleware
+from server.telemetry.server_timing import record_count as record_count
+from server.telemetry.server_timing import record_duration as record_duration
+from server.telemetry.stage import stage as stage
+from server.telemetry.stage import stage_span as stage_span
 from server.telemetry.tracer_provider import get_tracer_provider as get_tracer_provider
@@ -3,10 +3,11 @@ from os import statvfs
 from pathlib import Path
 
 from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+from opentelemetry.exporter.prometheus import PrometheusMetricReader
 from opentelemetry.instrumentation.system_metrics import SystemMetricsInstrumentor
 from opentelemetry.metrics import CallbackOptions, Meter, Observation, set_meter_provider
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.export import MetricReader, PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import SERVICE_INSTANCE_ID, SERVICE_NAME, OTELResourceDetector, Resource
 
 
@@ -48,11 +49,12 @@ def get_system_filesystem_usage(_: CallbackOptions) -> Iterable[Observation]:
     yield Observation(usage.f_bsize * (usage.f_blocks - usage.f_bfree - usage.f_bavail), labels_reserved)
 
 
-def get_meter_provider(*, otlp_service_name: str, otlp_service_instance_id: str) -> MeterProvider:
+def get_meter_provider(*, otlp_service_name: str, otlp_service_instance_id: str, otlp_export: bool) -> MeterProvider:
     """
     Summary
     -------
-    creates and configures a MeterProvider for OpenTelemetry metrics with OTLP exporter
+    creates and configures a MeterProvider for OpenTelemetry metrics that are scraped by Prometheus and optionally
+    exported over OTLP
 
     Parameters
     ----------
@@ -62,6 +64,9 @@ def get_meter_provider(*, otlp_service_name: str, otlp_service_instance_id: str)
     otlp_service_instance_id (str)
         the service instance ID to be used in the OpenTelemetry resource
 
+    otlp_export (bool)
+        whether to also push the metrics to the OTLP endpoint
+
     Returns
     -------
     meter_provider (MeterProvider)
@@ -83,7 +88,12 @@ def get_meter_provider(*, otlp_service_name: str, otlp_service_instance_id: str)
 
     resource = Resource({SERVICE_NAME: otlp_service_name, SERVICE_INSTANCE_ID: otlp_service_instance_id})
     merged_resource = resource.merge(OTELResourceDetector().detect())
-    meter_provider = MeterProvider([PeriodicExportingMetricReader(OTLPMetricExporter())], merged_resource)
+    readers: list[MetricReader] = [PrometheusMetricReader()]
+
+    if otlp_export:
+        readers.append(PeriodicExportingMetricReader(OTLPMetricExporter()))
+
+    meter_provider = MeterProvider(readers, merged_resource)
     system_metrics_instrumentor = SystemMetricsInstrumentor(config=system_metrics_config)
     system_metrics_instrumentor.instrument(meter_provider=meter_provider)
 
@@ -0,0 +1,193 @@
+from contextvars import ContextVar
+from datetime import datetime
+from logging import getLogger
+from time import perf_counter
+
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+ACCESS_LOG_FORMAT = '[%(time)s] %(status)d "%(method)s %(path)s %(protocol)s" %(addr)s in %(dt_ms).2f ms'
+SERVER_TIMING_ACCESS_LOG_FORMAT = f"{ACCESS_LOG_FORMAT} %(server_timing)s"
+
+
+class ServerTiming:
+    """
+    Summary
+    -------
+    the latency breakdown of a request, accumulated by every stage that the request passes through
+
+    Attributes
+    ----------
+    durations (dict[str, float])
+        the number of seconds spent in each stage
+
+    counts (dict[str, int])
+        the number of units, such as tokens, processed by each stage
+
+    Methods
+    -------
+    header() -> str
+        format the breakdown as the value of a `Server-Timing` header
+    """
+
+    __slots__ = ("counts", "durations")
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.durations or self.counts)
+
+    def header(self) -> str:
+        """
+        Summary
+        -------
+        format the breakdown as the value of a `Server-Timing` header
+
+        Returns
+        -------
+        header (str)
+            the durations in milliseconds followed by the counts in their descriptions
+        """
+        return ", ".join(
+            [
+                *(f"{name};dur={duration * 1000:.3f}" for name, duration in self.durations.items()),
+                *(f"{name};desc={count}" for name, count in self.counts.items()),
+            ]
+        )
+
+
+server_timing: ContextVar[ServerTiming | None] = ContextVar("server_timing", default=None)
+
+
+def record_duration(name: str, seconds: float) -> None:
+    """
+    Summary
+    -------
+    add the duration of a stage to the latency breakdown of the current request, if any
+
+    Parameters
+    ----------
+    name (str)
+        the name of the stage
+
+    seconds (float)
+        the number of seconds spent in the stage
+    """
+    if (timing := server_timing.get()) is not None:
+        timing.durations[name] = timing.durations.get(name, 0.0) + seconds
+
+
+def record_count(name: str, count: int) -> None:
+    """
+    Summary
+    -------
+    add a count to the latency breakdown of the current request, if any
+
+    Parameters
+    ----------
+    name (str)
+        the name of the count
+
+    count (int)
+        the number of units to add
+    """
+    if (timing := server_timing.get()) is not None:
+        timing.counts[name] = timing.counts.get(name, 0) + count
+
+
+class ServerTimingMiddleware(ASGIMiddleware):
+    """
+    Summary
+    -------
+    collect the latency breakdown of each request and return it in a `Server-Timing` header
+
+    Parameters
+    ----------
+    timing_allow_origin (str)
+        the origins allowed to read the breakdown from the browser, where an empty string omits the header
+
+    log_access (bool)
+        whether to write an access log line, in the format of the Granian access log, that ends with the breakdown
+
+    Methods
+    -------
+    handle(scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None
+        handle a request within its own latency breakdown
+    """
+
+    scopes = (ScopeType.HTTP,)
+
+    def __init__(self, *, timing_allow_origin: str, log_access: bool) -> None:
+        self.timing_allow_origin = timing_allow_origin
+        self.log_access = log_access
+        self.access_logger = getLogger("granian.access")
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
+        """
+        Summary
+        -------
+        handle a request within its own latency breakdown
+
+        Parameters
+        ----------
+        scope (Scope)
+            the ASGI connection scope
+
+        receive (Receive)
+            the ASGI receive function
+
+        send (Send)
+            the ASGI send function
+
+        next_app (ASGIApp)
+            the next ASGI application in the middleware stack
+        """
+        if scope["type"] != ScopeType.HTTP:
+            await next_app(scope, receive, send)
+            return
+
+        timing = ServerTiming()
+        token = server_timing.set(timing)
+        started_at = datetime.now().astimezone()
+        start = perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+                if timing:
+                    headers = MutableScopeHeaders.from_message(message)
+                    headers.add("Server-Timing", timing.header())
+
+                    if self.timing_allow_origin:
+                        headers.add("Timing-Allow-Origin", self.timing_allow_origin)
+
+            await send(message)
+
+        try:
+            await next_app(scope, receive, send_with_timing)
+
+        finally:
+            server_timing.reset(token)
+
+            if self.log_access:
+                self.access_logger.info(
+                    SERVER_TIMING_ACCESS_LOG_FORMAT,
+                    {
+                        "time": started_at.strftime("%Y-%m-%d %H:%M:%S %z"),
+                        "status": status,
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "protocol": f"HTTP/{scope['http_version']}",
+                        "addr": scope["client"][0] if scope["client"] else "-",
+                        "dt_ms": (perf_counter() - start) * 1000,
+                        "server_timing": timing.header() or "-",
+                    },
+                )
@@ -0,0 +1,100 @@
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from time import perf_counter
+
+from opentelemetry.metrics import Histogram
+from opentelemetry.trace import INVALID_SPAN, Link, Span, SpanContext, get_current_span, get_tracer, use_span
+from opentelemetry.util.types import Attributes
+
+from server.telemetry.server_timing import record_duration
+
+tracer = get_tracer(__name__)
+
+
+def stage_span(name: str, attributes: Attributes = None, links: Sequence[SpanContext] = ()) -> Span:
+    """
+    Summary
+    -------
+    start the span of a stage only when the current span, or one of the linked spans, is sampled
+
+    Parameters
+    ----------
+    name (str)
+        the name of the stage
+
+    attributes (Attributes)
+        the initial attributes of the span
+
+    links (Sequence[SpanContext])
+        the spans of the requests that the stage works on when it runs outside of their context
+
+    Returns
+    -------
+    span (Span)
+        the started span, or a non-recording span that costs nothing to use when tracing is disabled
+    """
+    if sampled_links := [Link(context) for context in links if context.trace_flags.sampled]:
+        return tracer.start_span(name, attributes=attributes, links=sampled_links)
+
+    if not get_current_span().is_recording():
+        return INVALID_SPAN
+
+    return tracer.start_span(name, attributes=attributes)
+
+
+@contextmanager
+def stage(
+    name: str,
+    histogram: Histogram | None = None,
+    attributes: Attributes = None,
+    links: Sequence[SpanContext] = (),
+    *,
+    timing: str | None = None,
+) -> Generator[Span]:
+    """
+    Summary
+    -------
+    time a stage into a histogram and the latency breakdown of its request, and trace it as a child span whenever
+    its request is sampled
+
+    Parameters
+    ----------
+    name (str)
+        the name of the stage
+
+    histogram (Histogram?)
+        the histogram to record the duration of the stage in seconds to, if any
+
+    attributes (Attributes)
+        the initial attributes of the span
+
+    links (Sequence[SpanContext])
+        the spans of the requests that the stage works on when it runs outside of their context
+
+    timing (str?)
+        the name of the stage in the `Server-Timing` breakdown of its request, if it is reported there
+
+    Returns
+    -------
+    span (Span)
+        the span of the stage, which is non-recording when tracing is disabled
+    """
+    start = perf_counter()
+    span = stage_span(name, attributes, links)
+
+    try:
+        if span is INVALID_SPAN:
+            yield span
+
+        else:
+            with use_span(span, end_on_exit=True):
+                yield span
+
+    finally:
+        elapsed = perf_counter() - start
+
+        if histogram is not None:
+            histogram.record(elapsed)
+
+        if timing is not None:
+            record_duration(timing, elapsed)
@@ -1,5 +1,7 @@
 from server.typedefs.compute_types import ComputeTypes as ComputeTypes
 from server.typedefs.confidence import Confidence as Confidence
+from server.typedefs.cpu_isa import CpuIsa as CpuIsa
 from server.typedefs.devices import Devices as Devices
 from server.typedefs.language import Language as Language
+from server.typedefs.priority import Priority as Priority
 from server.typedefs.state import AppState as AppState
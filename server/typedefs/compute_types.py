@@ -4,6 +4,7 @@ type ComputeTypes = Literal[
     "default",
     "auto",
     "int8",
+    "int8_float32",
     "int8_float16",
     "int8_bfloat16",
     "int16",
@@ -0,0 +1,3 @@
+from typing import Literal
+
+type CpuIsa = Literal["GENERIC", "AVX", "AVX2", "AVX512", "NEON"]
@@ -0,0 +1,3 @@
+from typing import Literal
+
+type Priority = Literal["interactive", "bulk"]
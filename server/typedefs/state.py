@@ -1,7 +1,7 @@
 from litestar.datastructures import State
 
 from server.features.detector import LanguageDetectorProtocol
-from server.features.translator import TranslatorProtocol
+from server.features.translator import TranslatorRegistry
 
 
 class AppState(State):
@@ -15,9 +15,13 @@ class AppState(State):
     language_detector (LanguageDetectorProtocol)
         the language detector
 
-    translator (TranslatorProtocol)
-        the translator
+    translators (TranslatorRegistry)
+        the registry of translator models
+
+    warming_up (set[str])
+        the models that are still warming up
     """
 
     language_detector: LanguageDetectorProtocol
-    translator: TranslatorProtocol
+    translators: TranslatorRegistry
+    warming_up: set[str]
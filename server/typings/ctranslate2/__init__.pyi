@@ -163,3 +163,5 @@ class Translator:
         replace_unknowns: bool = False,
         callback: Callable[[GenerationStepResult], bool] | None = None,
     ) -> Generator[TranslationResult]: ...
+
+def get_supported_compute_types(device: Devices, device_index: int = 0) -> set[ComputeTypes]: ...
@@ -42,6 +42,16 @@ async def client(auth_token: str) -> AsyncIterator[AsyncTestClient[Litestar]]:
         yield client
 
 
+@fixture
+async def stub_client(auth_token: str) -> AsyncIterator[AsyncTestClient[Litestar]]:
+    config = Config()
+    config.auth_token = auth_token
+    config.stub_translator = True
+
+    async with AsyncTestClient(app=app(config), backend_options={"use_uvloop": True}) as client:
+        yield client
+
+
 @fixture
 async def client_factory_without_lifespans() -> Callable[[Config], AsyncTestClient[Litestar]]:
     return lambda config: client_factory(config, no_lifespans=True)
@@ -0,0 +1,61 @@
+# ruff: noqa: S101
+
+from collections.abc import Sequence
+from time import sleep
+
+from server.features.translator.autotune import (
+    candidate_configurations,
+    rank_configurations,
+    thread_splits,
+)
+from server.features.translator.stub import TranslatorStub
+from server.typedefs import ComputeTypes, Language, Priority
+
+
+class TimedTranslatorStub(TranslatorStub):
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def translate_batch(
+        self,
+        translations: Sequence[tuple[str, Language, Language]],
+        *,
+        priority: Priority = "interactive",
+        client: str = "",
+        deadline: float | None = None,
+    ) -> list[str]:
+        sleep(self.latency)
+        return super().translate_batch(translations, priority=priority, client=client, deadline=deadline)
+
+
+def test_thread_splits() -> None:
+    assert list(thread_splits(6)) == [(1, 6), (2, 3), (3, 2), (6, 1)]
+
+
+def test_candidate_configurations() -> None:
+    assert list(candidate_configurations(4, {"float16", "int8", "float32"})) == [
+        ("int8", 1, 4),
+        ("int8", 2, 2),
+        ("int8", 4, 1),
+        ("float32", 1, 4),
+        ("float32", 2, 2),
+        ("float32", 4, 1),
+    ]
+
+
+def test_rank_configurations() -> None:
+    def factory(compute_type: ComputeTypes, inter_threads: int, _: int) -> TimedTranslatorStub:
+        return TimedTranslatorStub(0.002 * (4 if compute_type == "int16" else 1) * (4 / inter_threads) ** 2)
+
+    results = rank_configurations(
+        candidate_configurations(4, {"int8", "int16"}),
+        factory,
+        ["Hello world", "Good morning"],
+        "eng_Latn",
+        "spa_Latn",
+        rounds=2,
+    )
+
+    assert results[0][:3] == ("int8", 4, 1)
+    assert results[-1][:3] == ("int16", 1, 4)
+    assert [result[3] for result in results] == sorted((result[3] for result in results), reverse=True)
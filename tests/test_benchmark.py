@@ -0,0 +1,11 @@
+# ruff: noqa: S101
+
+from pathlib import Path
+
+from server.features.benchmark.detector import DEFAULT_DETECTOR_CORPUS
+
+
+def test_detector_corpus_matches_the_crate_benchmarks() -> None:
+    crate_corpus = Path(__file__).parents[1] / "language" / "benches" / "detector_corpus.tsv"
+
+    assert DEFAULT_DETECTOR_CORPUS.read_bytes() == crate_corpus.read_bytes()
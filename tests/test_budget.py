@@ -0,0 +1,48 @@
+# ruff: noqa: S101
+
+from pytest import mark
+
+from server.features.translator.budget import (
+    DEFAULT_LENGTH_RATIO,
+    DEGENERATE_WINDOW,
+    MAX_DECODING_LENGTH,
+    MIN_DECODING_LENGTH,
+    DecodingBudget,
+    is_degenerate,
+)
+
+
+@mark.parametrize(
+    ("token_ids", "token_count", "degenerate"),
+    [
+        ([1, 2, 3] * DEGENERATE_WINDOW, 8, True),
+        ([1, 2, 3] * DEGENERATE_WINDOW, 3 * DEGENERATE_WINDOW, False),
+        ([1, 2] * (DEGENERATE_WINDOW // 2), 8, False),
+        (list(range(2 * DEGENERATE_WINDOW)), 8, False),
+    ],
+    ids=["looping", "as long as its source", "within the window", "varied"],
+)
+def test_is_degenerate(token_ids: list[int], token_count: int, *, degenerate: bool) -> None:
+    assert is_degenerate(token_ids, token_count) is degenerate
+
+
+def test_decoding_budget_disabled() -> None:
+    assert DecodingBudget(0).limit(100, "eng_Latn", "spa_Latn") == MAX_DECODING_LENGTH
+
+
+def test_decoding_budget_limit() -> None:
+    budget = DecodingBudget(2)
+
+    assert budget.limit(10, "eng_Latn", "spa_Latn") == MIN_DECODING_LENGTH + 2 * DEFAULT_LENGTH_RATIO * 10
+    assert budget.limit(10_000, "eng_Latn", "spa_Latn") == MAX_DECODING_LENGTH
+
+
+def test_decoding_budget_observe() -> None:
+    budget = DecodingBudget(2)
+    limit = budget.limit(10, "eng_Latn", "spa_Latn")
+
+    for _ in range(100):
+        budget.observe(10, 30, "eng_Latn", "zho_Hans")
+
+    assert budget.limit(10, "eng_Latn", "spa_Latn") == limit
+    assert limit < budget.limit(10, "eng_Latn", "zho_Hans") <= MIN_DECODING_LENGTH + 2 * 3 * 10
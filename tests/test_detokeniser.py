@@ -0,0 +1,41 @@
+# ruff: noqa: S101
+
+from pytest import mark
+
+from server.features.translator.detokeniser import Detokeniser
+
+
+class ByteFallbackTokeniser:
+    def __init__(self, tokens: list[str]) -> None:
+        self.tokens = tokens
+
+    def decode(self, token_ids: list[int]) -> str:
+        text = b"".join(
+            bytes([int(token[3:5], 16)]) if token.startswith("<0x") else token.replace("▁", " ").encode()
+            for token in (self.tokens[token_id] for token_id in token_ids)
+        )
+
+        return text.decode(errors="replace").removeprefix(" ")
+
+
+@mark.parametrize(
+    ("tokens", "max_pending_tokens", "chunks"),
+    [
+        (["▁Hello", ",", "▁wor", "ld"], 16, ["", "", "Hello,", "", " world"]),
+        (["▁a", "<0xE4>", "<0xBD>", "<0xA0>", "▁b"], 2, ["", "", "", "", "a你", " b"]),
+        (["▁你", "好", "世", "界"], 16, ["", "你", "好", "世", "界"]),
+        (["▁a", *["b"] * 16], 16, [*[""] * 16, f"a{'b' * 15}", "b"]),
+    ],
+    ids=["word boundary", "partial multibyte character", "cjk run", "pending token cap"],
+)
+def test_detokeniser(tokens: list[str], max_pending_tokens: int, chunks: list[str]) -> None:
+    detokeniser = Detokeniser(
+        ByteFallbackTokeniser(tokens),  # pyright: ignore [reportArgumentType]
+        max_pending_tokens=max_pending_tokens,
+    )
+
+    assert [
+        *(detokeniser.step(token_id, token) for token_id, token in enumerate(tokens)),
+        detokeniser.flush(final=True),
+    ] == chunks
+    assert "".join(chunks) == ByteFallbackTokeniser(tokens).decode(list(range(len(tokens))))
@@ -0,0 +1,98 @@
+# ruff: noqa: S101
+
+from asyncio import CancelledError, create_task, sleep, to_thread, wait_for
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from multiprocessing import active_children
+from pathlib import Path
+from threading import Event, Thread
+
+from pytest import MonkeyPatch, fixture, raises
+
+from server.config import Config
+from server.engine import supervise
+from server.features.translator import (
+    EngineClient,
+    EngineUnavailableError,
+    RemoteTranslator,
+    TranslatorEngine,
+    get_translator_registry,
+)
+from server.features.translator.stub import TranslatorStub
+from server.typedefs.language import Language
+
+
+@fixture
+async def engine_socket(tmp_path: Path) -> AsyncIterator[str]:
+    path = f"{tmp_path / 'engine.sock'}"
+
+    with get_translator_registry(["stub"], lambda _: TranslatorStub(), max_bytes=0, stub=True) as translators:
+        engine = create_task(TranslatorEngine(translators).serve(path))
+
+        try:
+            yield path
+
+        finally:
+            engine.cancel()
+
+            with suppress(CancelledError):
+                await engine
+
+
+async def test_engine_round_trip(engine_socket: str) -> None:
+    stub = TranslatorStub()
+    translations: list[tuple[str, Language, Language]] = [
+        ("Hello world", "eng_Latn", "spa_Latn"),
+        ("Good morning", "eng_Latn", "zho_Hans"),
+    ]
+
+    async with EngineClient(engine_socket) as client:
+        translator = RemoteTranslator(client, "stub")
+
+        assert await translator.translate_async("Hello world", "eng_Latn", "spa_Latn") == stub.translate(
+            "Hello world", "eng_Latn", "spa_Latn"
+        )
+        assert await translator.translate_batch_async(translations) == stub.translate_batch(translations)
+        assert [
+            chunk async for chunk in translator.translate_stream_async("Hello world", "eng_Latn", "spa_Latn")
+        ] == list(stub.translate_stream("Hello world", "eng_Latn", "spa_Latn"))
+        assert await to_thread(translator.count_tokens, "Hello world") == stub.count_tokens("Hello world")
+        assert await to_thread(translator.queue_status) == stub.queue_status()
+
+
+async def test_engine_client_recovers_after_engine_restart(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    path = f"{tmp_path / 'engine.sock'}"
+    monkeypatch.setenv("TRANSLATOR_ENGINE_SOCKET", path)
+    monkeypatch.setenv("STUB_TRANSLATOR", "True")
+
+    stopped = Event()
+    supervisor = Thread(target=supervise, args=(stopped,), daemon=True)
+    supervisor.start()
+
+    try:
+        async with EngineClient(path) as client:
+            translator = RemoteTranslator(client, Config().translator_repository)
+            expected = TranslatorStub().translate("Hello world", "eng_Latn", "spa_Latn")
+
+            async def translate() -> str:
+                while True:
+                    with suppress(EngineUnavailableError):
+                        return await translator.translate_async("Hello world", "eng_Latn", "spa_Latn")
+
+                    await sleep(0.1)
+
+            assert await translate() == expected
+
+            [engine] = active_children()
+            engine.kill()
+            await to_thread(engine.join)
+
+            with raises(EngineUnavailableError):
+                await translator.translate_async("Hello world", "eng_Latn", "spa_Latn")
+
+            assert await wait_for(translate(), 60) == expected
+            assert [restarted.pid for restarted in active_children()] != [engine.pid]
+
+    finally:
+        stopped.set()
+        await to_thread(supervisor.join)
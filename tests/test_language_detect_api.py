@@ -1,5 +1,6 @@
 # ruff: noqa: S101
 
+from pathlib import Path
 
 from httpx import Response
 from litestar import Litestar
@@ -7,6 +8,9 @@ from litestar.status_codes import HTTP_400_BAD_REQUEST
 from litestar.testing import AsyncTestClient
 from pytest import mark
 
+from server.app import app
+from server.config import Config
+from server.stores import SQLiteCache
 from server.typedefs import Language
 
 
@@ -45,6 +49,17 @@ async def test_detect_language_api(session_client: AsyncTestClient[Litestar], te
     assert isinstance(get_confidence(response), float)
 
 
+async def test_detect_language_with_shared_cache(tmp_path: Path) -> None:
+    config = Config()
+    config.shared_cache_path = str(tmp_path / "cache.sqlite3")
+
+    async with AsyncTestClient(app=app(config), backend_options={"use_uvloop": True}) as client:
+        response = await detect_language(client, "She sells seashells")
+
+    assert get_language(response) == "eng_Latn"
+    assert len(SQLiteCache(config.shared_cache_path, max_bytes=config.shared_cache_bytes)) == 1
+
+
 async def test_detect_language_with_empty_text(session_client: AsyncTestClient[Litestar]) -> None:
     response = await detect_language(session_client, "")
     assert response.status_code == HTTP_400_BAD_REQUEST
@@ -169,3 +184,9 @@ async def test_detect_language_with_accurate_model(
     )
 
     assert get_language(response) == language
+
+
+async def test_server_timing(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await detect_language(session_client, "The latency of this detection is reported")
+
+    assert "detect;dur=" in response.headers["Server-Timing"]
@@ -0,0 +1,77 @@
+# ruff: noqa: S101
+
+from collections.abc import Callable, Sequence
+
+from server.features.translator.scheduler import Scheduler, TranslationJob
+from server.features.translator.simulator import SimulatedStep
+
+
+def create_job(*tokens: str) -> TranslationJob:
+    return TranslationJob(("eng_Latn", *tokens), ("spa_Latn",))
+
+
+def echo(batches: list[list[TranslationJob]]) -> Callable[[Sequence[TranslationJob]], None]:
+    def decode_batch(jobs: Sequence[TranslationJob]) -> None:
+        batches.append(list(jobs))
+
+        for batch_id, job in enumerate(jobs):
+            for step, token in enumerate(job.source[1:]):
+                job.push(SimulatedStep(batch_id, step, int(token), token, is_last=False))  # pyright: ignore [reportArgumentType]
+
+    return decode_batch
+
+
+def test_scheduler_coalesces_jobs_within_the_batch_window() -> None:
+    batches: list[list[TranslationJob]] = []
+
+    with Scheduler(echo(batches), workers=1, batch_window=0.2, max_batch_tokens=4096) as scheduler:
+        jobs = [scheduler.submit(create_job(str(index))) for index in range(3)]
+
+        for job in jobs:
+            job.result()
+
+    assert batches == [jobs]
+
+
+def test_scheduler_splits_batches_at_the_token_budget() -> None:
+    batches: list[list[TranslationJob]] = []
+
+    with Scheduler(echo(batches), workers=1, batch_window=0.2, max_batch_tokens=8) as scheduler:
+        jobs = [scheduler.submit(create_job("1", "2")) for _ in range(3)]
+
+        for job in jobs:
+            job.result()
+
+        assert scheduler.fits(jobs[:1], jobs[1])
+        assert not scheduler.fits(jobs[:2], jobs[2])
+
+    assert batches == [jobs[:2], jobs[2:]]
+
+
+def test_scheduler_routes_results_to_their_jobs() -> None:
+    batches: list[list[TranslationJob]] = []
+
+    with Scheduler(echo(batches), workers=2, batch_window=0.01, max_batch_tokens=4096) as scheduler:
+        jobs = scheduler.submit_many([create_job(*(str(index + offset) for offset in range(3))) for index in range(8)])
+
+        assert [job.result() for job in jobs] == [[index, index + 1, index + 2] for index in range(8)]
+
+    assert scheduler.status()[:2] == (0, 0)
+
+
+def test_scheduler_drops_cancelled_jobs() -> None:
+    batches: list[list[TranslationJob]] = []
+
+    with Scheduler(echo(batches), workers=1, batch_window=0, max_batch_tokens=4096) as scheduler:
+        with scheduler.paused():
+            cancelled, kept = scheduler.submit(create_job("1")), scheduler.submit(create_job("2"))
+            scheduler.cancel([cancelled])
+
+            assert cancelled.finished
+            assert cancelled.stop_reason == "cancelled"
+            assert scheduler.status()[:2] == (1, kept.token_count)
+
+        assert kept.result() == [2]
+        assert cancelled.result() == []
+
+    assert batches == [[kept]]
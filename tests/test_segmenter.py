@@ -0,0 +1,24 @@
+# ruff: noqa: S101
+
+from pytest import mark
+
+from server.features.translator.segmenter import join_sentences, split_sentences
+
+
+@mark.parametrize(
+    ("text", "sentences"),
+    [
+        ("Hello world. How are you?\nFine.", ["Hello world.", "How are you?", "Fine."]),
+        ('It ended. "Why?" She asked.', ["It ended.", '"Why?"', "She asked."]),
+        ("你好。世界！", ["你好。", "世界！"]),  # noqa: RUF001
+        ("Dr. Smith arrived. He sat down.", ["Dr. Smith arrived.", "He sat down."]),
+        ("Use a tool, e.g. Python. It works.", ["Use a tool, e.g. Python.", "It works."]),
+        ("She joined the U.S. Army. Then she left.", ["She joined the U.S. Army.", "Then she left."]),
+        ("J. R. R. Tolkien wrote it. Really!", ["J. R. R. Tolkien wrote it.", "Really!"]),
+    ],
+)
+def test_split_sentences(text: str, sentences: list[str]) -> None:
+    split, separators = split_sentences(text)
+
+    assert split == sentences
+    assert join_sentences(split, separators) == text
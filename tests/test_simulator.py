@@ -0,0 +1,80 @@
+# ruff: noqa: S101
+
+from time import perf_counter
+
+from server.features.translator.simulator import (
+    SIMULATED_END_TOKEN,
+    SIMULATED_RUNAWAY_CYCLE,
+    SimulatedCTranslator,
+    SimulatedStep,
+    SimulatedTokeniser,
+)
+
+
+def collect_steps(
+    model: SimulatedCTranslator,
+    words: list[str],
+    max_decoding_length: int,
+    *,
+    stop_after: int = 0,
+) -> list[SimulatedStep]:
+    steps: list[SimulatedStep] = []
+
+    def callback(step: SimulatedStep) -> bool:
+        steps.append(step)
+        return len(steps) == stop_after
+
+    model.translate_batch(
+        [["eng_Latn", *words]], [["spa_Latn"]], max_decoding_length=max_decoding_length, callback=callback
+    )
+    return steps
+
+
+def test_tokeniser_latency_scales_with_tokens() -> None:
+    latency = 0.01
+    tokeniser = SimulatedTokeniser(latency)
+    elapsed: list[float] = []
+
+    for words in (2, 8):
+        text = " ".join(f"word{index}" for index in range(words))
+        start = perf_counter()
+        encoding = tokeniser.encode(text)
+        elapsed.append(perf_counter() - start)
+
+        assert len(encoding) == words
+        assert elapsed[-1] >= latency * words
+        assert tokeniser.decode([tokeniser.token_to_id(token) for token in encoding.tokens]) == text
+
+    assert elapsed[0] < elapsed[1]
+
+
+def test_translator_latency_scales_with_steps() -> None:
+    step_latency = 0.01
+    tokeniser = SimulatedTokeniser(0)
+    model = SimulatedCTranslator(tokeniser, inter_threads=1, intra_threads=1, step_latency=step_latency, runaway_rate=0)
+
+    start = perf_counter()
+    steps = collect_steps(model, ["▁Hello", "▁world"], 256)
+    elapsed = perf_counter() - start
+
+    assert steps[-1].is_last
+    assert steps[-1].token == SIMULATED_END_TOKEN
+    assert [step.token for step in steps[:2]] == ["▁Hello", "▁world"]
+    assert elapsed >= step_latency * len(steps)
+    assert not model.active
+
+
+def test_translator_runaway_generation() -> None:
+    max_decoding_length = 32
+    tokeniser = SimulatedTokeniser(0)
+    model = SimulatedCTranslator(tokeniser, inter_threads=1, intra_threads=1, step_latency=0, runaway_rate=1)
+    words = ["▁a", "▁b", "▁c", "▁d"]
+
+    steps = collect_steps(model, words, max_decoding_length)
+
+    assert len(steps) == max_decoding_length
+    assert SIMULATED_END_TOKEN not in [step.token for step in steps]
+    assert [step.token for step in steps[: SIMULATED_RUNAWAY_CYCLE * 2]] == words[:SIMULATED_RUNAWAY_CYCLE] * 2
+    assert len(collect_steps(model, words, max_decoding_length, stop_after=SIMULATED_RUNAWAY_CYCLE)) == (
+        SIMULATED_RUNAWAY_CYCLE
+    )
@@ -0,0 +1,74 @@
+# ruff: noqa: S101
+
+from importlib import import_module
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import HistogramDataPoint, InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import INVALID_SPAN, Tracer
+from pytest import MonkeyPatch, fixture
+
+from server.telemetry import stage
+
+
+@fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@fixture
+def tracer(exporter: InMemorySpanExporter, monkeypatch: MonkeyPatch) -> Tracer:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer(__name__)
+    monkeypatch.setattr(import_module("server.telemetry.stage"), "tracer", tracer)
+
+    return tracer
+
+
+def test_stage_span_within_sampled_request(tracer: Tracer, exporter: InMemorySpanExporter) -> None:
+    with tracer.start_as_current_span("request") as request, stage("translator.decode", attributes={"batch": 2}):
+        pass
+
+    decode, _ = exporter.get_finished_spans()
+
+    assert decode.name == "translator.decode"
+    assert decode.attributes == {"batch": 2}
+    assert decode.parent is not None
+    assert decode.parent.span_id == request.get_span_context().span_id
+
+
+def test_stage_span_linked_to_sampled_request(tracer: Tracer, exporter: InMemorySpanExporter) -> None:
+    with tracer.start_as_current_span("request") as request:
+        context = request.get_span_context()
+
+    with stage("translator.decode", links=[context]):
+        pass
+
+    _, decode = exporter.get_finished_spans()
+
+    assert decode.parent is None
+    assert [link.context.span_id for link in decode.links] == [context.span_id]
+
+
+def test_stage_skips_span_without_tracing(tracer: Tracer, exporter: InMemorySpanExporter) -> None:  # noqa: ARG001
+    reader = InMemoryMetricReader()
+    histogram = MeterProvider(metric_readers=[reader]).get_meter(__name__).create_histogram("translator.decode")
+
+    with stage("translator.decode", histogram) as span:
+        assert span is INVALID_SPAN
+
+    metrics = reader.get_metrics_data()
+
+    assert not exporter.get_finished_spans()
+    assert metrics is not None
+    assert [
+        point.count
+        for resource in metrics.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+        for point in metric.data.data_points
+        if isinstance(point, HistogramDataPoint)
+    ] == [1]
@@ -1,7 +1,7 @@
 # ruff: noqa: S101
 
-from asyncio import TaskGroup
-from collections.abc import Awaitable, Callable
+from asyncio import TaskGroup, sleep
+from collections.abc import Awaitable, Callable, Sequence
 
 from httpx import Response
 from hypothesis import given
@@ -13,10 +13,15 @@ from litestar.status_codes import (
     HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 from litestar.testing import AsyncTestClient
-from pytest import mark
+from pytest import MonkeyPatch, mark
 
+from server.app import app
+from server.config import Config
+from server.features.translator.scheduler import Scheduler, TranslationJob
 from server.typedefs.language import Language
 
 
@@ -32,6 +37,10 @@ async def translate_stream(client: AsyncTestClient[Litestar], text: str, source:
     return await client.get("/v4/translator/stream", params={"text": text, "source": source, "target": target})
 
 
+async def translate_batch(client: AsyncTestClient[Litestar], translations: list[dict[str, str]]) -> Response:
+    return await client.post("/v4/translator/batch", json=translations)
+
+
 async def count_tokens(client: AsyncTestClient[Litestar], text: str) -> Response:
     return await client.get("/v4/translator/tokens", params={"text": text})
 
@@ -70,6 +79,57 @@ async def test_token_count_empty_input(session_client: AsyncTestClient[Litestar]
     assert response.status_code == HTTP_400_BAD_REQUEST
 
 
+async def test_translator_queue(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await session_client.get("/v4/translator/queue")
+    queue = response.json()
+
+    assert response.status_code == HTTP_200_OK
+    assert isinstance(queue.get("pending_jobs"), int)
+    assert isinstance(queue.get("pending_tokens"), int)
+    assert isinstance(queue.get("estimated_wait"), float)
+    assert isinstance(queue.get("throughput"), float)
+
+
+async def test_metrics(session_client: AsyncTestClient[Litestar], auth_token: str) -> None:
+    response = await session_client.get("/metrics")
+    assert response.status_code == HTTP_404_NOT_FOUND
+
+    config = Config()
+    config.auth_token = auth_token
+    config.prometheus_metrics = True
+
+    async with AsyncTestClient(app=app(config), backend_options={"use_uvloop": True}) as client:
+        await translate_get(client, "Hello, world!", "eng_Latn", "spa_Latn")
+        response = await client.get("/metrics")
+
+    assert response.status_code == HTTP_200_OK
+    assert "translator_cache_lookups" in response.text
+
+
+async def test_translate_routes_with_stub(stub_client: AsyncTestClient[Litestar]) -> None:
+    translation = "Hello, world! from eng_Latn to spa_Latn"
+
+    for translate in (translate_get, translate_post):
+        response = await translate(stub_client, "Hello, world!", "eng_Latn", "spa_Latn")
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {"result": translation}
+
+    response = await translate_batch(
+        stub_client,
+        [
+            {"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn"},
+            {"text": "Goodbye", "source": "eng_Latn", "target": "zho_Hans"},
+        ],
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == [{"result": translation}, {"result": "Goodbye from eng_Latn to zho_Hans"}]
+
+    response = await translate_stream(stub_client, "Hello, world!", "eng_Latn", "spa_Latn")
+    events = [line.removeprefix("data: ") for line in response.text.splitlines() if line.startswith("data: ")]
+    assert response.status_code == HTTP_200_OK
+    assert events == ["Hello, from eng_Latn to spa_Latn", "world! from eng_Latn to spa_Latn"]
+
+
 async def test_model_loading(client: AsyncTestClient[Litestar], auth_token: str) -> None:
     response = await load_model(client, auth_token=auth_token, keep_cache=False)
     assert response.status_code == HTTP_304_NOT_MODIFIED
@@ -85,6 +145,28 @@ async def test_model_loading(client: AsyncTestClient[Litestar], auth_token: str)
     assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
+async def test_readiness(client: AsyncTestClient[Litestar], auth_token: str) -> None:
+    while (response := await client.get("/ready")).json()["warming_up"]:  # noqa: ASYNC110
+        await sleep(0.1)
+
+    assert response.status_code == HTTP_200_OK
+    await unload_model(client, auth_token=auth_token, to_cpu=False)
+    response = await client.get("/ready")
+    assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+    await load_model(client, auth_token=auth_token, keep_cache=False)
+    response = await client.get("/ready")
+    assert response.status_code == HTTP_200_OK
+
+
+async def test_unloaded_model_rejects_translations(client: AsyncTestClient[Litestar], auth_token: str) -> None:
+    await unload_model(client, auth_token=auth_token, to_cpu=False)
+    response = await translate_get(client, "Good evening!", "eng_Latn", "spa_Latn")
+    assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+    await load_model(client, auth_token=auth_token, keep_cache=False)
+    response = await translate_get(client, "Good evening!", "eng_Latn", "spa_Latn")
+    assert response.status_code == HTTP_200_OK
+
+
 @mark.parametrize("translate", [translate_post, translate_get])
 @mark.parametrize(
     ("text", "source", "target", "translation"),
@@ -110,11 +192,98 @@ async def test_translate_api(
     assert response.json().get("result") in translation
 
 
+async def test_translate_segmented_result(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await session_client.get(
+        "/v4/translator",
+        params={"text": "Hello, world!\n\nHello, world!", "source": "eng_Latn", "target": "spa_Latn", "segment": True},
+    )
+
+    assert response.json().get("result") == "¡Hola, mundo!\n\n¡Hola, mundo!"
+
+
+async def test_translate_batch_api(session_client: AsyncTestClient[Litestar]) -> None:
+    translations = [
+        {"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn"},
+        {"text": "我是一名软件工程师！", "source": "zho_Hans", "target": "spa_Latn"},  # noqa: RUF001
+        {"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn"},
+    ]
+
+    response = await translate_batch(session_client, translations)
+    results = [translated["result"] for translated in response.json()]
+
+    assert response.status_code == HTTP_200_OK
+    assert results[0] == results[2] == "¡Hola, mundo!"
+    assert results[1] in {"¡Soy un ingeniero de software!", "¡Soy ingeniero de software!"}
+
+
+@mark.parametrize("priority", ["interactive", "bulk"])
+async def test_translate_with_priority(session_client: AsyncTestClient[Litestar], priority: str) -> None:
+    response = await session_client.get(
+        "/v4/translator",
+        params={"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn", "priority": priority},
+        headers={"X-Client-ID": "test"},
+    )
+
+    assert response.json().get("result") == "¡Hola, mundo!"
+
+
+async def test_translate_with_invalid_priority(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await session_client.post(
+        "/v4/translator/batch",
+        params={"priority": "urgent"},
+        json=[{"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn"}],
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+async def test_translate_with_unknown_model(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await session_client.get(
+        "/v4/translator",
+        params={"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn", "model": "unknown/model"},
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+async def test_translate_with_request_timeout(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await session_client.get(
+        "/v4/translator",
+        params={"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn"},
+        headers={"X-Request-Timeout": "30"},
+    )
+
+    assert response.json().get("result") == "¡Hola, mundo!"
+
+
+async def test_translate_with_invalid_request_timeout(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await session_client.get(
+        "/v4/translator",
+        params={"text": "Hello, world!", "source": "eng_Latn", "target": "spa_Latn"},
+        headers={"X-Request-Timeout": "0"},
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+async def test_translate_batch_with_empty_list(session_client: AsyncTestClient[Litestar]) -> None:
+    response = await translate_batch(session_client, [])
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
 async def test_translate_stream_api(session_client: AsyncTestClient[Litestar]) -> None:
     response = await translate_stream(session_client, "Hello, world!", "eng_Latn", "spa_Latn")
     assert response.headers["Content-Type"] == "text/event-stream; charset=utf-8"
 
 
+async def test_translate_stream_replays_cached_translation(session_client: AsyncTestClient[Litestar]) -> None:
+    translation = (await translate_post(session_client, "Good morning, world!", "eng_Latn", "spa_Latn")).json()
+    response = await translate_stream(session_client, "Good  morning, world!", "eng_Latn", "spa_Latn")
+    events = [line.removeprefix("data: ") for line in response.text.splitlines() if line.startswith("data: ")]
+
+    assert "".join(events) == translation["result"]
+
+
 @mark.parametrize("translate", [translate_post, translate_get, translate_stream])
 @mark.parametrize(
     ("text", "source", "target"),
@@ -139,3 +308,40 @@ async def test_parallelism(session_client: AsyncTestClient[Litestar]) -> None:
         ]
 
     assert all(task.result().status_code == HTTP_200_OK for task in tasks)
+
+
+async def test_concurrent_identical_translations(
+    session_client: AsyncTestClient[Litestar],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    text = "Good evening, world!"
+    submitted: list[TranslationJob] = []
+    submit_many = Scheduler.submit_many
+
+    while (await session_client.get("/ready")).json()["warming_up"]:  # noqa: ASYNC110
+        await sleep(0.1)
+
+    def record_submissions(scheduler: Scheduler, jobs: Sequence[TranslationJob]) -> Sequence[TranslationJob]:
+        submitted.extend(jobs)
+        return submit_many(scheduler, jobs)
+
+    monkeypatch.setattr(Scheduler, "submit_many", record_submissions)
+
+    async with TaskGroup() as task_group:
+        translations = [
+            task_group.create_task(translate(session_client, text, "eng_Latn", "spa_Latn"))
+            for translate in (translate_post, translate_get) * 3
+        ]
+        streams = [
+            task_group.create_task(translate_stream(session_client, text, "eng_Latn", "spa_Latn")) for _ in range(3)
+        ]
+
+    results = {task.result().json()["result"] for task in translations}
+    streamed_results = {
+        "".join(line.removeprefix("data: ") for line in task.result().text.splitlines() if line.startswith("data: "))
+        for task in streams
+    }
+
+    assert len(results) == 1
+    assert streamed_results == results
+    assert len(submitted) == 1
@@ -0,0 +1,132 @@
+# ruff: noqa: S101
+
+from asyncio import CancelledError, create_task, sleep, wait_for
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from threading import get_ident
+from time import monotonic
+
+from pytest import raises
+
+from server.features.translator import DeadlineExceededError, ModelUnloadedError
+from server.features.translator.cache import TranslationCache
+from server.features.translator.nllb import Translator
+from server.features.translator.simulator import SimulatedCTranslator, SimulatedEncoding, SimulatedTokeniser
+
+
+class ThreadRecordingTokeniser(SimulatedTokeniser):
+    def __init__(self, threads: set[int]) -> None:
+        super().__init__(0)
+        self.threads = threads
+
+    def encode(self, sequence: str) -> SimulatedEncoding:
+        self.threads.add(get_ident())
+        return super().encode(sequence)
+
+    def decode(self, ids: Sequence[int]) -> str:
+        self.threads.add(get_ident())
+        return super().decode(ids)
+
+
+class ThreadRecordingCache(TranslationCache):
+    def __init__(self, threads: set[int]) -> None:
+        super().__init__(1 << 20)
+        self.threads = threads
+
+    def get(self, key: str) -> str | None:
+        self.threads.add(get_ident())
+        return super().get(key)
+
+
+def simulated_translator(
+    *,
+    step_latency: float = 0.0,
+    runaway_rate: float = 0.0,
+    batch_window: float = 0.0,
+    idle_timeout: float = 0.0,
+    tokeniser: SimulatedTokeniser | None = None,
+    cache: TranslationCache | None = None,
+) -> tuple[Translator, SimulatedCTranslator]:
+    tokeniser = tokeniser or SimulatedTokeniser(0)
+    model = SimulatedCTranslator(
+        tokeniser,
+        inter_threads=1,
+        intra_threads=1,
+        step_latency=step_latency,
+        runaway_rate=runaway_rate,
+    )
+    translator = Translator(
+        model,  # pyright: ignore [reportArgumentType]
+        tokeniser,  # pyright: ignore [reportArgumentType]
+        cache or TranslationCache(0),
+        use_cuda=False,
+        workers=1,
+        batch_window=batch_window,
+        max_batch_tokens=4096,
+        max_pending_tokens=0,
+        idle_timeout=idle_timeout,
+    )
+
+    return translator, model
+
+
+async def wait_until(predicate: Callable[[], bool]) -> None:
+    while not predicate():  # noqa: ASYNC110
+        await sleep(0.01)
+
+
+async def test_abandoned_translations_stop_decoding() -> None:
+    translator, model = simulated_translator(step_latency=0.05, runaway_rate=1)
+
+    with translator:
+        with raises(DeadlineExceededError):
+            await translator.translate_async("Hello world", "eng_Latn", "spa_Latn", deadline=monotonic() + 0.1)
+
+        await wait_for(wait_until(lambda: not model.active), 0.5)
+
+        task = create_task(translator.translate_async("Good morning", "eng_Latn", "spa_Latn"))
+        await wait_for(wait_until(lambda: bool(model.active)), 0.5)
+        task.cancel()
+
+        with suppress(CancelledError):
+            await task
+
+        assert task.cancelled()
+        await wait_for(wait_until(lambda: not model.active), 0.5)
+
+
+async def test_idle_model_is_loaded_back() -> None:
+    translator, model = simulated_translator(idle_timeout=0.05)
+
+    with translator:
+        assert await translator.translate_async("Hello world", "eng_Latn", "spa_Latn")
+        await wait_for(wait_until(lambda: not model.model_is_loaded), 1)
+
+        assert await translator.translate_async("Good morning", "eng_Latn", "spa_Latn")
+        assert model.model_is_loaded
+
+
+async def test_unloaded_model_rejects_translations() -> None:
+    translator, _ = simulated_translator()
+
+    with translator:
+        translator.unload_model(to_cpu=False)
+
+        with raises(ModelUnloadedError):
+            await translator.translate_async("Hello world", "eng_Latn", "spa_Latn")
+
+
+async def test_tokenisation_and_cache_lookups_stay_off_the_event_loop() -> None:
+    threads: set[int] = set()
+    translator, _ = simulated_translator(
+        tokeniser=ThreadRecordingTokeniser(threads), cache=ThreadRecordingCache(threads)
+    )
+
+    with translator:
+        for _ in range(2):
+            assert await translator.translate_async("Hello world", "eng_Latn", "spa_Latn")
+            assert [text async for text in translator.translate_stream_async("Good morning", "eng_Latn", "spa_Latn")]
+            assert await translator.translate_batch_async([("Good evening", "eng_Latn", "spa_Latn")])
+
+    assert threads
+    assert get_ident() not in threads
@@ -0,0 +1,24 @@
+# ruff: noqa: S101
+
+from asyncio import sleep
+
+from litestar import Litestar
+
+from server.lifespans.warm_up import warming_up
+from server.typedefs import AppState
+
+
+def fail() -> None:
+    raise RuntimeError
+
+
+async def test_failed_warm_up_is_ready() -> None:
+    app = Litestar(state=AppState({"warming_up": set()}))
+
+    async with warming_up(app, "translator", fail):
+        assert app.state.warming_up == {"translator"}
+
+        while app.state.warming_up:  # noqa: ASYNC110
+            await sleep(0.01)
+
+    assert not app.state.warming_up